@@ -0,0 +1,84 @@
+# Import required modules
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import subprocess
+ROOT_PATH = "/".join([i for i in os.path.dirname(os.path.abspath(__file__)).split("/")[:-2]])
+sys.path.append(ROOT_PATH)
+os.environ["PYTHONPATH"] = ROOT_PATH
+
+
+TARGET_MODULE = "src.post_extraction_tasks.clean_and_export"
+
+
+def measure_import(module = TARGET_MODULE, root_path = ROOT_PATH):
+    '''
+        Imports a module in a fresh interpreter under `python -X importtime`.
+        INPUT:
+            - module (str): dotted module name.
+            - root_path (str): repository root to import from.
+        OUTPUT:
+            - timings (dict[str, tuple[int, int]]): imported module -> (self, cumulative) microseconds.
+    '''
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd = root_path,
+        env = {**os.environ, "PYTHONPATH": root_path},
+        capture_output = True,
+        text = True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n" + "\n".join(result.stderr.splitlines()[-5:]))
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return(timings)
+
+
+def best_of(module, root_path, repeats):
+    '''
+        The run (of `repeats`) with the fastest import of the module, to keep disk cache warm-up out of the comparison.
+    '''
+    runs = [measure_import(module, root_path) for _ in range(repeats)]
+    return(min(runs, key = lambda timings: timings[module][1]))
+
+
+def measure_ref(ref, module, repeats):
+    '''
+        Import timings at another git revision (e.g. the commit before the lazy scraper registry), checked out in a temporary worktree.
+    '''
+    worktree = tempfile.mkdtemp(prefix = "import_benchmark_")
+    subprocess.run(["git", "worktree", "add", "--detach", worktree, ref], cwd = ROOT_PATH, check = True, capture_output = True)
+    try:
+        return(best_of(module, worktree, repeats))
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", worktree], cwd = ROOT_PATH, capture_output = True)
+        shutil.rmtree(worktree, ignore_errors = True)
+
+
+def print_timings(label, timings, module, top):
+    print(f"{label}: {module} imports in {timings[module][1] / 1000:.1f}ms ({len(timings)} modules).")
+    print(f"    {'Module':<60}{'Self ms':>10}{'Total ms':>10}")
+    for name, (self_us, cumulative_us) in sorted(timings.items(), key = lambda item: -item[1][0])[:top]:
+        print(f"    {name:<60}{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Measure the pipeline's import time with python -X importtime.")
+    parser.add_argument("--module", default = TARGET_MODULE, help = "Module to import.")
+    parser.add_argument("--compare", metavar = "REF", help = "Git revision to compare against, e.g. the commit before a change.")
+    parser.add_argument("--repeats", type = int, default = 5, help = "Imports per revision (the fastest is reported).")
+    parser.add_argument("--top", type = int, default = 15, help = "Slowest modules (by self time) to list.")
+    args = parser.parse_args()
+    current = best_of(args.module, ROOT_PATH, args.repeats)
+    print_timings("Working tree", current, args.module, args.top)
+    if args.compare:
+        previous = measure_ref(args.compare, args.module, args.repeats)
+        print_timings(args.compare, previous, args.module, args.top)
+        before, after = previous[args.module][1], current[args.module][1]
+        print(f"Import time {before / 1000:.1f}ms -> {after / 1000:.1f}ms ({after / before - 1:+.0%}), {len(previous)} -> {len(current)} modules.")
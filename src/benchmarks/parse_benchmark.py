@@ -0,0 +1,169 @@
+# Import required modules
+import os
+import sys
+import json
+import time
+import argparse
+import importlib
+import statistics
+ROOT_PATH = "/".join([i for i in os.path.dirname(os.path.abspath(__file__)).split("/")[:-2]])
+sys.path.append(ROOT_PATH)
+os.environ["PYTHONPATH"] = ROOT_PATH
+from pathlib import Path
+from bs4 import BeautifulSoup
+from src.config import HTTP_CACHE_PATH, SNAPSHOTS_PATH
+from src.utlilties.state_store import read_state
+from src.utlilties.snapshots import HTTP, BROWSER
+from src.utlilties.venue_specs import VenueSpec, select_cards, extract_rows
+
+
+EVENT_EXTRACTION_PATH = Path(ROOT_PATH) / "src/event_extraction"
+FIXTURES_PATH = Path(ROOT_PATH) / "src/benchmarks/fixtures"
+FIELDS = ["title", "date", "link", "image"]
+
+
+def load_specs():
+    '''
+        Every VenueSpec defined in src/event_extraction (a module-level spec, or a list of them), with its module name.
+        Hand-written scrapers have no spec to compare; their parse stage is timed by scraper_benchmark instead.
+        OUTPUT:
+            - specs (list[tuple[str, VenueSpec]]): (module name, spec).
+    '''
+    specs = []
+    for module_path in sorted(EVENT_EXTRACTION_PATH.glob("*.py")):
+        if module_path.stem == "__init__":
+            continue
+        module = importlib.import_module(f"src.event_extraction.{module_path.stem}")
+        for value in vars(module).values():
+            if isinstance(value, VenueSpec):
+                specs.append((module_path.stem, value))
+            elif isinstance(value, list) and value and all(isinstance(item, VenueSpec) for item in value):
+                specs += [(module_path.stem, item) for item in value]
+    return(specs)
+
+
+def cached_pages(path = HTTP_CACHE_PATH):
+    '''
+        Pages saved by the HTTP cache. OUTPUT: URL -> HTML.
+    '''
+    pages = {}
+    for meta_path in sorted(Path(path).glob("*.json")):
+        with open(meta_path, "r") as f:
+            url = json.load(f).get("url")
+        body_path = meta_path.with_suffix(".html")
+        if url and body_path.exists():
+            pages[url] = body_path.read_text(encoding = "utf-8")
+    return(pages)
+
+
+def snapshot_pages(path):
+    '''
+        First read of each page in a snapshot directory or benchmark fixtures (both HTTP and Chrome-rendered pages, so Selenium-only venues are included).
+        Later snapshots of the same URL replace earlier ones. OUTPUT: URL -> HTML.
+    '''
+    pages = {}
+    for index_path in sorted(Path(path).glob("**/index.json")):
+        for file_name, url in read_state(index_path).items():
+            if file_name.split("-")[0] in [HTTP, BROWSER] and file_name.endswith("-000.html") and (index_path.parent / file_name).exists():
+                pages[url] = (index_path.parent / file_name).read_text(encoding = "utf-8")
+    return(pages)
+
+
+def recorded_pages(specs, cache_path = HTTP_CACHE_PATH, snapshot_paths = (SNAPSHOTS_PATH, FIXTURES_PATH)):
+    '''
+        Recorded pages (HTTP cache, then snapshots and fixtures), matched to the spec whose gig guide they belong to.
+        OUTPUT:
+            - pages (list[tuple[str, VenueSpec, str]]): (module name, spec, HTML) for each recorded page.
+    '''
+    urls = {}
+    for name, spec in specs:
+        for url in (spec.urls or []) + ([spec.paged.url(1)] if spec.paged else []):
+            urls[url] = (name, spec)
+    sources = cached_pages(cache_path)
+    for path in snapshot_paths:
+        sources.update(snapshot_pages(path))
+    pages = []
+    for url, page_source in sources.items():
+        if url in urls:
+            name, spec = urls[url]
+            pages.append((name, spec, page_source))
+    return(sorted(pages, key = lambda page: page[0]))
+
+
+def parse_with_beautifulsoup(spec, page_source):
+    '''
+        The previous path: the whole document built into a BeautifulSoup tree, then each field looked up with select_one.
+    '''
+    soup = BeautifulSoup(page_source, features = "lxml")
+    rows = []
+    for card in soup.select(spec.card):
+        row = {}
+        for name in FIELDS:
+            field = getattr(spec, name)
+            element = card.select_one(field.selector) if field.selector else card
+            row[name] = None if element is None else (element.get(field.attribute) if field.attribute else element.text)
+        rows.append(row)
+    return(rows)
+
+
+def parse_with_compiled_selectors(spec, page_source):
+    '''
+        The current path (see html_parser): lxml tree, precompiled selectors, one pass over the cards.
+    '''
+    return(extract_rows(spec, select_cards(spec, page_source)))
+
+
+def time_parser(parser, spec, page_source, repeats):
+    '''
+        Median wall-clock time of one parse, in milliseconds.
+    '''
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parser(spec, page_source)
+        timings.append((time.perf_counter() - start) * 1000)
+    return(statistics.median(timings))
+
+
+def run_benchmark(pages, repeats = 20):
+    '''
+        Times both parsing paths on each recorded page and prints a comparison table.
+        INPUT:
+            - pages (list[tuple[str, VenueSpec, str]]): (module name, spec, HTML), see recorded_pages.
+            - repeats (int): parses per page and path; the median is reported.
+        OUTPUT:
+            - results (list[dict]): module, venue, page size, card count and the timings for each page.
+    '''
+    results = []
+    print(f"{'Venue':<24}{'KB':>8}{'Cards':>8}{'BS4 ms':>10}{'lxml ms':>10}{'Speed-up':>10}")
+    for name, spec, page_source in pages:
+        soup_ms = time_parser(parse_with_beautifulsoup, spec, page_source, repeats)
+        compiled_ms = time_parser(parse_with_compiled_selectors, spec, page_source, repeats)
+        cards = len(select_cards(spec, page_source))
+        results.append({
+            "module": name,
+            "venue": spec.venue,
+            "kb": len(page_source) / 1024,
+            "cards": cards,
+            "beautifulsoup_ms": soup_ms,
+            "compiled_ms": compiled_ms
+        })
+        print(f"{spec.venue[:23]:<24}{len(page_source) / 1024:>8.0f}{cards:>8}{soup_ms:>10.2f}{compiled_ms:>10.2f}{soup_ms / max(compiled_ms, 1e-6):>9.1f}x")
+    if results:
+        total_soup = sum(result["beautifulsoup_ms"] for result in results)
+        total_compiled = sum(result["compiled_ms"] for result in results)
+        print(f"{'Total':<40}{total_soup:>10.2f}{total_compiled:>10.2f}{total_soup / max(total_compiled, 1e-6):>9.1f}x")
+    return(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Compare BeautifulSoup and compiled-selector parsing on recorded gig guide pages.")
+    parser.add_argument("--repeats", type = int, default = 20, help = "Parses per page and path (the median is reported).")
+    parser.add_argument("--cache-path", default = str(HTTP_CACHE_PATH), help = "HTTP cache directory to read recorded pages from.")
+    parser.add_argument("--snapshots", nargs = "*", default = [str(SNAPSHOTS_PATH), str(FIXTURES_PATH)], help = "Snapshot or fixture directories to read recorded pages from (--record runs, scraper_benchmark fixtures).")
+    args = parser.parse_args()
+    pages = recorded_pages(load_specs(), cache_path = args.cache_path, snapshot_paths = args.snapshots)
+    if not pages:
+        print(f"No recorded pages for spec-driven venues in {args.cache_path} or {', '.join(args.snapshots)}. Run the scrapers once with --record to record them.")
+        sys.exit(1)
+    run_benchmark(pages, repeats = args.repeats)
@@ -0,0 +1,224 @@
+# Import required modules
+import os
+import sys
+import json
+import time
+import inspect
+import argparse
+import importlib
+import statistics
+ROOT_PATH = "/".join([i for i in os.path.dirname(os.path.abspath(__file__)).split("/")[:-2]])
+sys.path.append(ROOT_PATH)
+os.environ["PYTHONPATH"] = ROOT_PATH
+from pathlib import Path
+from datetime import datetime
+from src.config import BENCHMARK_TIME_THRESHOLD, BENCHMARK_ROWS_THRESHOLD, BENCHMARK_REPEATS
+from src.utlilties import venue_specs
+from src.utlilties.event_records import EventBuilder
+from src.utlilties.snapshots import RECORD, REPLAY, configure_snapshots, set_namespace
+from src.utlilties.webdriver_pool import driver_pool
+
+
+BENCHMARKS_PATH = Path(ROOT_PATH) / "src/benchmarks"
+FIXTURES_PATH = BENCHMARKS_PATH / "fixtures"
+RESULTS_PATH = BENCHMARKS_PATH / "results"
+EVENT_EXTRACTION_PATH = Path(ROOT_PATH) / "src/event_extraction"
+STAGES = ["parse", "date_parse", "build"]
+
+
+def load_scrapers(names = None):
+    '''
+        The get_events_* function defined in each module of src/event_extraction, keyed by module name.
+        INPUT:
+            - names (list[str]): optional subset of module names.
+        OUTPUT:
+            - scrapers (dict[str, tuple[module, callable]]): module name -> (module, scraper).
+    '''
+    scrapers = {}
+    for module_path in sorted(EVENT_EXTRACTION_PATH.glob("*.py")):
+        if module_path.stem == "__init__" or (names and module_path.stem not in names):
+            continue
+        module = importlib.import_module(f"src.event_extraction.{module_path.stem}")
+        for name, function in vars(module).items():
+            if name.startswith("get_events") and inspect.isfunction(function) and function.__module__ == module.__name__:
+                scrapers[module_path.stem] = (module, function)
+                break
+    return(scrapers)
+
+
+class StageTimer:
+    '''
+        Accumulates wall-clock time per pipeline stage, by wrapping the functions that make up each stage.
+        * date_parse: the module's dateparser_* functions and venue_specs.parse_event_dates.
+        * build: EventBuilder.to_frame (turning the collected records into a DataFrame).
+        * parse: everything else the scraper does on the replayed pages (HTML parsing and field extraction).
+    '''
+
+    def __init__(self):
+        self.seconds = {stage: 0.0 for stage in STAGES}
+        self._patched = []
+
+    def _wrap(self, owner, name, stage):
+        function = getattr(owner, name)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return(function(*args, **kwargs))
+            finally:
+                self.seconds[stage] += time.perf_counter() - started
+        setattr(owner, name, timed)
+        self._patched.append((owner, name, function))
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *exc_info):
+        for owner, name, function in reversed(self._patched):
+            setattr(owner, name, function)
+
+    def instrument(self, module):
+        for name in [name for name in vars(module) if name.startswith("dateparser") and callable(getattr(module, name))]:
+            self._wrap(module, name, "date_parse")
+        self._wrap(venue_specs, "parse_event_dates", "date_parse")
+        self._wrap(EventBuilder, "to_frame", "build")
+
+
+def run_scraper(module, scraper):
+    '''
+        Runs one scraper against its fixtures, timing each stage.
+        OUTPUT:
+            - result (dict): rows returned, and seconds for the whole run and for each stage.
+    '''
+    with StageTimer() as timer:
+        timer.instrument(module)
+        started = time.perf_counter()
+        df = scraper()
+        total = time.perf_counter() - started
+    timer.seconds["parse"] = max(total - timer.seconds["date_parse"] - timer.seconds["build"], 0)
+    return({
+        "rows": int(len(df)) if df is not None else 0,
+        "total_seconds": total,
+        **{f"{stage}_seconds": seconds for stage, seconds in timer.seconds.items()}
+    })
+
+
+def record_fixtures(scrapers, fixtures_path = FIXTURES_PATH):
+    '''
+        Runs each scraper live once, saving the pages it reads (and any API calls) as its fixtures.
+    '''
+    configure_snapshots(RECORD, directory = fixtures_path)
+    for name, (module, scraper) in scrapers.items():
+        print(f"Recording fixtures for {name}...")
+        set_namespace(name)
+        scraper()
+    driver_pool.shutdown()
+
+
+def run_benchmark(scrapers, fixtures_path = FIXTURES_PATH, repeats = BENCHMARK_REPEATS):
+    '''
+        Replays every scraper that has fixtures, `repeats` times, keeping the median of each timing.
+        INPUT:
+            - scrapers (dict[str, tuple[module, callable]]): see load_scrapers.
+            - fixtures_path (Path): directory recorded with --record (one subdirectory per module).
+            - repeats (int): runs per scraper.
+        OUTPUT:
+            - results (dict[str, dict]): module name -> rows and median seconds per stage.
+    '''
+    configure_snapshots(REPLAY, directory = fixtures_path)
+    results = {}
+    for name, (module, scraper) in scrapers.items():
+        if not (Path(fixtures_path) / name).is_dir():
+            print(f"No fixtures for {name}. Skipping (record them with --record).")
+            continue
+        runs = []
+        for _ in range(repeats):
+            set_namespace(name)
+            runs.append(run_scraper(module, scraper))
+        results[name] = {"rows": runs[-1]["rows"]}
+        for key in [key for key in runs[0] if key.endswith("_seconds")]:
+            results[name][key] = statistics.median(run[key] for run in runs)
+    return(results)
+
+
+def compare(results, baseline, time_threshold = BENCHMARK_TIME_THRESHOLD, rows_threshold = BENCHMARK_ROWS_THRESHOLD):
+    '''
+        Venues whose parse time or row count moved more than the thresholds (fractions of the baseline value).
+        OUTPUT:
+            - flags (dict[str, list[str]]): module name -> what moved.
+    '''
+    flags = {}
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        reasons = []
+        if previous["parse_seconds"] > 0:
+            change = result["parse_seconds"] / previous["parse_seconds"] - 1
+            if abs(change) > time_threshold:
+                reasons.append(f"parse time {previous['parse_seconds'] * 1000:.1f}ms -> {result['parse_seconds'] * 1000:.1f}ms ({change:+.0%})")
+        if abs(result["rows"] - previous["rows"]) > previous["rows"] * rows_threshold:
+            reasons.append(f"rows {previous['rows']} -> {result['rows']}")
+        if reasons:
+            flags[name] = reasons
+    return(flags)
+
+
+def print_results(results, flags):
+    print(f"{'Module':<28}{'Rows':>6}{'Parse ms':>10}{'Dates ms':>10}{'Build ms':>10}{'Total ms':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<28}{result['rows']:>6}{result['parse_seconds'] * 1000:>10.1f}{result['date_parse_seconds'] * 1000:>10.1f}"
+            f"{result['build_seconds'] * 1000:>10.1f}{result['total_seconds'] * 1000:>10.1f}{'  !' if name in flags else ''}"
+        )
+    for name, reasons in flags.items():
+        print(f"FLAGGED {name}: {'; '.join(reasons)}")
+
+
+def latest_results(path = RESULTS_PATH):
+    '''
+        The most recent saved results file with any venues in it, or None.
+    '''
+    for results_path in sorted(Path(path).glob("scrapers_*.json"), reverse = True):
+        with open(results_path, "r") as f:
+            if json.load(f).get("venues"):
+                return(results_path)
+    return(None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Time each scraper's parse, date-parse and DataFrame-build stages on recorded fixtures (no network).")
+    parser.add_argument("modules", nargs = "*", help = "Modules in src/event_extraction to run (all by default).")
+    parser.add_argument("--record", action = "store_true", help = "Run the scrapers live and save their pages as fixtures instead of benchmarking.")
+    parser.add_argument("--fixtures", default = str(FIXTURES_PATH), help = "Fixture directory.")
+    parser.add_argument("--repeats", type = int, default = BENCHMARK_REPEATS, help = "Runs per scraper (the median is reported).")
+    parser.add_argument("--baseline", help = "Results JSON to compare against (the latest saved results by default).")
+    args = parser.parse_args()
+    scrapers = load_scrapers(args.modules)
+    if args.record:
+        record_fixtures(scrapers, fixtures_path = args.fixtures)
+        sys.exit(0)
+    baseline_path = args.baseline or latest_results()
+    results = run_benchmark(scrapers, fixtures_path = args.fixtures, repeats = args.repeats)
+    if not results:
+        print(f"No fixtures found in {args.fixtures}. Record them first with --record. Nothing was benchmarked or saved.")
+        sys.exit(2)
+    baseline = {}
+    if baseline_path:
+        with open(baseline_path, "r") as f:
+            baseline = json.load(f)["venues"]
+        print(f"Comparing against {baseline_path}.")
+    flags = compare(results, baseline)
+    print_results(results, flags)
+    RESULTS_PATH.mkdir(parents = True, exist_ok = True)
+    results_path = RESULTS_PATH / f"scrapers_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(results_path, "w") as f:
+        json.dump({
+            "created": datetime.now().isoformat(),
+            "fixtures": str(args.fixtures),
+            "repeats": args.repeats,
+            "baseline": str(baseline_path) if baseline_path else None,
+            "venues": results,
+            "flagged": flags
+        }, f, indent = 4)
+    print(f"Saved results to {results_path}.")
+    sys.exit(1 if flags else 0)
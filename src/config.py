@@ -8,6 +8,9 @@ import logging
 APP_PATH = Path(os.environ["PYTHONPATH"]) / "src"
 OUTPUT_PATH = APP_PATH / "data/"
 LOG_PATH = APP_PATH / "logs/"
+CACHE_PATH = APP_PATH / "data/cache/"
+SNAPSHOTS_PATH = APP_PATH / "data/snapshots/"
+TRACES_PATH = APP_PATH / "data/traces/"
 
 
 # Email
@@ -23,6 +26,10 @@ LOGGING_PARAMS = {
 }
 
 
+# Venues' timezone: start times with a UTC offset are converted to it before taking the event's date
+EVENT_TIMEZONE = "Australia/Melbourne"
+
+
 # Month mapper 
 MONTH_MAPPING = {
     "01": "Jan",
@@ -240,8 +247,145 @@ TRIBUTE_KEYWORDS = [
 BATCH_SIZE = 20
 ARTIST_CERTAINTY_THRESHOLD = 10
 MIN_SPOTIFY_RANK_FOR_YOUTUBE_API = 90
+# Start artist extraction and Spotify/YouTube lookups while the scrapers are still running (main.py --stream)
+STREAM_PIPELINE = os.environ.get("STREAM_PIPELINE", "0") == "1"
 
 
 # Criteria for "just in" events
 LOOKBACK_DAYS = 10
-RECENT_DAYS = 1
\ No newline at end of file
+RECENT_DAYS = 1
+
+
+# Parallel scraping
+MAX_SCRAPER_WORKERS = int(os.environ.get("MAX_SCRAPER_WORKERS", 4))
+SCRAPER_TIMEOUT_SECONDS = int(os.environ.get("SCRAPER_TIMEOUT_SECONDS", 600))
+# "processes": a worker process (and Chrome) per scraper. "tabs": one Chrome loading several venue pages at once in tabs, for containers without the memory for a browser per worker
+SCRAPE_MODE = os.environ.get("SCRAPE_MODE", "processes")
+MAX_BROWSER_TABS = int(os.environ.get("MAX_BROWSER_TABS", 6))
+TAB_READY_TIMEOUT_SECONDS = 20
+
+
+# Sharded runs (main.py --shard-index / --shard-count, then --merge): where each shard's partial results go ("azure" for the blob container, otherwise a local directory)
+SHARD_STORAGE = os.environ.get("SHARD_STORAGE", str(APP_PATH / "data/shards/"))
+# Blob container for shards, kept apart from the exported music_events_*.csv files
+SHARD_CONTAINER_NAME = os.environ.get("SHARD_CONTAINER_NAME", "music-events-shards")
+SHARD_MERGE_TIMEOUT_SECONDS = int(os.environ.get("SHARD_MERGE_TIMEOUT_SECONDS", 1800))
+SHARD_MERGE_POLL_SECONDS = 15
+
+
+# Shared Chrome WebDriver pool
+CHROME_ARGUMENTS = [
+    "--disable-infobars",
+    "--disable-extensions",
+    "start-maximized",
+    "--disable-notifications",
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    # Keep background tabs rendering at full speed (see tab_scheduler)
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows"
+]
+DRIVER_MAX_PAGES = 50
+DRIVER_MAX_RSS_MB = 1500
+
+
+# Persistent Chrome profiles, so JS/CSS bundles stay in the disk cache between runs
+CHROME_PROFILES_ENABLED = os.environ.get("CHROME_PROFILES_ENABLED", "1") == "1"
+CHROME_PROFILES_PATH = CACHE_PATH / "chrome_profiles/"
+CHROME_PROFILE_SLOTS = MAX_SCRAPER_WORKERS * 2
+CHROME_DISK_CACHE_MB = 150
+CHROME_PROFILE_MAX_MB = 250
+
+
+# Resource blocking in headless Chrome (we only read text, hrefs and img src attributes)
+BLOCK_RESOURCES = True
+BLOCKED_RESOURCE_PATTERNS = [
+    # Images
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*use.typekit.net*",
+    # Media and video embeds
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8", "*youtube.com/embed*", "*player.vimeo.com*",
+    # Analytics and trackers
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*connect.facebook.net*",
+    "*hotjar.com*", "*clarity.ms*", "*analytics.tiktok.com*", "*static.klaviyo.com*", "*snap.licdn.com*"
+]
+# Venues whose pages break without some of the above. Patterns listed here are not blocked for that venue ("*" disables blocking).
+RESOURCE_BLOCKING_ALLOWLIST = {
+    "Howler": ["*"]
+}
+
+
+# Static HTML fast path
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-AU,en;q=0.9"
+}
+HTTP_TIMEOUT_SECONDS = 15
+HTTP_POOL_SIZE = 10
+
+
+# Async HTTP fetch engine
+ASYNC_GLOBAL_CONCURRENCY = 20
+ASYNC_PER_HOST_CONCURRENCY = 4
+ASYNC_MAX_RETRIES = 3
+ASYNC_BACKOFF_SECONDS = 1
+
+
+# Condition-driven waits (ceilings in seconds)
+WAIT_TIMEOUTS = {
+    "elements": 10,
+    "count_growth": 5,
+    "stable_count": 5,
+    "network_idle": 5,
+    "scroll": 2
+}
+WAIT_POLL_SECONDS = 0.1
+WAIT_SETTLE_SECONDS = 0.5
+
+
+# Infinite scroll
+SCROLL_MAX_CARDS = 500
+SCROLL_MAX_SCROLLS = 30
+
+
+# On-disk response cache (conditional GET) and last good parsed rows per venue
+HTTP_CACHE_PATH = CACHE_PATH / "http/"
+ROWS_CACHE_PATH = CACHE_PATH / "rows/"
+
+
+# Incremental scrape scheduling (per scraper, in hours)
+SCHEDULE_INITIAL_INTERVAL_HOURS = 24
+SCHEDULE_MIN_INTERVAL_HOURS = 12
+SCHEDULE_MAX_INTERVAL_HOURS = 24 * 7
+SCHEDULE_BACKOFF_FACTOR = 1.5
+# A scraper counts as due this many minutes early, so a daily job that starts a little earlier than the day before (or whose last run finished late) doesn't skip it
+SCHEDULE_SLACK_MINUTES = 60
+
+
+# Circuit breaker: after this many consecutive failed runs, a scraper is skipped for the next CIRCUIT_BREAKER_SKIP_RUNS runs
+CIRCUIT_BREAKER_FAILURES = 3
+CIRCUIT_BREAKER_SKIP_RUNS = 3
+
+
+# Paged gig guides: upper bound on pages fetched per venue
+PAGED_MAX_PAGES = 10
+
+
+# Oztix search: "url" loads each venue's search results URL directly (all venues at once), "ui" types into the search box
+OZTIX_SEARCH_MODE = "url"
+OZTIX_SEARCH_URL = "https://www.oztix.com.au/search?q={query}&page={page}"
+OZTIX_SEARCH_CONCURRENCY = 4
+
+
+# Scraper benchmarks (src/benchmarks): flag a venue whose parse time or row count moves more than this fraction from the baseline
+BENCHMARK_TIME_THRESHOLD = 0.25
+BENCHMARK_ROWS_THRESHOLD = 0.10
+BENCHMARK_REPEATS = 3
+
+
+# Per-run timing trace (Chrome trace_event JSON and a summary table, see tracing)
+TRACE_ENABLED = os.environ.get("TRACE_ENABLED", "1") == "1"
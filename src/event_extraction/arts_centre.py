@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -18,8 +17,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,22 +24,20 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import count_elements, wait_for_count_growth, wait_for_stable_count
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues = ["Hamer Hall", "Sidney Myer Music Bowl"]
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_art_centre(dates):
     f'''
         * Date parser specifically for ingesting Forum Melbourne's event dates.
@@ -78,15 +73,9 @@ def get_events_arts_center():
             - Dataframe object containing preprocessed Art Centre's events.
     '''
     logger.info("ART CENTRE started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    driver = driver_pool.acquire(venue = "Arts Centre Melbourne")
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder(link_prefix = "https://forummelbourne.com.au/shows")
     try:
         logger.info(f"Extracting Events from Arts Centre Melbourne.")
         try:
@@ -94,61 +83,39 @@ def get_events_arts_center():
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CLASS_NAME, "event-tile"))
             )
-            time.sleep(1)
-            soup = BeautifulSoup(
-                driver.page_source, features = "lxml"
-            )
-            show_more = [i for i in soup.find_all("button") if "LOAD MORE EVENTS" in i.text.strip().upper()]
+            wait_for_stable_count(driver, ".event-tile")
+            root = parse_document(driver.page_source)
+            show_more = [i for i in select(root, "button") if "LOAD MORE EVENTS" in element_text(i).strip().upper()]
             while show_more and len(show_more) > 0:
-                if show_more[0].text.strip().upper() == "LOAD MORE EVENTS":
+                if element_text(show_more[0]).strip().upper() == "LOAD MORE EVENTS":
                     try:
                         show_more_button = WebDriverWait(driver, 10).until(
                             EC.element_to_be_clickable((By.CLASS_NAME, "load-more-events"))
                         )
                         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", show_more_button)
-                        time.sleep(0.5)
+                        card_count = count_elements(driver, "a.show-item")
                         show_more_button.click()
-                        time.sleep(3)
-                        soup = BeautifulSoup(driver.page_source, "html.parser")
-                        show_more = [i for i in soup.find_all("button") if "LOAD MORE EVENTS" in i.text.strip().upper()]
+                        wait_for_count_growth(driver, "a.show-item", card_count)
+                        root = parse_document(driver.page_source)
+                        show_more = [i for i in select(root, "button") if "LOAD MORE EVENTS" in element_text(i).strip().upper()]
                         logger.info("More events produced by clicking 'Load More Events'!")
                     except Exception as e:
                         print(f"Failure to click 'show more' button - {e}")
                         break
-            postings = soup.find_all("a", {"class": "show-item"})
-            df = pd.DataFrame({
-                "Title": [""],
-                "Date": [""],
-                "Venue": [""],
-                "Link": [""],
-                "Image": [""]
-            })
+            postings = select(root, "a.show-item")
+            found = len(events)
             for post in postings:
-                title = post.find("span", {"class": "title"}).text.strip()
-                date = post.find("div", {"class": "calendar"}).text.strip().replace("\n", " ")
+                title = element_text(select_one(post, "span.title")).strip()
+                date = element_text(select_one(post, "div.calendar")).strip().replace("\n", " ")
                 ven = 'N/A'
                 link = post.get("href")
-                if link[0] == "/":
-                    link = "https://forummelbourne.com.au/shows" + link
-                image = post.find("div", {"class": "image"}).get("style").split("'")[1]
-                df = pd.concat(
-                    [df, pd.DataFrame({
-                        "Title": title,
-                        "Date": date,
-                        "Venue": ven,
-                        "Link": link,
-                        "Image": image
-                    }, index = [0])], axis = 0
-                ).reset_index(drop = True)
-                df = df.reset_index(drop=True)
-                if len(df[df["Title"] != ""]) == 0:
-                    logger.error(f"Failure to extract events from Arts Centre Mebourne.")
-            df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-            time.sleep(1)
+                image = select_one(post, "div.image").get("style").split("'")[1]
+                events.add(title, date, ven, link = link, image = image)
+            if len(events) == found:
+                logger.error(f"Failure to extract events from Arts Centre Mebourne.")
         except:
             logger.error(f"Failure to extract events from Arts Centre Melbourne.")
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-        driver.close()
+        df_final = events.to_frame()
         df_final["Date"] = dateparser_art_centre(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
         df_final["Date"] = [date + relativedelta(years = 1) if pd.notnull(date) and date < pd.to_datetime(datetime.now().date()) else date for date in df_final["Date"]]
@@ -159,4 +126,6 @@ def get_events_arts_center():
         logger.info(f"{', '.join(venues)} completed ({len(df_final)} events).")
     except Exception as e:
         logger.error(f"{', '.join(venues)} failed - {e}")
+    finally:
+        driver_pool.release(driver)
     return(df_final)
\ No newline at end of file
@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -18,8 +17,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,23 +24,20 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.page_fetcher import fetch_page_source
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues = ["Brunswick Ballroom // Artists' Bar"]
 logger = setup_logging(logger_name = "scraping_logger")
 EXCLUSION_KEYWORDS = ["ANNIVERSARY", "TRIVIA", "TRIVA NIGHT"]
 
 
+@traced("date parse", "parse")
 def dateparser_brunswick_ballroom(dates):
     f'''
         * Date parser specifically for ingesting Brunswick Ballroom event dates.
@@ -79,64 +73,36 @@ def get_events_brunswick_ballroom():
             - Dataframe object containing preprocessed Brunswick Ballroom events.
     '''
     logger.info(f"{(', '.join(venues)).upper()} started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder(link_prefix = "https://brunswickballroom.com.au/whats-on/")
     try:
         for venue in venues:
             logger.info(f"Extracting Events from '{venue}'")
             try:
-                driver.get("https://brunswickballroom.com.au/whats-on/")
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "gig-individual"))
+                page_source = fetch_page_source(
+                    venue = venue,
+                    url = "https://brunswickballroom.com.au/whats-on/",
+                    container = "gig-individual"
                 )
-                time.sleep(1)
-                soup = BeautifulSoup(
-                    driver.page_source, features = "lxml"
-                )
-                postings = soup.find_all("div", {"class": "gig-individual"})
-                df = pd.DataFrame({
-                    "Title": [""],
-                    "Date": [""],
-                    "Venue": [""],
-                    "Link": [""],
-                    "Image": [""]
-                })
+                root = parse_document(page_source)
+                postings = select(root, "div.gig-individual")
+                found = len(events)
                 for post in postings:
-                    title = post.find("a", {"class": "gig-title"}).text.strip()
+                    title = element_text(select_one(post, "a.gig-title")).strip()
                     try:
-                        date = post.find("div", {"class": "gig-date"}).text.strip()
+                        date = element_text(select_one(post, "div.gig-date")).strip()
                     except:
-                        date = post.find("h3", {"class": "gig-date"}).text.strip()
+                        date = element_text(select_one(post, "h3.gig-date")).strip()
                     ven = venue
-                    link = post.find("a", {"class": "gig-button"}).get("href")
-                    if link[0] == "/":
-                        link = "https://brunswickballroom.com.au/whats-on/" + link
-                    image = post.find("img").get("src")
+                    link = select_one(post, "a.gig-button").get("href")
+                    image = select_one(post, "img").get("src")
                     if not any(w in title.upper() for w in EXCLUSION_KEYWORDS):
-                        df = pd.concat(
-                            [df, pd.DataFrame({
-                                "Title": title,
-                                "Date": date,
-                                "Venue": ven,
-                                "Link": link,
-                                "Image": image
-                            }, index = [0])], axis = 0
-                        ).reset_index(drop = True)
-                if len(df[df["Title"] != ""]) == 0:
+                        events.add(title, date, ven, link = link, image = image)
+                if len(events) == found:
                     logger.error(f"Failure to extract events from '{venue}'.")
-                df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-                time.sleep(1)
             except:
                 logger.error(f"Failure to extract events from '{venue}'.")
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-        driver.close()
+        df_final = events.to_frame()
         df_final["Date"] = dateparser_brunswick_ballroom(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
         df_final["Date"] = [date + relativedelta(years = 1) if pd.notnull(date) and date < pd.to_datetime(datetime.now().date()) else date for date in df_final["Date"]]
@@ -9,7 +9,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -19,8 +18,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -28,18 +25,15 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_count_growth, wait_for_stable_count
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues_eventbrite = [
     "The Retreat Hotel",
     "Sub Club"
@@ -56,6 +50,7 @@ DAYS_OF_WEEK = {
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_eventbrite(dates):
     f'''
         * Eventbrite is a tricky one!
@@ -105,83 +100,46 @@ def get_events_eventbrite():
             - Dataframe object containing preprocessed Eventbrite events.
     '''
     logger.info("EVENTBRITE started.")
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Venue1": [""],
-        "Link": [""]
-    })
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder()
     try:
         for venue in venues_eventbrite:
+            logger.info(f"Extracting Events from '{venue}'")
+            driver = driver_pool.acquire(venue = venue)
             try:
-                logger.info(f"Extracting Events from '{venue}'")
-                driver = webdriver.Chrome(options = options)
                 if venue == "Sub Club":
                     driver.get(f"https://www.eventbrite.com.au/o/charades-x-sub-club-48348435443")
                 elif venue == "The Retreat Hotel":
                     driver.get(f"https://www.eventbrite.com.au/o/the-retreat-hotel-28439300263")
-                time.sleep(1)
-                soup = BeautifulSoup(
-                    driver.page_source, features = "lxml"
-                )
-                show_more = soup.find(
-                    "div", {"class": "organizer-profile__show-more"}
-                )
-                if show_more:
+                card_count = wait_for_stable_count(driver, "div.event-card")
+                root = parse_document(driver.page_source)
+                show_more = select_one(root, "div.organizer-profile__show-more")
+                if show_more is not None:
                     try:
                         show_more_button = WebDriverWait(driver, 10).until(
                             EC.element_to_be_clickable((By.XPATH, "/html/body/div[2]/div/div[2]/div/div/div/div[1]/div/main/section/div[2]/div[3]/section/div/div[1]/div/div[3]/button"))
                         )
                         show_more_button.click()
-                        time.sleep(2)
-                        soup = BeautifulSoup(driver.page_source, "html.parser")
+                        wait_for_count_growth(driver, "div.event-card", card_count)
+                        root = parse_document(driver.page_source)
                     except:
                         print("Failure to click 'show more' button")
-                upcoming = soup.find(
-                    "div", {"data-testid": "organizer-profile__future-events"}
-                )
-                postings = upcoming.find_all(
-                    "div", {"class": "event-card"})
-                df = pd.DataFrame({
-                    "Title": [""],
-                    "Date": [""],
-                    "Venue": [""],
-                    "Venue1": [""],
-                    "Link": [""],
-                    "Image": [""]
-                })
+                postings = select(root, 'div[data-testid="organizer-profile__future-events"] div.event-card')
+                found = len(events)
                 for post in postings:
-                    title = post.find(
-                        "h3").text.strip()
+                    title = element_text(select_one(post, "h3")).strip()
                     ven = venue.split(",", 1)[0]
-                    ven1 = post.find_all(
-                        "p")[1].text.strip()
-                    date = post.find_all(
-                        "p")[0].text.strip()
-                    link = post.find(
-                        "a", {"class": "event-card-link"}).get("href")
-                    image = post.find(
-                        "img", {"class": "event-card-image"}).get("src")
-                    df = pd.concat(
-                        [df, pd.DataFrame({
-                            "Title": title,
-                            "Date": date,
-                            "Venue": ven,
-                            "Venue1": ven1,
-                            "Link": link,
-                            "Image": image
-                        }, index = [0])], axis = 0
-                    ).reset_index(drop = True)
-                    df = df.reset_index(drop=True)
-                    if len(df[df["Title"] != ""]) == 0:
-                        logger.error(f"Failure to extract events from '{venue}'.")
-                df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-                time.sleep(1)
-                driver.close()
+                    date = element_text(select(post, "p")[0]).strip()
+                    link = select_one(post, "a.event-card-link").get("href")
+                    image = select_one(post, "img.event-card-image").get("src")
+                    events.add(title, date, ven, link = link, image = image)
+                if len(events) == found:
+                    logger.error(f"Failure to extract events from '{venue}'.")
             except:
                 logger.error(f"Failure to extract events from '{venue}'.")
-        df_final = df_final[df_final["Title"] != ""].drop_duplicates(
+            finally:
+                driver_pool.release(driver)
+        df_final = events.to_frame().drop_duplicates(
             subset = ["Title"]
         ).reset_index(drop=True)
         df_final["Date"] = dateparser_eventbrite(df_final["Date"])
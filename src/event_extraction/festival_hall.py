@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -18,8 +17,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,22 +24,20 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_network_idle, wait_for_stable_count, scroll_to_load_all
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues = ["Festival Hall"]
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_festival_hall(dates):
     f'''
         * Date parser specifically for ingesting Festival Hall event dates.
@@ -78,15 +73,9 @@ def get_events_festival_hall():
             - Dataframe object containing preprocessed Festival Hall events.
     '''
     logger.info(f"{(', '.join(venues)).upper()} started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    driver = driver_pool.acquire(venue = venues[0])
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder(link_prefix = "https://www.festivalhall.com.au")
     try:
         for venue in venues:
             page = 1
@@ -94,54 +83,26 @@ def get_events_festival_hall():
                 logger.info(f"Extracting Events from '{venue}'")
                 try:
                     driver.get("https://www.festivalhall.com.au/whats-on")
-                    last_height = driver.execute_script("return document.body.scrollHeight")
-                    while True:
-                        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(2)
-                        new_height = driver.execute_script("return document.body.scrollHeight")
-                        if new_height == last_height:
-                            break
-                        last_height = new_height
+                    scroll_to_load_all(driver, card_selector = "div[data-component='EventCardWithImaged']", label = venue)
                     WebDriverWait(driver, 10).until(
                         EC.presence_of_element_located((By.CLASS_NAME, "MuiContainer-root"))
                     )
-                    time.sleep(1)
-                    soup = BeautifulSoup(
-                        driver.page_source, features = "lxml"
-                    )
-                    postings = soup.find_all("div", {"data-component": "EventCardWithImaged"})
-                    df = pd.DataFrame({
-                        "Title": [""],
-                        "Date": [""],
-                        "Venue": [""],
-                        "Link": [""],
-                        "Image": [""]
-                    })
+                    wait_for_stable_count(driver, "div[data-component='EventCardWithImaged']")
+                    root = parse_document(driver.page_source)
+                    postings = select(root, "div[data-component='EventCardWithImaged']")
+                    found = len(events)
                     for post in postings:
-                        title = post.find("p").text.strip()
-                        date = post.find("time").find_all("span")[1].text.strip() + " " + post.find("time").find_all("span")[0].text.strip()
+                        title = element_text(select_one(post, "p")).strip()
+                        date = element_text(select(select_one(post, "time"), "span")[1]).strip() + " " + element_text(select(select_one(post, "time"), "span")[0]).strip()
                         ven = venue
-                        if post.find("a"):
-                            link = post.find("a").get("href")
+                        if select_one(post, "a") is not None:
+                            link = select_one(post, "a").get("href")
                         else:
                             link = ""
-                        if link[0] == "/":
-                            link = "https://www.festivalhall.com.au" + link
-                        image = post.find("img").get("src")
-                        df = pd.concat(
-                            [df, pd.DataFrame({
-                                "Title": title,
-                                "Date": date,
-                                "Venue": ven,
-                                "Link": link,
-                                "Image": image
-                            }, index = [0])], axis = 0
-                        ).reset_index(drop = True)
-                        df = df.reset_index(drop=True)
-                        if len(df[df["Title"] != ""]) == 0:
-                            logger.error(f"Failure to extract events from '{venue}'.")
-                    df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-                    time.sleep(1)
+                        image = select_one(post, "img").get("src")
+                        events.add(title, date, ven, link = link, image = image)
+                    if len(events) == found:
+                        logger.error(f"Failure to extract events from '{venue}'.")
                     page = page + 1
                     next_button = WebDriverWait(driver, 5).until(
                         EC.element_to_be_clickable(
@@ -149,16 +110,17 @@ def get_events_festival_hall():
                         )
                     )
                     driver.execute_script("arguments[0].click();", next_button)
-                    time.sleep(2)
+                    wait_for_network_idle(driver, label = f"{venue} page {i}")
                 except:
                     logger.error(f"Failure to extract events from '{venue}', page {page}.")
                     break
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-        driver.close()
+        df_final = events.to_frame()
         df_final["Date"] = dateparser_festival_hall(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
         df_final["Date"] = [date + relativedelta(years = 1) if pd.notnull(date) and date < pd.to_datetime(datetime.now().date()) else date for date in df_final["Date"]]
         logger.info(f"{(', '.join(venues)).upper()} completed ({len(df_final)} rows).")
     except Exception as e:
         logger.error(f"{(', '.join(venues)).upper()} failed - {e}")
+    finally:
+        driver_pool.release(driver)
     return(df_final)
\ No newline at end of file
@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -19,8 +18,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -28,22 +25,20 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_count_growth, wait_for_stable_count
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues_humanitix = ["Miscellania", "Sub Club", "New Guernica", "Glamorama"]
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_humanitix(dates):
     f'''
         * Date parser specifically for ingesting Humanitix event dates.
@@ -81,15 +76,9 @@ def get_events_humanitix():
             - Dataframe object containing preprocessed Humanitix events.
     '''
     logger.info("HUMANITIX started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    driver = driver_pool.acquire(venue = "Humanitix")
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder()
     try:
         for venue in venues_humanitix:
             logger.info(f"Extracting Events from '{venue}'")
@@ -100,71 +89,36 @@ def get_events_humanitix():
                     driver.get("https://events.humanitix.com/host/616e124c67d0560bbf7875c0")
                 elif venue == "New Guernica":
                     driver.get("https://events.humanitix.com/host/636b21b77a70493ebe826fad")
-                time.sleep(2)
-                soup = BeautifulSoup(
-                    driver.page_source, features = "lxml"
-                )
-                show_more = soup.find(
-                    "div", {"class": "loadmore"}
-                )
-                if show_more:
+                card_count = wait_for_stable_count(driver, "a.EventCard")
+                root = parse_document(driver.page_source)
+                show_more = select_one(root, "div.loadmore")
+                if show_more is not None:
                     try:
                         button = driver.find_element(By.XPATH, "/html/body/div/div[1]/div[2]/main/aside/div[2]/div[2]/aside/div[2]/button[1]")
                         driver.execute_script("arguments[0].scrollIntoView(true);", button)
                         driver.execute_script("arguments[0].click();", button)
-                        time.sleep(2)
-                        soup = BeautifulSoup(driver.page_source, "html.parser")
+                        wait_for_count_growth(driver, "a.EventCard", card_count)
+                        root = parse_document(driver.page_source)
                     except:
                         logger.warning("Failure to click 'show more' button")
-                df = pd.DataFrame({
-                    "Title": [""],
-                    "Date": [""],
-                    "Venue": [""],
-                    "Link": [""],
-                    "Image": [""]
-                })  
-                postings = soup.find_all(
-                    "a", {"class": "EventCard"}
-                )
+                found = len(events)
+                postings = select(root, "a.EventCard")
                 for post in postings:
-                    date = post.find(
-                        "div", {"class": "date"}
-                    ).text.strip()
-                    date = post.find(
-                        "div", {"class": "date"}
-                    ).text.strip()
-                    title = post.find(
-                        "div", {"class": "title"}
-                    ).text.strip()
+                    date = element_text(select_one(post, "div.date")).strip()
+                    title = element_text(select_one(post, "div.title")).strip()
                     link = post.get("href")
-                    image = post.find("img").get("src")
-                    df = pd.concat(
-                        [
-                            df, 
-                            pd.DataFrame(
-                                {
-                                    "Title": title,
-                                    "Date": date,
-                                    "Venue": venue,
-                                    "Link": link,
-                                    "Image": image
-                                }, 
-                                index = [0]
-                            )
-                        ], 
-                        axis = 0
-                    ).reset_index(drop = True)
-                    df = df.reset_index(drop=True)
-                    if len(df[df["Title"] != ""]) == 0:
-                        logger.error(f"Failure to extract events from '{venue}'.")
-                df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
+                    image = select_one(post, "img").get("src")
+                    events.add(title, date, venue, link = link, image = image)
+                if len(events) == found:
+                    logger.error(f"Failure to extract events from '{venue}'.")
             except:
                 logger.error(f"Failure to extract events from '{venue}'.")
-        driver.close()
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
+        df_final = events.to_frame()
         df_final["Date"] = dateparser_humanitix(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
         logger.info(f"HUMANITIX completed ({len(df_final)} rows).")
     except Exception as e:
         logger.error(f"HUMANITIX failed - {e}")
+    finally:
+        driver_pool.release(driver)
     return(df_final)
\ No newline at end of file
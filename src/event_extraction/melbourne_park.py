@@ -10,7 +10,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -20,8 +19,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -29,19 +26,20 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.paged_source import PagedSource, fetch_paged
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues = ["Rod Laver Arena", "Margaret Court Arena", "John Cain Arena"]
+ARENA_URLS = {
+    "Rod Laver Arena": "https://rodlaverarena.com.au/",
+    "Margaret Court Arena": "https://margaretcourtarena.com.au/",
+    "John Cain Arena": "https://johncainarena.com.au/"
+}
 logger = setup_logging(logger_name = "scraping_logger")
 MONTHS = [
     "JANUARY",
@@ -59,6 +57,7 @@ MONTHS = [
 ]
 
 
+@traced("date parse", "parse")
 def dateparser_melbourne_park(dates):
     f'''
         * Date parser specifically for ingesting ticketek event dates.
@@ -103,77 +102,44 @@ def get_events_melbourne_park():
             - Dataframe object containing preprocessed Melbourne Park events.
     '''
     logger.info("MELBOURNE PARK started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder()
     try:
-        for page in range(1, 3):
-            for venue in venues:
-                logger.info(f"Extracting Events from '{venue}', page {page}.")
+        for venue in venues:
+            logger.info(f"Extracting Events from '{venue}'.")
+            try:
+                page_sources = fetch_paged(PagedSource(
+                    venue = venue,
+                    page_url = ARENA_URLS[venue] + "events/?sf_paged={page}",
+                    container = "card",
+                    marker = "ticketek-buy-link",
+                    last_page_pattern = r"sf_paged=(\d+)"
+                ))
+            except Exception as e:
+                logger.error(f"Failure to extract events from '{venue}'. - {e}")
+                continue
+            for page, (page_link, page_source) in enumerate(page_sources.items(), start = 1):
                 try:
-                    if venue == "Rod Laver Arena":
-                        page_link = f"https://rodlaverarena.com.au/events/?sf_paged={page}"
-                    elif venue == "Margaret Court Arena":
-                        page_link = f"https://margaretcourtarena.com.au/events/?sf_paged={page}"
-                    elif venue == "John Cain Arena":
-                        page_link = f"https://johncainarena.com.au/events/?sf_paged={page}"
-                    else:
-                        pass #break
-                    driver.get(page_link)
-                    time.sleep(1)
-                    soup = BeautifulSoup(
-                        driver.page_source, features = "lxml"
-                    )
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "footer"))
-                    )
-                    footer = driver.find_element(By.TAG_NAME, "footer")
-                    driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'end'});", footer)
-                    time.sleep(1)
-                    postings = soup.find("div", {"id": "eventListing"}).find_all("div", {"class": "card"})
-                    df = pd.DataFrame({
-                        "Title": [""],
-                        "Date": [""],
-                        "Venue": [""],
-                        "Link": [""],
-                        "Image": [""]
-                    })
+                    root = parse_document(page_source)
+                    postings = select(select_one(root, "div#eventListing"), "div.card")
+                    found = len(events)
+                    events.link_prefix = page_link.split("events/")[0]
                     for post in postings:
                         try:
-                            if len([p for p in post.find_all("p") if "CONCERT" in p.text.upper()]) > 0:
-                                title = post.find("h3", {"class": "card-title"}).text.strip().replace("\n", "").replace("\t", "")[:-1]
-                                date = [p for p in post.find_all("p") if any(word in p.text.strip().upper() for word in MONTHS) and any(str(i) in p.text.strip().upper() for i in range(1, 32))][0].text.strip()
+                            if len([p for p in select(post, "p") if "CONCERT" in element_text(p).upper()]) > 0:
+                                title = element_text(select_one(post, "h3.card-title")).strip().replace("\n", "").replace("\t", "")[:-1]
+                                date = element_text([p for p in select(post, "p") if any(word in element_text(p).strip().upper() for word in MONTHS) and any(str(i) in element_text(p).strip().upper() for i in range(1, 32))][0]).strip()
                                 ven = venue
-                                link = post.find("a", {"class": "ticketek-buy-link"}).get("href")
-                                if link[0] == "/":
-                                    link = page_link.split("events/")[0] + link
-                                image = post.find("img").get("src")
-                                df = pd.concat(
-                                    [df, pd.DataFrame({
-                                        "Title": title,
-                                        "Date": date,
-                                        "Venue": ven,
-                                        "Link": link,
-                                        "Image": image
-                                    }, index = [0])], axis = 0
-                                ).reset_index(drop = True)
-                                df = df.reset_index(drop=True)
-                                if len(df[df["Title"] != ""]) == 0:
-                                    logger.error(f"Failure to extract events from '{venue}'.")
+                                link = select_one(post, "a.ticketek-buy-link").get("href")
+                                image = select_one(post, "img").get("src")
+                                events.add(title, date, ven, link = link, image = image)
                         except:
                             pass
-                    df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-                    time.sleep(1)
+                    if len(events) == found:
+                        logger.error(f"Failure to extract events from '{venue}'.")
                 except Exception as e:
                     logger.error(f"Failure to extract events from '{venue}', page {page}. - {e}")
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-        driver.close()
+        df_final = events.to_frame()
         df_final["Date"] = dateparser_melbourne_park(df_final["Date"])
         rows_to_add = []
         rows_to_drop = []
@@ -14,7 +14,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -24,8 +23,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -33,18 +30,15 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_network_idle
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues_moshtix = [
     i for i in venues if i in [
         "Brunswick Ballroom",
@@ -61,6 +55,7 @@ venues_moshtix = [
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_moshtix(dates):
     f'''
         * Similar to Oztix in that it doesn;t seem we require multi-date handling.
@@ -93,70 +88,46 @@ def get_events_moshtix():
             - Dataframe object containing preprocessed Moshtix events.
     '''
     logger.info("MOSHTIX started.")
-    driver = webdriver.Chrome(options = options)
-    driver.get("https://www.moshtix.com.au/v2/")
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
-    for venue in venues_moshtix:
-        logger.info(f"Extracting Events from '{venue}'")
-        try:
-            search = venue
-            search_box = driver.find_element(
-                By.XPATH,
-                '//*[@id="query"]'
-            )
-            search_box.send_keys(search)
-            search_box.send_keys(Keys.ENTER)
-            time.sleep(1)
-            soup = BeautifulSoup(
-                driver.page_source, "html"
-            )
-            postings = soup.find_all("div", {"class": "searchresult clearfix"})
-            df = pd.DataFrame({
-                "Title": [""],
-                "Date": [""],
-                "Venue": [""],
-                "Link": [""],
-                "Image": [""]
-            })
-            for post in postings:
-                title = post.find(
-                    "h2", {"class": "main-event-header"}).text.strip()
-                date = post.find(
-                    "h2", {"class": "main-artist-event-header"}).text.strip()
-                date = date.split(",", 1)[0]
-                ven = venue.split(",", 1)[0]
-                link = post.find(
-                    "h2", {"class": "main-event-header"}).find("a").get("href")
-                image = post.find("img").get("src")
-                df = pd.concat(
-                    [df, pd.DataFrame({
-                        "Title": title,
-                        "Date": date,
-                        "Venue": ven,
-                        "Link": link,
-                        "Image": image
-                    }, index = [0])], axis = 0
-                ).reset_index(drop = True)
-                df = df.reset_index(drop=True)
-                if len(df[df["Title"] != ""]) == 0:
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder()
+    driver = driver_pool.acquire(venue = "Moshtix")
+    try:
+        driver.get("https://www.moshtix.com.au/v2/")
+        wait_for_network_idle(driver, label = "MOSHTIX home")
+        for venue in venues_moshtix:
+            logger.info(f"Extracting Events from '{venue}'")
+            try:
+                search = venue
+                search_box = driver.find_element(
+                    By.XPATH,
+                    '//*[@id="query"]'
+                )
+                search_box.send_keys(search)
+                search_box.send_keys(Keys.ENTER)
+                wait_for_network_idle(driver, label = f"MOSHTIX search {venue}")
+                root = parse_document(driver.page_source)
+                postings = select(root, "div.searchresult.clearfix")
+                found = len(events)
+                for post in postings:
+                    title = element_text(select_one(post, "h2.main-event-header")).strip()
+                    date = element_text(select_one(post, "h2.main-artist-event-header")).strip()
+                    date = date.split(",", 1)[0]
+                    ven = venue.split(",", 1)[0]
+                    link = select_one(select_one(post, "h2.main-event-header"), "a").get("href")
+                    image = select_one(post, "img").get("src")
+                    events.add(title, date, ven, link = link, image = image)
+                if len(events) == found:
                     logger.error(f"Failure to extract events from '{venue}'.")
-            df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-            driver.find_element(
-                By.XPATH,
-                '//*[@id="header"]/nav/ul/li[1]/a'
-            ).click()
-            time.sleep(1)
-        except Exception as e:
-            logger.error(f"Failure to extract events from '{venue}' - {e}.")
-    driver.close()
-    df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
+                driver.find_element(
+                    By.XPATH,
+                    '//*[@id="header"]/nav/ul/li[1]/a'
+                ).click()
+                wait_for_network_idle(driver, label = "MOSHTIX home")
+            except Exception as e:
+                logger.error(f"Failure to extract events from '{venue}' - {e}.")
+    finally:
+        driver_pool.release(driver)
+    df_final = events.to_frame()
     if len(df_final) > 0:
         df_final["Date"] = dateparser_moshtix(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
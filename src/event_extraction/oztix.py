@@ -13,7 +13,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -21,29 +20,26 @@ import html
 import time
 from datetime import datetime
 from datetime import timedelta
+from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from src.config import venues
+from src.config import venues, OZTIX_SEARCH_MODE, OZTIX_SEARCH_URL, OZTIX_SEARCH_CONCURRENCY
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_network_idle
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.paged_source import PagedSource, fetch_paged
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues_oztix = [
     "Northcote Social Club",
     "The Workers Club",
@@ -70,6 +66,7 @@ MAX_PAGES = 4
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_oztix(dates):
     f'''
         * Date parser specifically for ingesting oztix event dates.
@@ -98,77 +95,55 @@ def dateparser_oztix(dates):
 
 
 
-def get_events_oztix():
+def parse_oztix_results(page_source, venue):
     '''
-        Gets events from Oztix.
+        Pulls the events out of one page of Oztix search results.
+        INPUT:
+            - page_source (str): HTML of the results page.
+            - venue (str): the venue that was searched for.
         OUTPUT:
-            - Dataframe object containing preprocessed Oztix events.
+            - rows (list[dict]): one row per event, with Venue1 holding the venue Oztix lists the event at.
+    '''
+    rows = []
+    for post in select(parse_document(page_source), 'li[tabindex="-1"]'):
+        rows.append({
+            "Title": element_text(select_one(post, "h3.event-details__name")).strip(),
+            "Date": element_text(select_one(post, "div.event-when")).strip(),
+            "Venue": venue.split(",", 1)[0],
+            "Venue1": element_text(select_one(post, "p.detail")).strip(),
+            "Link": select_one(post, "a.search-event_container").get("href"),
+            "Image": select_one(post, "img").get("src")
+        })
+    if len(rows) == 0:
+        logger.error(f"Failure to extract events from '{venue}'.")
+    return(rows)
+
+
+def search_oztix_by_ui(venues = venues_oztix):
+    '''
+        Searches Oztix for each venue by typing into the search box (one venue after another, in one browser).
     '''
-    logger.info("OZTIX started.")
-    driver = webdriver.Chrome(options = options)
-    driver.get("https://www.oztix.com.au/")
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Venue1": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    rows = []
+    driver = driver_pool.acquire(venue = "Oztix")
     try:
-        for venue in venues_oztix:
+        driver.get("https://www.oztix.com.au/")
+        for venue in venues:
             logger.info(f"Extracting Events from '{venue}'")
             try:
                 search = venue
-                time.sleep(1)
                 WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, 'input[name="search"]'))
                 )
-                time.sleep(1)
                 search_box = driver.find_element(
                     By.XPATH,
                     '/html/body/div[1]/div/header/div[3]/div/form/label/input'
                 )
                 search_box.send_keys(search)
                 search_box.send_keys(Keys.ENTER)
-                time.sleep(1)
+                wait_for_network_idle(driver, label = f"OZTIX search {venue}")
                 page = 1
                 while page < MAX_PAGES + 1:
-                    soup = BeautifulSoup(
-                        driver.page_source, "html"
-                    )
-                    postings = soup.find_all("li", {"tabindex": "-1"})
-                    df = pd.DataFrame({
-                        "Title": [""],
-                        "Date": [""],
-                        "Venue": [""],
-                        "Venue1": [""],
-                        "Link": [""],
-                        "Image": [""]
-                    })
-                    for post in postings:
-                        title = post.find(
-                            "h3", {"class": "event-details__name"}).text.strip()
-                        date = post.find("div", {"class": "event-when"}).text.strip()
-                        ven = venue.split(",", 1)[0]
-                        ven1 = post.find("p", {"class": "detail"}).text.strip()
-                        link = post.find(
-                            "a", {"class": "search-event_container"}).get("href")
-                        image = post.find("img").get("src")
-                        df = pd.concat(
-                            [df, pd.DataFrame({
-                                "Title": title,
-                                "Date": date,
-                                "Venue": ven,
-                                "Venue1": ven1,
-                                "Link": link,
-                                "Image": image
-                            }, index = [0])], axis = 0
-                        ).reset_index(drop = True)
-                        df = df.reset_index(drop=True)
-                        if len(df[df["Title"] != ""]) == 0:
-                            logger.error(f"Failure to extract events from '{venue}'.")
-                    df_final = pd.concat([df_final, df], axis = 0)
+                    rows += parse_oztix_results(driver.page_source, venue)
                     try:
                         next_button = driver.find_element(
                             By.CSS_SELECTOR,
@@ -183,12 +158,63 @@ def get_events_oztix():
                     By.XPATH,
                     '//*[@id="app"]/div/header/div[1]/a'
                 ).click()
-                time.sleep(1)
+                wait_for_network_idle(driver, label = "OZTIX home")
             except:
                 logger.error(f"Failure to extract events from '{venue}'.")
+    finally:
+        driver_pool.release(driver)
+    return(rows)
+
+
+def search_oztix_venue_by_url(venue):
+    '''
+        Loads the search results for one venue straight from the results URL (and any further result pages).
+    '''
+    logger.info(f"Extracting Events from '{venue}'")
+    rows = []
+    try:
+        page_sources = fetch_paged(PagedSource(
+            venue = "Oztix",
+            page_url = OZTIX_SEARCH_URL.replace("{query}", quote_plus(venue)),
+            container = "search-event_container",
+            marker = "event-details__name",
+            last_page_pattern = r"[?&]page=(\d+)",
+            max_pages = MAX_PAGES
+        ))
+        for page_source in page_sources.values():
+            rows += parse_oztix_results(page_source, venue)
+    except Exception as e:
+        logger.error(f"Failure to extract events from '{venue}' - {e}")
+    return(rows)
+
+
+def search_oztix_by_url(venues = venues_oztix, concurrency = OZTIX_SEARCH_CONCURRENCY):
+    '''
+        Searches Oztix for every venue at once, by loading each venue's results URL directly.
+    '''
+    with ThreadPoolExecutor(max_workers = concurrency) as executor:
+        results = list(executor.map(search_oztix_venue_by_url, venues))
+    return([row for rows in results for row in rows])
+
+
+def get_events_oztix(search_mode = OZTIX_SEARCH_MODE):
+    '''
+        Gets events from Oztix.
+        INPUT:
+            - search_mode (str): "url" to load every venue's search results URL concurrently, or "ui" to type each venue into the search box in turn.
+        OUTPUT:
+            - Dataframe object containing preprocessed Oztix events.
+    '''
+    logger.info(f"OZTIX started ({search_mode} search).")
+    df_final = pd.DataFrame(columns = ["Title", "Date", "Venue", "Venue1", "Link", "Image"])
+    try:
+        if search_mode == "url":
+            rows = search_oztix_by_url()
+        else:
+            rows = search_oztix_by_ui()
+        df_final = pd.DataFrame(rows, columns = ["Title", "Date", "Venue", "Venue1", "Link", "Image"])
         df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
         df_final["correct_venue_flag"] = [1 if df_final["Venue"][i] in df_final["Venue1"][i] else 0 for i in range(len(df_final))]
-        driver.close()
         df_final = df_final[df_final["correct_venue_flag"] == 1][[
             "Title",
             "Date",
@@ -203,4 +229,4 @@ def get_events_oztix():
     except Exception as e:
         logger.error(f"Failed to scrape OZTIX - {e}")
         df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-    return(df_final)
\ No newline at end of file
+    return(df_final)
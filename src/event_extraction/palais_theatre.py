@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -18,8 +17,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,22 +24,19 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.paged_source import PagedSource, fetch_paged
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues = ["Palais Theatre"]
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_palais_theatre(dates):
     f'''
         * Date parser specifically for ingesting Palais Theatre event dates.
@@ -78,72 +72,40 @@ def get_events_palais_theatre():
             - Dataframe object containing preprocessed Palais Theatre events.
     '''
     logger.info(f"{(', '.join(venues)).upper()} started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder(link_prefix = "https://www.palaistheatre.com.au")
     try:
         for venue in venues:
             logger.info(f"Extracting Events from '{venue}'")
-            for page in range(1, 5):
+            page_sources = fetch_paged(PagedSource(
+                venue = venue,
+                first_url = "https://www.palaistheatre.com.au/whats-on",
+                page_url = "https://www.palaistheatre.com.au/whats-on?Page={page}",
+                container = "MuiContainer-root",
+                marker = "EventCardWithImaged",
+                last_page_pattern = r"[?&]Page=(\d+)"
+            ))
+            for page, page_source in enumerate(page_sources.values(), start = 1):
                 logger.info(f"Trying Page {page}...")
                 try:
-                    if page == 1:
-                        driver.get("https://www.palaistheatre.com.au/whats-on")
-                    else:
-                        try:
-                            driver.get(f"https://www.palaistheatre.com.au/whats-on?Page={page}")
-                        except:
-                            break
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CLASS_NAME, "MuiContainer-root"))
-                    )
-                    time.sleep(1)
-                    soup = BeautifulSoup(
-                        driver.page_source, features = "lxml"
-                    )
-                    postings = soup.find_all("div", {"data-component": "EventCardWithImaged"})
-                    df = pd.DataFrame({
-                        "Title": [""],
-                        "Date": [""],
-                        "Venue": [""],
-                        "Link": [""],
-                        "Image": [""]
-                    })
+                    root = parse_document(page_source)
+                    postings = select(root, "div[data-component='EventCardWithImaged']")
+                    found = len(events)
                     for post in postings:
-                        title = post.find("p").text.strip()
-                        date = post.find("time").get("datetime").strip()[0:10]
+                        title = element_text(select_one(post, "p")).strip()
+                        date = select_one(post, "time").get("datetime").strip()[0:10]
                         ven = venue
-                        if post.find("a"):
-                            link = post.find("a").get("href")
+                        if select_one(post, "a") is not None:
+                            link = select_one(post, "a").get("href")
                         else:
                             link = ""
-                        if link[0] == "/":
-                            link = "https://www.palaistheatre.com.au" + link
-                        image = post.find("img").get("src")
-                        df = pd.concat(
-                            [df, pd.DataFrame({
-                                "Title": title,
-                                "Date": date,
-                                "Venue": ven,
-                                "Link": link,
-                                "Image": image
-                            }, index = [0])], axis = 0
-                        ).reset_index(drop = True)
-                        df = df.reset_index(drop=True)
-                        if len(df[df["Title"] != ""]) == 0:
-                            logger.error(f"Failure to extract events from '{venue}'.")
-                    df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-                    time.sleep(1)
+                        image = select_one(post, "img").get("src")
+                        events.add(title, date, ven, link = link, image = image)
+                    if len(events) == found:
+                        logger.error(f"Failure to extract events from '{venue}'.")
                 except Exception as e:
                     logger.error(f"Failure to extract events from '{venue}', page {page}")
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-        driver.close()
+        df_final = events.to_frame()
         df_final["Date"] = dateparser_palais_theatre(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
         df_final["Date"] = [date + relativedelta(years = 1) if pd.notnull(date) and date < pd.to_datetime(datetime.now().date()) else date for date in df_final["Date"]]
@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -18,8 +17,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,22 +24,20 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_network_idle
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues = ["Paris Cat Jazz Club"]
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_paris_cat(dates):
     f'''
         * Date parser specifically for ingesting Paris Cat Jazz Club event dates.
@@ -78,15 +73,9 @@ def get_events_paris_cat():
             - Dataframe object containing preprocessed Paris Cat Jazz Club events.
     '''
     logger.info(f"{(', '.join(venues)).upper()} started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    driver = driver_pool.acquire(venue = venues[0])
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder(link_prefix = "https://www.pariscat.com.au")
     try:
         for venue in venues:
             logger.info(f"Extracting Events from '{venue}'")
@@ -95,59 +84,37 @@ def get_events_paris_cat():
                 WebDriverWait(driver, 15).until(
                     EC.presence_of_element_located((By.TAG_NAME, "section"))
                 )
-                time.sleep(1)
-                soup = BeautifulSoup(
-                    driver.page_source, features = "lxml"
-                )
-                sections = [section for section in soup.find_all("div") if section.has_attr("id")]
+                wait_for_network_idle(driver, label = venue)
+                root = parse_document(driver.page_source)
+                sections = [section for section in select(root, "div") if section.get("id") is not None]
                 sections = [section for section in sections if "MONTH" in section.get("id").strip().upper()]
                 for section in sections:
                     try:
-                        postings = section.find_all("div", recursive = False)
-                        df = pd.DataFrame({
-                            "Title": [""],
-                            "Date": [""],
-                            "Venue": [""],
-                            "Link": [""],
-                            "Image": [""]
-                        })
+                        postings = section.findall("div")
+                        found = len(events)
                         date = datetime.now().date().strftime("%Y-%m-%d")
                         for post in postings:
-                            if post.find("a"):
-                                title = post.find("p").text.split("//")[1].strip()
+                            if select_one(post, "a") is not None:
+                                title = element_text(select_one(post, "p")).split("//")[1].strip()
                                 date = date
                                 ven = venue
-                                link = post.find_all("a")[-1].get("href")
-                                if link[0] == "/":
-                                    link = "https://www.pariscat.com.au" + link
-                                image = [i for i in post.find_all("div") if i.has_attr("style")]
+                                link = select(post, "a")[-1].get("href")
+                                image = [i for i in select(post, "div") if i.get("style") is not None]
                                 if len(image) > 0:
                                     image = image[0].get("style").split('("')[1].split('")')[0]
                                 else:
                                     image = None
-                                df = pd.concat(
-                                    [df, pd.DataFrame({
-                                        "Title": title,
-                                        "Date": date,
-                                        "Venue": ven,
-                                        "Link": link,
-                                        "Image": image
-                                    }, index = [0])], axis = 0
-                                ).reset_index(drop = True)
-                                df = df.reset_index(drop=True)
-                                if len(df[df["Title"] != ""]) == 0:
-                                    logger.error(f"Failure to extract events from '{venue}'.")
+                                events.add(title, date, ven, link = link, image = image)
                             else:
-                                date = post.find("p").text.strip()
-                        df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-                        time.sleep(1)
+                                date = element_text(select_one(post, "p")).strip()
+                        if len(events) == found:
+                            logger.error(f"Failure to extract events from '{venue}'.")
                     except:
                         logger.warning("Could not process section of posts")
                         pass
             except:
                 logger.error(f"Failure to extract events from '{venue}'.")
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-        driver.close()
+        df_final = events.to_frame()
         logger.info(f"{len(df_final)} rows for PARIS CAT scrape job.")
         df_final["Date"] = dateparser_paris_cat(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
@@ -159,4 +126,6 @@ def get_events_paris_cat():
         logger.info(f"{(', '.join(venues)).upper()} completed ({len(df_final)} rows).")
     except Exception as e:
         logger.error(f"{(', '.join(venues)).upper()} failed - {e}")
+    finally:
+        driver_pool.release(driver)
     return(df_final)
\ No newline at end of file
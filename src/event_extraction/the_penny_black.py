@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import re
 import requests
 import lxml
@@ -18,8 +17,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 from dateutil.relativedelta import relativedelta
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -27,22 +24,20 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_stable_count
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
 venues = ["The Penny Black"]
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_penny_black(dates):
     f'''
         * Date parser specifically for ingesting The Penny Black event dates.
@@ -78,69 +73,43 @@ def get_events_penny_black():
             - Dataframe object containing preprocessed The Penny Black events.
     '''
     logger.info(f"{(', '.join(venues)).upper()} started.")
-    driver = webdriver.Chrome(options = options)
-    time.sleep(1)
-    df_final = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    driver = driver_pool.acquire(venue = venues[0])
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder(link_prefix = "https://www.thepennyblack.com.au")
     try:
         for venue in venues:
             logger.info(f"Extracting Events from '{venue}'")
             try:
                 driver.get("https://www.thepennyblack.com.au/gig-guide")
-                time.sleep(1)
-                soup = BeautifulSoup(
-                    driver.page_source, features = "lxml"
-                )
-                postings = soup.find_all("article", {"class": "eventlist-event"})
-                df = pd.DataFrame({
-                    "Title": [""],
-                    "Date": [""],
-                    "Venue": [""],
-                    "Link": [""],
-                    "Image": [""]
-                })
+                wait_for_stable_count(driver, "article.eventlist-event")
+                root = parse_document(driver.page_source)
+                postings = select(root, "article.eventlist-event")
+                found = len(events)
                 for post in postings:
-                    title = post.find("h1", {"class": "eventlist-title"}).text.strip()
-                    date = post.find_all("div", {"class": "eventlist-datetag-startdate"})[0].text.strip() + " " + post.find_all("div", {"class": "eventlist-datetag-startdate"})[1].text.strip()
+                    title = element_text(select_one(post, "h1.eventlist-title")).strip()
+                    date = element_text(select(post, "div.eventlist-datetag-startdate")[0]).strip() + " " + element_text(select(post, "div.eventlist-datetag-startdate")[1]).strip()
                     ven = venue
-                    link = post.find("a", {"class": "eventlist-title-link"}).get("href")
-                    if link[0] == "/":
-                        link = "https://www.thepennyblack.com.au" + link
+                    link = select_one(post, "a.eventlist-title-link").get("href")
                     try:
-                        image = post.find("img").get("src")
+                        image = select_one(post, "img").get("src")
                     except AttributeError:
                         try:
-                            image = post.find("img").get("data-src")
+                            image = select_one(post, "img").get("data-src")
                         except:
                             logger.warning(f"Couldn't find image for {title} at {venue}")
                             image = ""
-                    df = pd.concat(
-                        [df, pd.DataFrame({
-                            "Title": title,
-                            "Date": date,
-                            "Venue": ven,
-                            "Link": link,
-                            "Image": image
-                        }, index = [0])], axis = 0
-                    ).reset_index(drop = True)
-                    df = df.reset_index(drop=True)
-                    if len(df[df["Title"] != ""]) == 0:
-                        logger.error(f"Failure to extract events from '{venue}'.")
-                df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
-                time.sleep(1)
+                    events.add(title, date, ven, link = link, image = image)
+                if len(events) == found:
+                    logger.error(f"Failure to extract events from '{venue}'.")
             except:
                 logger.error(f"Failure to extract events from '{venue}'.")
-        df_final = df_final[df_final["Title"] != ""].reset_index(drop=True)
-        driver.close()
+        df_final = events.to_frame()
         df_final["Date"] = dateparser_penny_black(df_final["Date"])
         df_final["Date"] = pd.to_datetime(df_final["Date"].str.strip(), errors = "coerce")
         df_final["Date"] = [date + relativedelta(years = 1) if pd.notnull(date) and date < pd.to_datetime(datetime.now().date()) else date for date in df_final["Date"]]
         logger.info(f"{(', '.join(venues)).upper()} completed ({len(df_final)} rows).")
     except Exception as e:
         logger.error(f"{(', '.join(venues)).upper()} failed - {e}")
+    finally:
+        driver_pool.release(driver)
     return(df_final)
\ No newline at end of file
@@ -8,7 +8,6 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 import requests
 import lxml
 import html
@@ -17,8 +16,6 @@ from datetime import datetime
 from datetime import timedelta
 from dateutil.parser import parse
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -26,27 +23,34 @@ from selenium.webdriver.common.keys import Keys
 from src.config import venues
 from src.utlilties.ai_wrappers import openai_dateparser
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.waits import wait_for_network_idle
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.html_parser import parse_document, select, select_one, element_text
+from src.utlilties.tracing import traced
 
 
 # 2. Specify defaults
 # Ticketek is a tricky case in that it know's you're browsing in 'headless' mode.
 # Line 44 seems to get around this issue
 year = str(datetime.today().year)
-options = Options()
-options.add_argument("--disable-infobars")
-options.add_argument("--disable-extensions")
-options.add_argument("start-maximized")
-options.add_argument("--disable-notifications")
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-options.add_argument("--window-size=1920,1080")
-options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+chrome_arguments = [
+    "--disable-infobars",
+    "--disable-extensions",
+    "start-maximized",
+    "--disable-notifications",
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--window-size=1920,1080",
+    "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+]
 venues_ticketek = ["Forum Melbourne", "Hamer Hall", "Sidney Myer Music Bowl"]
 searches = ["Forum Melbourne", "Arts Centre"]
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("date parse", "parse")
 def dateparser_ticketek(dates):
     f'''
         * Date parser specifically for ingesting ticketek event dates.
@@ -90,14 +94,9 @@ def get_events_ticketek():
             - Dataframe object containing preprocessed ticketek events
     '''
     logger.info("TICKETEK started.")
-    driver = webdriver.Chrome(options = options)
-    df_out = pd.DataFrame({
-        "Title": [""],
-        "Date": [""],
-        "Venue": [""],
-        "Link": [""],
-        "Image": [""]
-    })
+    driver = driver_pool.acquire(arguments = chrome_arguments, venue = "Ticketek")
+    df_out = pd.DataFrame(columns = EVENT_COLUMNS)
+    events = EventBuilder(link_prefix = "https://premier.ticketek.com.au")
     try:
         for venue in searches:
             logger.info(f"Extracting Events from '{venue}'")
@@ -107,58 +106,30 @@ def get_events_ticketek():
                 else:
                     base_link = "https://premier.ticketek.com.au/shows/show.aspx?sh=ACM"
                 driver.get(base_link)
-                time.sleep(1)
+                wait_for_network_idle(driver, label = venue)
                 WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CLASS_NAME, "show")))
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                soup = BeautifulSoup(
-                    driver.page_source, "html"
-                )
-                postings = soup.find_all(
-                    "div", {"class": "show"}
-                )
-                df = pd.DataFrame({
-                    "Title": [""],
-                    "Date": [""],
-                    "Venue": [""],
-                    "Link": [""],
-                    "Image": [""]
-                })
+                root = parse_document(driver.page_source)
+                postings = select(root, "div.show")
+                found = len(events)
                 for post in postings:
-                    text = post.find(
-                        "div", {"class": "text-content"}
-                    )
-                    title = text.find("h3").text.strip()
+                    text = select_one(post, "div.text-content")
+                    title = element_text(select_one(text, "h3")).strip()
                     if venue == "Forum Melbourne":
                         ven = venue
                     else:
-                        ven = text.find_all("p")[0].text.strip()
-                    date = text.find_all("p")[-2].text.strip()
-                    link = post.find(
-                        "a", {"class": "btn btn-primary"}
-                    ).get("href")
-                    if link[0] == "/":
-                        link = "https://premier.ticketek.com.au/" + link
-                    image = post.find("img").get("src")
-                    df = pd.concat(
-                        [df, pd.DataFrame({
-                            "Title": title,
-                            "Date": date,
-                            "Venue": ven,
-                            "Link": link,
-                            "Image": image
-                        }, index = [0])], axis = 0
-                    ).reset_index(drop = True)
-                    df = df.reset_index(drop=True)
-                    if len(df[df["Title"] != ""]) == 0:
-                        logger.error(f"Failure to extract events from '{venue}'.")
-                df_out = pd.concat([df_out, df], axis = 0)
-                time.sleep(1)
+                        ven = element_text(select(text, "p")[0]).strip()
+                    date = element_text(select(text, "p")[-2]).strip()
+                    link = select_one(post, "a.btn.btn-primary").get("href")
+                    image = select_one(post, "img").get("src")
+                    events.add(title, date, ven, link = link, image = image)
+                if len(events) == found:
+                    logger.error(f"Failure to extract events from '{venue}'.")
             except:
                 logger.error(f"Failure to extract events from '{venue}'.")
-        df_out = df_out[df_out["Title"] != ""].reset_index(drop=True)
+        df_out = events.to_frame()
         venues_ticketek_alt = [i.lower().replace(" ", "") for i in venues_ticketek]
         df_out["correct_venue_flag"] = [1 if df_out["Venue"][i].lower().replace(" ", "") in venues_ticketek_alt else 0 for i in range(len(df_out))]
-        driver.close()
         df_out = df_out[df_out["correct_venue_flag"] == 1].drop_duplicates().reset_index(drop = True)
         df_out = df_out[[
             "Title",
@@ -190,4 +161,6 @@ def get_events_ticketek():
         logger.info("TICKETEK Completed.")
     except Exception as e:
         logger.error(f"TICKETEK Failed - {e}")
+    finally:
+        driver_pool.release(driver)
     return(df_out)
\ No newline at end of file
@@ -1,14 +1,19 @@
 # 1. Import modules
 import os
 import sys
+import argparse
 ROOT_PATH = "/".join([i for i in os.path.dirname(os.path.abspath(__file__)).split("/")[:-1]])
 sys.path.append(ROOT_PATH)
 os.environ["PYTHONPATH"] = ROOT_PATH
-from src.post_extraction_tasks.clean_and_export import export_events
+from src.post_extraction_tasks.clean_and_export import export_events, run_shard, merge_shards
 from src.post_extraction_tasks.send_email import run_send_email
 from src.utlilties.azure_blob_connection import upload_to_azure_blob_storage
 from src.config import OUTPUT_PATH
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.snapshots import RECORD, REPLAY, configure_snapshots
+from src.utlilties.shard_storage import open_storage, default_run_id, delete_shards
+from src.utlilties.tracing import start_trace, finish_trace, span
+from src.config import SHARD_STORAGE, STREAM_PIPELINE
 from dotenv import load_dotenv
 from datetime import datetime
 
@@ -24,19 +29,57 @@ logger = setup_logging(logger_name = "scraping_logger")
 
 # 3. Execute end-to-end app pipeline
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Scrape, enrich and export Melbourne music events.")
+    parser.add_argument("--force", action = "store_true", help = "Re-scrape every venue, even ones that aren't due.")
+    parser.add_argument("--stream", action = "store_true", default = STREAM_PIPELINE, help = "Extract artists and look them up on Spotify/YouTube while the scrapers are still running.")
+    snapshot_mode = parser.add_mutually_exclusive_group()
+    snapshot_mode.add_argument("--record", nargs = "?", const = "", metavar = "DIR", help = "Save every page and API response to a snapshot directory (today's by default).")
+    snapshot_mode.add_argument("--replay", nargs = "?", const = "", metavar = "DIR", help = "Rerun the pipeline offline from a snapshot directory (the latest by default). Nothing is uploaded or emailed.")
+    # Sharded runs: each replica scrapes its slice and writes it to storage, then one --merge run exports the lot (defaults can come from the job's environment)
+    parser.add_argument("--shard-index", type = int, default = os.environ.get("SHARD_INDEX"), help = "Scrape only this shard (0 to shard count - 1) and write its results to storage.")
+    parser.add_argument("--shard-count", type = int, default = os.environ.get("SHARD_COUNT"), help = "Number of shards the venues are split across.")
+    parser.add_argument("--merge", action = "store_true", help = "Merge every shard's results, then enrich, export, upload and email as usual.")
+    parser.add_argument("--run-id", default = default_run_id(), help = "Groups the shards of one run (SHARD_RUN_ID, or today's date).")
+    parser.add_argument("--storage", default = SHARD_STORAGE, help = "Shard storage: a local directory, or 'azure' for the blob container.")
+    args = parser.parse_args()
+    if (args.shard_index is not None or args.merge) and not args.shard_count:
+        parser.error("--shard-index and --merge need --shard-count.")
+    if args.shard_index is not None and not args.merge and not 0 <= args.shard_index < args.shard_count:
+        parser.error(f"--shard-index must be between 0 and {args.shard_count - 1}.")
+    if args.record is not None:
+        configure_snapshots(RECORD, directory = args.record or None)
+    elif args.replay is not None:
+        configure_snapshots(REPLAY, directory = args.replay or None)
+    # Per-venue, per-stage timings go to data/traces/<timestamp>/trace.json (chrome://tracing or ui.perfetto.dev) and summary.csv
+    start_trace()
     try:
-        export_events()
-        logger.info(f"Uploading '{FILE_NAME}' to Azure container '{CONTAINER_NAME}' ({os.path.getsize(LOCAL_FILE_LOCATION)} bytes).")
-        upload_to_azure_blob_storage(
-            connection_string = CONNECTION_STRING,
-            container_name = CONTAINER_NAME,
-            file_name = FILE_NAME,
-            local_file_path = LOCAL_FILE_LOCATION
-        )
-        logger.info(f"Upload to Azure container '{CONTAINER_NAME}' successful. Sending confirmation email.")
-        for file in ["music_events.csv", "missing_venues.csv"]:
-            run_send_email(file_name = file)
-        logger.info("Successfully sent confirmation")
-        logger.info("Program successfully run!")
+        if args.shard_index is not None and not args.merge:
+            run_shard(args.shard_index, args.shard_count, storage = open_storage(args.storage), run_id = args.run_id, force = args.force)
+            sys.exit(0)
+        storage = open_storage(args.storage) if args.merge else None
+        df_raw = merge_shards(args.shard_count, storage = storage, run_id = args.run_id) if args.merge else None
+        export_events(force = args.force, df_raw = df_raw, stream = args.stream)
+        if args.replay is not None:
+            logger.info("Replay complete. Skipping upload and email.")
+        else:
+            logger.info(f"Uploading '{FILE_NAME}' to Azure container '{CONTAINER_NAME}' ({os.path.getsize(LOCAL_FILE_LOCATION)} bytes).")
+            with span("upload", "io"):
+                upload_to_azure_blob_storage(
+                    connection_string = CONNECTION_STRING,
+                    container_name = CONTAINER_NAME,
+                    file_name = FILE_NAME,
+                    local_file_path = LOCAL_FILE_LOCATION
+                )
+            # The merged events are exported and uploaded, so this run's shards are no longer needed
+            if args.merge:
+                delete_shards(storage, args.run_id, args.shard_count)
+            logger.info(f"Upload to Azure container '{CONTAINER_NAME}' successful. Sending confirmation email.")
+            with span("email", "io"):
+                for file in ["music_events.csv", "missing_venues.csv"]:
+                    run_send_email(file_name = file)
+            logger.info("Successfully sent confirmation")
+            logger.info("Program successfully run!")
     except Exception as e:
-        logger.critical(f"Error in scraping pipeline: {e}") 
\ No newline at end of file
+        logger.critical(f"Error in scraping pipeline: {e}")
+    finally:
+        finish_trace() 
\ No newline at end of file
@@ -15,61 +15,27 @@ import lxml
 import html
 import time
 import os
+import sys
+import queue
+import threading
 from uuid import uuid4
 from datetime import datetime
 from datetime import timedelta
 from dateutil.relativedelta import relativedelta
-from src.event_extraction.eventbrite import get_events_eventbrite
-from src.event_extraction.humanitx import get_events_humanitix
-from src.event_extraction.moshtix import get_events_moshtix
-from src.event_extraction.oztix import get_events_oztix
-from src.event_extraction.ticketek import get_events_ticketek
-from src.event_extraction.bar_303 import get_events_bar_303
-from src.event_extraction.birds_basement import get_events_birds_basement
-from src.event_extraction.cherry_bar import get_events_cherry_bar
-from src.event_extraction.festival_hall import get_events_festival_hall
-from src.event_extraction.forum_melbourne import get_events_forum
-from src.event_extraction.jazzlab import get_events_jazzlab
-from src.event_extraction.mamma_chens import get_events_mamma_chens
-from src.event_extraction.melbourne_recital_centre import get_events_melbourne_recital_centre
-from src.event_extraction.melbourne_park import get_events_melbourne_park
-from src.event_extraction.memo_music_hall import get_events_memo_music_hall
-from src.event_extraction.my_aeon import get_events_my_aeon
-from src.event_extraction.palais_theatre import get_events_palais_theatre
-from src.event_extraction.paris_cat import get_events_paris_cat
-from src.event_extraction.punters_club import get_events_punters_club
-from src.event_extraction.the_penny_black import get_events_penny_black
-from src.event_extraction.twentyfour_moons import get_events_24_moons
-from src.event_extraction.brunswick_ballroom import get_events_brunswick_ballroom
-from src.event_extraction.howler import get_events_howler
-from src.event_extraction.kindred_bandroom import get_events_kindred_bandroom
-from src.event_extraction.northcote_theatre import get_events_northcote_theatre
-from src.event_extraction.russell_street import get_events_170_russell
-from src.event_extraction.the_nightcat import get_events_nightcat
-from src.event_extraction.the_toff import get_events_the_toff
-from src.event_extraction.shotkickers import get_events_shotkickers
-from src.event_extraction.bar_open import get_events_bar_open
-from src.event_extraction.bendigo_hotel import get_events_bendigo_hotel
-from src.event_extraction.bergy_bandroom import get_events_bergy_bandroom
-from src.event_extraction.corner_hotel import get_events_corner_hotel
-from src.event_extraction.croxton_bandroom import get_events_croxton_bandroom
-from src.event_extraction.espy import get_events_espy
-from src.event_extraction.john_curtin import get_events_john_curtin
-from src.event_extraction.max_watts import get_events_max_watts
-from src.event_extraction.northcote_social_club import get_events_northcote_social_club
-from src.event_extraction.prince_bandroom import get_events_prince_bandroom
-from src.event_extraction.the_evelyn_hotel import get_events_the_evelyn
-from src.event_extraction.the_old_bar import get_events_the_old_bar
-from src.event_extraction.the_tote import get_events_the_tote
-from src.event_extraction.the_workers_club import get_events_the_workers_club
-from src.event_extraction.the_retreat import get_events_retreat
-from src.config import OUTPUT_PATH, MIN_SPOTIFY_RANK_FOR_YOUTUBE_API, ARTIST_CERTAINTY_THRESHOLD, BATCH_SIZE, venues, LOOKBACK_DAYS, RECENT_DAYS, EVENT_TITLE_EXCLUSIONS, TRIBUTE_KEYWORDS
+from src.config import OUTPUT_PATH, MIN_SPOTIFY_RANK_FOR_YOUTUBE_API, ARTIST_CERTAINTY_THRESHOLD, BATCH_SIZE, venues, LOOKBACK_DAYS, RECENT_DAYS, EVENT_TITLE_EXCLUSIONS, TRIBUTE_KEYWORDS, MAX_SCRAPER_WORKERS, SCRAPER_TIMEOUT_SECONDS, STREAM_PIPELINE
 from src.utlilties.log_handler import setup_logging
 from src.utlilties.ai_wrappers import openai_artist_extraction
 from src.utlilties.youtube_data_api import search_artist_video
 from src.utlilties.spotify_web_api import get_artist_from_search, get_artist_most_played_track
 from src.utlilties.azure_blob_connection import read_from_azure_blob_storage, show_azure_blobs
 from src.utlilties.utils import flag_tribute_shows, flag_non_events, safe_int
+from src.utlilties.scrape_orchestrator import run_scrapers
+from src.utlilties.scraper_registry import LazyScraper, scraper_module
+from src.utlilties.scrape_scheduler import plan_scrapes, record_scrape
+from src.utlilties.circuit_breaker import check_circuits, record_success, record_failure
+from src.utlilties.snapshots import RECORD, is_replaying, snapshot_mode, replayable
+from src.utlilties.shard_storage import read_shards, write_shard
+from src.utlilties.tracing import span
 from dotenv import load_dotenv
 
 
@@ -82,150 +48,253 @@ MS_BLOB_CONNECTION_STRING = os.environ.get("MS_BLOB_CONNECTION_STRING")
 MS_BLOB_CONTAINER_NAME = os.environ.get("MS_BLOB_CONTAINER_NAME")
 
 
-def get_all_events():
+# Scrapers run by get_all_events, in consolidation order. Each module is only imported when its scraper runs (see scraper_registry).
+# df_moshtix = get_events_moshtix() I've been IP blacklisted from these guys
+# df_oztix = get_events_oztix() Same as above I think...
+# The Retreat Hotel is picked up through its Eventbrite listings, so get_events_retreat is not consolidated.
+SCRAPERS = {
+    # Ticketing websites #
+    "eventbrite": LazyScraper("eventbrite", "get_events_eventbrite"),
+    "humanitix": LazyScraper("humanitx", "get_events_humanitix"),
+
+    # Venue-specific websites
+    "forum": LazyScraper("forum_melbourne", "get_events_forum"),
+    "brunswick_ballroom": LazyScraper("brunswick_ballroom", "get_events_brunswick_ballroom"),
+    "howler": LazyScraper("howler", "get_events_howler"),
+    "kindred_bandroom": LazyScraper("kindred_bandroom", "get_events_kindred_bandroom"),
+    "northcote_theatre": LazyScraper("northcote_theatre", "get_events_northcote_theatre"),
+    "russell_street": LazyScraper("russell_street", "get_events_170_russell"),
+    "the_night_cat": LazyScraper("the_nightcat", "get_events_nightcat"),
+    "the_toff": LazyScraper("the_toff", "get_events_the_toff"),
+    "24_moons": LazyScraper("twentyfour_moons", "get_events_24_moons"),
+    "bar_303": LazyScraper("bar_303", "get_events_bar_303"),
+    "birds_basement": LazyScraper("birds_basement", "get_events_birds_basement"),
+    "cherry_bar": LazyScraper("cherry_bar", "get_events_cherry_bar"),
+    "festival_hall": LazyScraper("festival_hall", "get_events_festival_hall"),
+    "jazzlab": LazyScraper("jazzlab", "get_events_jazzlab"),
+    "mamma_chens": LazyScraper("mamma_chens", "get_events_mamma_chens"),
+    "melbourne_park": LazyScraper("melbourne_park", "get_events_melbourne_park"),
+    "melbourne_recital": LazyScraper("melbourne_recital_centre", "get_events_melbourne_recital_centre"),
+    "memo_music_hall": LazyScraper("memo_music_hall", "get_events_memo_music_hall"),
+    "my_aeon": LazyScraper("my_aeon", "get_events_my_aeon"),
+    "palais_theatre": LazyScraper("palais_theatre", "get_events_palais_theatre"),
+    "paris_cat": LazyScraper("paris_cat", "get_events_paris_cat"),
+    "punters_club": LazyScraper("punters_club", "get_events_punters_club"),
+    "the_penny_black": LazyScraper("the_penny_black", "get_events_penny_black"),
+    "shotkickers": LazyScraper("shotkickers", "get_events_shotkickers"),
+    "bar_open": LazyScraper("bar_open", "get_events_bar_open"),
+    "bendigo_hotel": LazyScraper("bendigo_hotel", "get_events_bendigo_hotel"),
+    "bergy_bandroom": LazyScraper("bergy_bandroom", "get_events_bergy_bandroom"),
+    "corner_hotel": LazyScraper("corner_hotel", "get_events_corner_hotel"),
+    "croxton_bandroom": LazyScraper("croxton_bandroom", "get_events_croxton_bandroom"),
+    "espy": LazyScraper("espy", "get_events_espy"),
+    "john_curtin": LazyScraper("john_curtin", "get_events_john_curtin"),
+    "max_watts": LazyScraper("max_watts", "get_events_max_watts"),
+    "northcote_social_club": LazyScraper("northcote_social_club", "get_events_northcote_social_club"),
+    "prince_bandroom": LazyScraper("prince_bandroom", "get_events_prince_bandroom"),
+    "the_evelyn": LazyScraper("the_evelyn_hotel", "get_events_the_evelyn"),
+    "the_old_bar": LazyScraper("the_old_bar", "get_events_the_old_bar"),
+    "the_tote": LazyScraper("the_tote", "get_events_the_tote"),
+    "the_workers_club": LazyScraper("the_workers_club", "get_events_the_workers_club")
+}
+
+
+# Venue -> reason, for venues whose scraper was skipped (circuit open) or failed in this run. Reported in missing_venues.csv.
+SCRAPE_ISSUES = {}
+
+
+def scraper_venues(scraper):
     '''
-        Concatenates results across various sources, and performs some additional cleaning
+        The venues a scraper covers (its module's `venues` / `venues_*` lists).
     '''
+    module = scraper_module(scraper)
+    names = [name for name in vars(module) if name == "venues" or name.startswith("venues_")]
+    return([venue for name in names for venue in getattr(module, name)])
 
-    # Ticketing websites #
-    # df_moshtix = get_events_moshtix() I've been IP blacklisted from these guys
-    # df_oztix = get_events_oztix() Same as above I think...
-    df_eventbrite = get_events_eventbrite()
-    df_humanitix = get_events_humanitix()
 
-    # Venue-specific websites
-    df_forum = get_events_forum()
-    df_brunswick_ballroom = get_events_brunswick_ballroom()
-    df_howler = get_events_howler()
-    df_kindred_bandroom = get_events_kindred_bandroom()
-    df_northcote_theatre = get_events_northcote_theatre()
-    df_russell_street = get_events_170_russell()
-    df_the_night_cat = get_events_nightcat()
-    df_the_toff = get_events_the_toff()
-    df_24_moons = get_events_24_moons()
-    df_bar_303 = get_events_bar_303()
-    df_birds_basement = get_events_birds_basement()
-    df_cherry_bar = get_events_cherry_bar()
-    df_festival_hall = get_events_festival_hall()
-    df_jazzlab = get_events_jazzlab()
-    df_mamma_chens = get_events_mamma_chens()
-    df_melbourne_park = get_events_melbourne_park()
-    df_melbourne_recital = get_events_melbourne_recital_centre()
-    df_memo_music_hall = get_events_memo_music_hall()
-    df_my_aeon = get_events_my_aeon()
-    df_palais_theatre = get_events_palais_theatre()
-    df_paris_cat = get_events_paris_cat()
-    df_punters_club = get_events_punters_club()
-    df_the_penny_black = get_events_penny_black()
-    df_shotkickers = get_events_shotkickers()
-    df_bar_open = get_events_bar_open()
-    df_bendigo_hotel = get_events_bendigo_hotel()
-    df_bergy_bandroom = get_events_bergy_bandroom()
-    df_corner_hotel = get_events_corner_hotel()
-    df_croxton_bandroom = get_events_croxton_bandroom()
-    df_espy = get_events_espy()
-    df_john_curtin = get_events_john_curtin()
-    df_max_watts = get_events_max_watts()
-    df_northcote_social_club = get_events_northcote_social_club()
-    df_prince_bandroom = get_events_prince_bandroom()
-    df_the_evelyn = get_events_the_evelyn()
-    df_the_old_bar = get_events_the_old_bar()
-    df_the_tote = get_events_the_tote()
-    df_the_workers_club = get_events_the_workers_club()
-    df_the_retreat = get_events_retreat()
+def shard_scrapers(scrapers, shard_index, shard_count):
+    '''
+        The slice of the scrapers one shard (container replica) runs: every shard_count-th scraper, starting at shard_index.
+        Interleaving spreads the slow ticketing sites and Chrome-heavy venues across shards, and every replica works out the same split.
+        INPUT:
+            - scrapers (dict[str, callable]): scraper name -> entry point, in consolidation order.
+            - shard_index (int): this shard, from 0 to shard_count - 1.
+            - shard_count (int): number of shards.
+        OUTPUT:
+            - scrapers (dict[str, callable]): the shard's scrapers, in consolidation order.
+    '''
+    return({name: scraper for i, (name, scraper) in enumerate(scrapers.items()) if i % shard_count == shard_index})
 
 
-    logger.info("Consolidating events from all ticketing websites.")
-    df = pd.concat(
-        [
-            df for df in [
-                df_eventbrite, 
-                df_humanitix, 
-                df_forum,
-                df_brunswick_ballroom,
-                df_howler,
-                df_kindred_bandroom,
-                df_northcote_theatre,
-                df_russell_street,
-                df_the_night_cat,
-                df_the_toff,
-                df_24_moons,
-                df_bar_303,
-                df_birds_basement,
-                df_cherry_bar,
-                df_festival_hall,
-                df_jazzlab,
-                df_mamma_chens,
-                df_melbourne_park,
-                df_melbourne_recital,
-                df_memo_music_hall,
-                df_my_aeon,
-                df_palais_theatre,
-                df_paris_cat,
-                df_punters_club,
-                df_the_penny_black,
-                df_shotkickers,
-                df_bar_open,
-                df_bendigo_hotel,
-                df_bergy_bandroom,
-                df_corner_hotel,
-                df_croxton_bandroom,
-                df_espy,
-                df_john_curtin,
-                df_max_watts,
-                df_northcote_social_club,
-                df_prince_bandroom,
-                df_the_evelyn,
-                df_the_old_bar,
-                df_the_tote,
-                df_the_workers_club
-            ] 
-            if df.shape[0] > 0
-        ],
-        axis = 0
+def scrape_events(scrapers = SCRAPERS, max_workers = MAX_SCRAPER_WORKERS, timeout = SCRAPER_TIMEOUT_SECONDS, force = False, on_result = None):
+    '''
+        Runs the scrapers and collects their events, unconsolidated.
+        Scrapers run concurrently in worker processes (see run_scrapers), so total runtime tracks the slowest venues rather than the sum.
+        With SCRAPE_MODE = "tabs" they share a single Chrome instead, loading venue pages in parallel tabs (see run_scrapers_in_tabs).
+        Only scrapers that are due are run (see scrape_scheduler); the rest contribute their last good rows, unless force = True.
+        Scrapers that keep failing are skipped for a few runs (see circuit_breaker), and reported in missing_venues.csv (via SCRAPE_ISSUES).
+        In --record mode every scraper runs regardless, so the snapshots cover every venue.
+        In --replay mode every scraper runs against its recorded snapshots, and the schedule and circuit breakers are left untouched.
+        INPUT:
+            - scrapers (dict[str, callable]): scraper name -> entry point (all of SCRAPERS, or one shard's slice).
+            - on_result (callable): optional, called with (name, df) for each scraper's rows as soon as they are ready (see stream_players).
+        OUTPUT:
+            - results (dict[str, pd.DataFrame]): scraper name -> events, for every scraper that ran or had rows to reuse.
+    '''
+    replaying = is_replaying()
+    recording = snapshot_mode() == RECORD
+    due, results = plan_scrapes(scrapers, force = force or replaying or recording)
+    if on_result:
+        for name, df in results.items():
+            on_result(name, df)
+    skipped = {} if replaying or recording else check_circuits(list(due))
+    failures = {}
+    scraped = run_scrapers(
+        scrapers = {name: scraper for name, scraper in due.items() if name not in skipped},
+        max_workers = max_workers,
+        timeout = timeout,
+        failures = failures,
+        on_result = on_result
     )
+    for name in due:
+        if name in skipped:
+            continue
+        if name in scraped and scraped[name].shape[0] > 0:
+            if not replaying:
+                record_success(name)
+                record_scrape(name, scraped[name])
+        else:
+            failures.setdefault(name, "No events returned")
+            if not replaying:
+                record_failure(name, failures[name])
+    for name, reason in {**failures, **skipped}.items():
+        for venue in scraper_venues(SCRAPERS[name]):
+            SCRAPE_ISSUES[venue] = reason
+    results.update(scraped)
+    return(results)
+
+
+def clean_events(df):
+    '''
+        Keeps the event columns, drops repeated events and untitled rows, and makes protocol-relative image URLs absolute.
+    '''
     df_out = df[[
         "Title",
         "Date",
         "Venue",
         "Link",
         "Image"
-    ]].sort_values("Date", ascending=True)
+    ]]
     df_out = df_out.drop_duplicates(
         subset = ["Title", "Date", "Venue"], 
         keep = "first"
     ).reset_index(drop=True)
     df_out = df_out[df_out["Title"] != ""].reset_index(drop = True)
     df_out["Image"] = ["https:" + im if im[0:2] == "//" else im for im in df_out["Image"]]
+    return(df_out)
+
+
+def consolidate_events(results):
+    '''
+        Concatenates results across various sources (in SCRAPERS order), and performs some additional cleaning.
+        INPUT:
+            - results (dict[str, pd.DataFrame]): scraper name -> events, from scrape_events (or merged from every shard).
+    '''
+    logger.info("Consolidating events from all ticketing websites.")
+    df = pd.concat(
+        [
+            results[name] for name in SCRAPERS
+            if name in results and results[name].shape[0] > 0
+        ],
+        axis = 0
+    )
+    df_out = clean_events(df.sort_values("Date", ascending=True))
     logger.info("Events successfully consolidated.")
     return(df_out)
 
 
-def embed_players(
-    batch_size = BATCH_SIZE, 
-    artist_certainty_threshold = ARTIST_CERTAINTY_THRESHOLD, 
-    min_spotify_rank_for_youtube_api = MIN_SPOTIFY_RANK_FOR_YOUTUBE_API
-):
-    df_raw = get_all_events()
-    df = df_raw.copy()
-    df["batch"] = [int(np.floor(i / batch_size)) for i in range(len(df))]
-    df_extraction_all = pd.DataFrame()
-    for i in df["batch"].unique():
-        try:
-            df_batch = df[df["batch"] == i].reset_index(drop = True)
-            input_list = [[df_batch["Title"][j], df_batch["Venue"][j]] for j in range(len(df_batch))]
-            logger.info(f"Detecting artists from event titles (batch {i})...")
-            extracted_artists = openai_artist_extraction(input_list)
-            logger.info(f"Artists successfully extracted (batch {i})!")
-            df_extraction = pd.DataFrame(extracted_artists)
-            df_extraction.columns = ["Title", "Artist", "Artist_Certainty"]
-            df_extraction_all = pd.concat([df_extraction_all, df_extraction], axis = 0)
-            time.sleep(0.5)
-        except Exception as e:
-            logger.error(f"Failure to extract artists in batch {i} - {df_batch} \n {extracted_artists} \n {e}")
-            pass
-    logger.info("Extraction Complete!")
-    df_extraction_all = df_extraction_all.reset_index(drop = True)
+def get_all_events(max_workers = MAX_SCRAPER_WORKERS, timeout = SCRAPER_TIMEOUT_SECONDS, force = False):
+    '''
+        Scrapes every venue (see scrape_events) and consolidates the results.
+    '''
+    return(consolidate_events(scrape_events(max_workers = max_workers, timeout = timeout, force = force)))
+
+
+def run_shard(shard_index, shard_count, storage, run_id, force = False):
+    '''
+        Scrapes one shard's slice of the venues (see shard_scrapers) and writes its partial results to storage for merge_shards.
+    '''
+    scrapers = shard_scrapers(SCRAPERS, shard_index, shard_count)
+    logger.info(f"Shard {shard_index + 1}/{shard_count}: scraping {', '.join(scrapers)}.")
+    results = scrape_events(scrapers = scrapers, force = force)
+    write_shard(storage, run_id, shard_index, shard_count, results, dict(SCRAPE_ISSUES))
+
+
+def merge_shards(shard_count, storage, run_id):
+    '''
+        Merge stage of a sharded run: gathers every shard's results and consolidates them, as get_all_events does for a single container.
+        Venues of shards that never reported are recorded in SCRAPE_ISSUES (and so in missing_venues.csv).
+        OUTPUT:
+            - df (pd.DataFrame): consolidated events, ready for export_events(df_raw = df).
+    '''
+    shards = read_shards(storage, run_id, shard_count)
+    results = {}
+    for shard_index in range(shard_count):
+        if shard_index in shards:
+            results.update(shards[shard_index]["results"])
+            SCRAPE_ISSUES.update(shards[shard_index]["issues"])
+            continue
+        for scraper in shard_scrapers(SCRAPERS, shard_index, shard_count).values():
+            for venue in scraper_venues(scraper):
+                SCRAPE_ISSUES[venue] = f"Shard {shard_index + 1}/{shard_count} didn't report"
+    return(consolidate_events(results))
+
+
+EXTRACTION_COLUMNS = ["Title", "Artist", "Artist_Certainty"]
+
+
+def extract_artists(input_list, label):
+    '''
+        Detects the artist in each of a batch of [title, venue] pairs (OpenAI).
+        OUTPUT:
+            - df_extraction (pd.DataFrame): Title, Artist, Artist_Certainty.
+    '''
+    logger.info(f"Detecting artists from event titles ({label})...")
+    extracted_artists = openai_artist_extraction(input_list)
+    logger.info(f"Artists successfully extracted ({label})!")
+    df_extraction = pd.DataFrame(extracted_artists)
+    df_extraction.columns = EXTRACTION_COLUMNS
+    return(df_extraction)
+
+
+def wanted_on_spotify(artist, certainty, artist_certainty_threshold = ARTIST_CERTAINTY_THRESHOLD):
+    '''
+        True if an extracted artist is worth looking up on Spotify (named, and certain enough).
+    '''
+    certainty = 0 if pd.isna(certainty) else certainty
+    return(isinstance(artist, str) and artist not in ["", "N/A"] and safe_int(certainty) > int(artist_certainty_threshold))
+
+
+def lookup_spotify(artist):
+    '''
+        The artist on Spotify (searched as written, then in lower case) merged with their most played track, or None.
+    '''
+    artist_search = get_artist_from_search(artist.strip())
+    if not artist_search:
+        artist_search = get_artist_from_search(artist.strip().lower())
+    if artist_search:
+        artist_most_played_track = get_artist_most_played_track(artist_search["artist_id"])
+        if artist_most_played_track:
+            return(artist_search | artist_most_played_track)
+    return(None)
+
+
+def attach_players(df, df_extraction_all, spotify_artist_list, min_spotify_rank_for_youtube_api = MIN_SPOTIFY_RANK_FOR_YOUTUBE_API, youtube_urls = None):
+    '''
+        Joins the extracted artists and their Spotify details onto the events, and adds a YouTube video for the most followed artists.
+        youtube_urls: artist -> video already looked up (see stream_players); anyone missing is searched here (once per artist).
+    '''
+    youtube_urls = {} if youtube_urls is None else youtube_urls
     df = pd.merge(
         left = df,
         right = df_extraction_all,
@@ -235,19 +304,7 @@ def embed_players(
     df["Artist"] = df["Artist"].fillna("")
     df["Artist_Upper"] = df["Artist"].str.strip().str.upper()
     df["Artist_Certainty"] = df["Artist_Certainty"].fillna(0)
-    spotify_artist_list = []
-    for i in range(len(df)):
-        print(f"Fetching Spotify data for artist: {df['Artist'][i]}")
-        df["Artist_Certainty"] = [safe_int(i) for i in df["Artist_Certainty"]]
-        if (df["Artist"][i] not in ["", "N/A"]) and (int(df["Artist_Certainty"][i]) > int(artist_certainty_threshold)):
-            artist_search = get_artist_from_search(df["Artist"][i].strip())
-            if not artist_search:
-                artist_search = get_artist_from_search(df["Artist"][i].strip().lower())
-            if artist_search:
-                artist_most_played_track = get_artist_most_played_track(artist_search["artist_id"])
-                if artist_most_played_track:
-                    out_dict = artist_search | artist_most_played_track
-                    spotify_artist_list.append(out_dict)
+    df["Artist_Certainty"] = [safe_int(i) for i in df["Artist_Certainty"]]
     df_artist_list = pd.DataFrame(spotify_artist_list)
     df_artist_list["artist_name_upper"] = df_artist_list["artist_name"].str.strip().str.upper()
     df = pd.merge(
@@ -264,14 +321,163 @@ def embed_players(
     for i in range(len(df)):
         if not pd.isna(df["artist_id"][i]):
             if df["followers_rank"][i] <= min_spotify_rank_for_youtube_api:
-                df["youtube_url"][i] = search_artist_video(df["Artist"][i]) 
+                artist = df["Artist"][i]
+                if artist not in youtube_urls:
+                    youtube_urls[artist] = search_artist_video(artist)
+                df["youtube_url"][i] = youtube_urls[artist]
     return(df)
 
 
+def embed_players(
+    batch_size = BATCH_SIZE, 
+    artist_certainty_threshold = ARTIST_CERTAINTY_THRESHOLD, 
+    min_spotify_rank_for_youtube_api = MIN_SPOTIFY_RANK_FOR_YOUTUBE_API,
+    force = False,
+    df_raw = None
+):
+    '''
+        Adds artists (OpenAI), their Spotify top track and a YouTube video to the consolidated events.
+        df_raw: consolidated events to use (e.g. merged from shards) instead of scraping them here.
+    '''
+    if df_raw is None:
+        with span("scrape", "pipeline"):
+            df_raw = get_all_events(force = force)
+    df = df_raw.copy()
+    df["batch"] = [int(np.floor(i / batch_size)) for i in range(len(df))]
+    df_extraction_all = pd.DataFrame(columns = EXTRACTION_COLUMNS)
+    with span("artist extraction", "enrichment", batches = df["batch"].nunique()):
+        for i in df["batch"].unique():
+            try:
+                df_batch = df[df["batch"] == i].reset_index(drop = True)
+                input_list = [[df_batch["Title"][j], df_batch["Venue"][j]] for j in range(len(df_batch))]
+                df_extraction = extract_artists(input_list, f"batch {i}")
+                df_extraction_all = pd.concat([df_extraction_all, df_extraction], axis = 0)
+                time.sleep(0.5)
+            except Exception as e:
+                logger.error(f"Failure to extract artists in batch {i} - {df_batch} \n {e}")
+                pass
+    logger.info("Extraction Complete!")
+    df_extraction_all = df_extraction_all.reset_index(drop = True)
+    spotify_artist_list = []
+    df_matched = df_extraction_all[df_extraction_all["Title"].isin(df["Title"])]
+    artists = {artist for artist, certainty in zip(df_matched["Artist"], df_matched["Artist_Certainty"]) if wanted_on_spotify(artist, certainty, artist_certainty_threshold)}
+    with span("spotify lookups", "enrichment", artists = len(artists)):
+        for artist in sorted(artists):
+            logger.info(f"Fetching Spotify data for artist: {artist}")
+            out_dict = lookup_spotify(artist)
+            if out_dict:
+                spotify_artist_list.append(out_dict)
+    with span("attach players", "enrichment"):
+        return(attach_players(df, df_extraction_all, spotify_artist_list, min_spotify_rank_for_youtube_api))
+
+
+def stream_players(
+    batch_size = BATCH_SIZE,
+    artist_certainty_threshold = ARTIST_CERTAINTY_THRESHOLD,
+    min_spotify_rank_for_youtube_api = MIN_SPOTIFY_RANK_FOR_YOUTUBE_API,
+    force = False
+):
+    '''
+        Streaming version of get_all_events + embed_players (--stream): enrichment runs while the scrapers are still going,
+        so the OpenAI, Spotify and YouTube calls overlap with the browsers instead of waiting for the slowest venue.
+        Each scraper's rows are queued as soon as it finishes (see run_scrapers), and three stages, each in its own thread, consume them at the same time:
+            1. dedup: cleans each venue's rows (see clean_events) and groups (title, venue) pairs not seen before into batches of batch_size.
+            2. artists: runs openai_artist_extraction on each batch, and queues each new artist worth looking up (see wanted_on_spotify).
+            3. players: looks each artist up on Spotify, then on YouTube if they could still make the top min_spotify_rank_for_youtube_api by followers.
+               An artist with that many Spotify artists already ahead of them can't, so is skipped; the rest are looked up speculatively.
+        Once everything has drained, the events are consolidated and the results joined on exactly as in embed_players.
+        In --replay mode this falls back to embed_players, as the batches depend on the order the scrapers happened to finish in.
+    '''
+    if is_replaying():
+        logger.info("Streaming isn't replayable. Running the pipeline in batch mode.")
+        return(embed_players(batch_size, artist_certainty_threshold, min_spotify_rank_for_youtube_api, force = force))
+    events_queue = queue.Queue()
+    batches_queue = queue.Queue()
+    artists_queue = queue.Queue()
+    extractions = []
+    spotify_artist_list = []
+    youtube_urls = {}
+
+    def dedup():
+        seen = set()
+        pending = []
+        try:
+            while (item := events_queue.get()) is not None:
+                name, df = item
+                if df is None or len(df) == 0:
+                    continue
+                for title, venue in clean_events(df)[["Title", "Venue"]].itertuples(index = False):
+                    if (title, venue) not in seen:
+                        seen.add((title, venue))
+                        pending.append([title, venue])
+                while len(pending) >= batch_size:
+                    batches_queue.put(pending[:batch_size])
+                    pending = pending[batch_size:]
+            if pending:
+                batches_queue.put(pending)
+        except Exception as e:
+            logger.error(f"Streaming dedup stage failed - {e}")
+        finally:
+            batches_queue.put(None)
+
+    def artists():
+        queued = set()
+        batch = 0
+        try:
+            while (input_list := batches_queue.get()) is not None:
+                try:
+                    df_extraction = extract_artists(input_list, f"streamed batch {batch}")
+                    extractions.append(df_extraction)
+                    for artist, certainty in zip(df_extraction["Artist"], df_extraction["Artist_Certainty"]):
+                        if artist not in queued and wanted_on_spotify(artist, certainty, artist_certainty_threshold):
+                            queued.add(artist)
+                            artists_queue.put(artist)
+                    time.sleep(0.5)
+                except Exception as e:
+                    logger.error(f"Failure to extract artists in streamed batch {batch} - {input_list} \n {e}")
+                batch += 1
+        finally:
+            artists_queue.put(None)
+
+    def players():
+        followers_seen = []
+        while (artist := artists_queue.get()) is not None:
+            try:
+                logger.info(f"Fetching Spotify data for artist: {artist}")
+                out_dict = lookup_spotify(artist)
+                if not out_dict:
+                    continue
+                spotify_artist_list.append(out_dict)
+                ahead = sum(followers > out_dict["followers"] for followers in followers_seen)
+                followers_seen.append(out_dict["followers"])
+                if ahead < min_spotify_rank_for_youtube_api:
+                    youtube_urls[artist] = search_artist_video(artist)
+            except Exception as e:
+                logger.error(f"Failure to look up '{artist}' on Spotify/YouTube - {e}")
+
+    stages = [threading.Thread(target = stage, name = f"stream-{stage.__name__}", daemon = True) for stage in [dedup, artists, players]]
+    for stage in stages:
+        stage.start()
+    try:
+        with span("scrape", "pipeline"):
+            results = scrape_events(force = force, on_result = lambda name, df: events_queue.put((name, df)))
+    finally:
+        events_queue.put(None)
+        for stage in stages:
+            stage.join()
+    logger.info(f"Streaming stages done: {len(extractions)} artist batches, {len(spotify_artist_list)} Spotify artists, {len(youtube_urls)} YouTube lookups.")
+    df = consolidate_events(results)
+    df_extraction_all = pd.concat([pd.DataFrame(columns = EXTRACTION_COLUMNS)] + extractions, axis = 0).reset_index(drop = True)
+    with span("attach players", "enrichment"):
+        return(attach_players(df, df_extraction_all, spotify_artist_list, min_spotify_rank_for_youtube_api, youtube_urls = youtube_urls))
+
+
 # Get "Just In" gigs
+@replayable("recent_gigs_just_in")
 def recent_gigs_just_in():
     recent_events_df_full = pd.DataFrame()
-    files = sorted(show_azure_blobs(MS_BLOB_CONNECTION_STRING, MS_BLOB_CONTAINER_NAME))
+    # Only the daily exports (music_events_YYYYMMDD.csv), not anything else kept in the container
+    files = sorted(f for f in show_azure_blobs(MS_BLOB_CONNECTION_STRING, MS_BLOB_CONTAINER_NAME) if re.fullmatch(r"music_events_\d+\.csv", f))
     for i in range(1, LOOKBACK_DAYS + 1):
         json_data = read_from_azure_blob_storage(
             connection_string = MS_BLOB_CONNECTION_STRING,
@@ -308,11 +514,17 @@ def recent_gigs_just_in():
     )
 
 
-def export_events(from_date = EVENT_FROM_DATE, to_date = EVENT_TO_DATE):
+def export_events(from_date = EVENT_FROM_DATE, to_date = EVENT_TO_DATE, force = False, df_raw = None, stream = STREAM_PIPELINE):
     '''
         Export output to CSV format
+        force = True re-scrapes every venue, ignoring the scrape schedule.
+        df_raw = consolidated events to enrich and export, when they were scraped elsewhere (see merge_shards).
+        stream = True overlaps enrichment with scraping (see stream_players). Ignored when df_raw is given.
     '''
-    df = embed_players()
+    if stream and df_raw is None:
+        df = stream_players(force = force)
+    else:
+        df = embed_players(force = force, df_raw = df_raw)
     df_recents = recent_gigs_just_in()
     df = pd.merge(
         left = df,
@@ -351,6 +563,7 @@ def export_events(from_date = EVENT_FROM_DATE, to_date = EVENT_TO_DATE):
     df.to_csv(str(OUTPUT_PATH) + "/music_events.csv", index = False)
     missing_venues = [i for i in venues if i not in df["Venue"].unique()]
     df_missing_venues = pd.DataFrame({
-        "Venue": missing_venues
+        "Venue": missing_venues,
+        "Reason": [SCRAPE_ISSUES.get(venue, "") for venue in missing_venues]
     })
     df_missing_venues.to_csv(str(OUTPUT_PATH) + "/missing_venues.csv", index = False)
@@ -11,6 +11,7 @@ import os
 import json
 from datetime import datetime
 from src import config
+from src.utlilties.tracing import traced
 
 
 # Get environment variables
@@ -20,6 +21,7 @@ APP_PWD = os.environ.get("GMAIL_APP_PASSWORD")
 
 
 # Function to send emails
+@traced("smtp send", "io")
 def send_music_event_email(sender, sender_password, receiver, from_date, to_date, file_name = "music_events.csv"):
     msg = MIMEMultipart()
     msg["Subject"] = f"Music Events From {from_date} to {to_date}"
@@ -1,21 +1,32 @@
 # Import libraries
 import os
-from openai import OpenAI
-import openai
+import functools
 from datetime import datetime
 from dotenv import load_dotenv
 import json
 import ast
 from src.config import EVENT_TITLE_EXCLUSIONS, EVENT_TITLE_MODIFICATIONS
+from src.utlilties.snapshots import replayable
+from src.utlilties.tracing import traced
 
 
 # Load openai API key from environment variables
 load_dotenv()
 OPENAI_KEY = os.environ.get("OPENAI_KEY")
 CURRENT_YEAR = str(datetime.now().year)
-client = OpenAI(api_key = OPENAI_KEY)
 
 
+@functools.lru_cache(maxsize = None)
+def get_openai_client():
+    """
+        The OpenAI client, created on first use (the openai package is slow to import, and most scrapers never need it).
+    """
+    from openai import OpenAI
+    return(OpenAI(api_key = OPENAI_KEY))
+
+
+@traced("openai date fallback", "ai")
+@replayable("openai_dateparser")
 def openai_dateparser(date):
     """
         Function which converts a list of raw dates to YYYY-mm-dd format.
@@ -34,7 +45,7 @@ def openai_dateparser(date):
         """
     )
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model = "gpt-4o-mini",
             store = True,
             messages = [
@@ -49,6 +60,8 @@ def openai_dateparser(date):
         return([])
 
 
+@traced("openai artist extraction", "ai")
+@replayable("openai_artist_extraction")
 def openai_artist_extraction(title_list):
     """
         Function with identifies the main artist from a list of event headings (IF there is an artist...).
@@ -76,7 +89,7 @@ def openai_artist_extraction(title_list):
         Respond with only JSON — no explanations, no text.
     """
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model = "gpt-4o-mini",
             store = True,
             messages = [
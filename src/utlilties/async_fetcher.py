@@ -0,0 +1,130 @@
+# Import required modules
+import random
+import asyncio
+import aiohttp
+from src.config import HTTP_HEADERS, HTTP_TIMEOUT_SECONDS, ASYNC_GLOBAL_CONCURRENCY, ASYNC_PER_HOST_CONCURRENCY, ASYNC_MAX_RETRIES, ASYNC_BACKOFF_SECONDS
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.snapshots import HTTP, is_replaying, load_page, record_page
+from src.utlilties.tracing import span
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AsyncFetcher:
+    '''
+        asyncio HTTP client for scrapers that can work over plain HTTP.
+        * One aiohttp session per fetcher, so connections are pooled and kept alive between requests.
+        * The connector caps open connections both overall (global_limit) and per host (per_host_limit); extra requests queue for a free connection.
+        * Failed requests (connection errors, timeouts, 429/5xx) are retried with exponential backoff plus random jitter.
+        * With a cache (HttpCache), requests are conditional and a 304 is answered from the cached body.
+        Usage:
+            async with AsyncFetcher() as fetcher:
+                pages = await fetcher.fetch_all(urls)
+    '''
+
+    def __init__(
+        self,
+        global_limit = ASYNC_GLOBAL_CONCURRENCY,
+        per_host_limit = ASYNC_PER_HOST_CONCURRENCY,
+        max_retries = ASYNC_MAX_RETRIES,
+        backoff = ASYNC_BACKOFF_SECONDS,
+        timeout = HTTP_TIMEOUT_SECONDS,
+        headers = HTTP_HEADERS,
+        cache = None
+    ):
+        self.global_limit = global_limit
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = headers
+        self.cache = cache
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit = self.global_limit,
+            limit_per_host = self.per_host_limit,
+            keepalive_timeout = 30
+        )
+        self.session = aiohttp.ClientSession(
+            connector = connector,
+            headers = self.headers,
+            timeout = aiohttp.ClientTimeout(total = self.timeout)
+        )
+        return(self)
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+
+    async def fetch(self, url):
+        '''
+            GET a single URL, retrying transient failures.
+            Input:
+                * url (str): page to fetch.
+            Output:
+                * text (str): response body.
+        '''
+        for attempt in range(self.max_retries + 1):
+            try:
+                headers = self.cache.conditional_headers(url) if self.cache else {}
+                async with self.session.get(url, headers = headers) as response:
+                    if response.status == 304 and self.cache:
+                        return(self.cache.not_modified(url))
+                    if response.status in RETRY_STATUSES and attempt < self.max_retries:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status = response.status
+                        )
+                    response.raise_for_status()
+                    text = await response.text()
+                    if self.cache:
+                        self.cache.store(url, response.headers, text)
+                    return(text)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.max_retries or (isinstance(e, aiohttp.ClientResponseError) and e.status not in RETRY_STATUSES):
+                    raise
+                delay = self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+                logger.warning(f"Retrying '{url}' in {delay:.1f}s (attempt {attempt + 1}) - {e}")
+                await asyncio.sleep(delay)
+
+    async def fetch_all(self, urls):
+        '''
+            GET several URLs at once.
+            Input:
+                * urls (list[str]): pages to fetch.
+            Output:
+                * pages (list[str | Exception]): response bodies in the same order as urls (the exception, if a URL failed).
+        '''
+        return(await asyncio.gather(*[self.fetch(url) for url in urls], return_exceptions = True))
+
+
+def fetch_pages(urls, **fetcher_kwargs):
+    '''
+        Synchronous entry point, so the (synchronous) get_events_* functions can fetch many pages concurrently.
+        INPUT:
+            - urls (list[str]): pages to fetch.
+            - fetcher_kwargs: passed through to AsyncFetcher (limits, retries, timeout, cache).
+        OUTPUT:
+            - pages (list[str | Exception]): response bodies in the same order as urls (the exception, if a URL failed).
+        Responses are recorded, or replayed without any requests, in --record / --replay mode (see snapshots).
+    '''
+    if is_replaying():
+        pages = []
+        for url in urls:
+            try:
+                pages.append(load_page(url, HTTP))
+            except Exception as e:
+                pages.append(e)
+        return(pages)
+    async def _run():
+        async with AsyncFetcher(**fetcher_kwargs) as fetcher:
+            return(await fetcher.fetch_all(urls))
+    with span("async fetch", "http", pages = len(urls)):
+        pages = asyncio.run(_run())
+    for url, page in zip(urls, pages):
+        record_page(url, page, HTTP)
+    return(pages)
@@ -4,9 +4,11 @@ import os
 import sys
 import csv
 from io import StringIO
+from src.utlilties.tracing import traced
 
 
 # Upload a file to Azure Blob Storage
+@traced("blob upload", "io")
 def upload_to_azure_blob_storage(connection_string, container_name, file_name, local_file_path):
     '''
         Input:
@@ -29,6 +31,7 @@ def upload_to_azure_blob_storage(connection_string, container_name, file_name, l
 
 
 # Read data from Azure blob storage
+@traced("blob read", "io")
 def read_from_azure_blob_storage(connection_string, container_name, file_name):
     '''
         Input:
@@ -47,6 +50,7 @@ def read_from_azure_blob_storage(connection_string, container_name, file_name):
 
 
 # Show a list of blobs in a container
+@traced("blob list", "io")
 def show_azure_blobs(connection_string, container_name):
     '''
         Input:
@@ -62,4 +66,34 @@ def show_azure_blobs(connection_string, container_name):
     blob_list = []
     for b in blobs_raw:
         blob_list.append(b.name)
-    return(blob_list)
\ No newline at end of file
+    return(blob_list)
+
+
+class AzureBlobStorage:
+    '''
+        Blob container holding files by name, with the same interface as shard_storage.LocalStorage.
+    '''
+
+    def __init__(self, connection_string, container_name):
+        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+        self.container_client = blob_service_client.get_container_client(container_name)
+        if not self.container_client.exists():
+            self.container_client.create_container()
+
+    def write(self, name, data):
+        self.container_client.get_blob_client(name).upload_blob(data, overwrite = True)
+
+    def read(self, name):
+        '''
+            OUTPUT:
+                - data (bytes | None): the blob's contents, or None if it doesn't exist.
+        '''
+        blob_client = self.container_client.get_blob_client(name)
+        if not blob_client.exists():
+            return(None)
+        return(blob_client.download_blob().readall())
+
+    def delete(self, name):
+        blob_client = self.container_client.get_blob_client(name)
+        if blob_client.exists():
+            blob_client.delete_blob()
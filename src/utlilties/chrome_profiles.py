@@ -0,0 +1,109 @@
+# Import required modules
+import os
+import fcntl
+import shutil
+from pathlib import Path
+from src.config import CHROME_PROFILES_ENABLED, CHROME_PROFILES_PATH, CHROME_PROFILE_SLOTS, CHROME_DISK_CACHE_MB, CHROME_PROFILE_MAX_MB
+from src.utlilties.log_handler import setup_logging
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+# Lock files Chrome leaves behind in a profile if it is killed rather than quit
+SINGLETON_FILES = ["SingletonLock", "SingletonSocket", "SingletonCookie"]
+# Profile subdirectories that only hold cached downloads, cleared first when a profile is over its size cap
+CACHE_DIRS = ["Default/Cache", "Default/Code Cache", "Default/GPUCache", "Default/Service Worker/CacheStorage", "ShaderCache", "GrShaderCache"]
+
+
+def directory_size_mb(path):
+    '''
+        Total size (MB) of the files under a directory.
+    '''
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return(total / (1024 * 1024))
+
+
+class ChromeProfile:
+    '''
+        A persistent Chrome user-data-dir, held by one browser at a time.
+        * The profile's lock file is flock'ed for as long as the browser runs, so other workers (and other browsers in the same worker) skip it.
+        * The lock is dropped by the OS if the worker is killed, so a hung scraper can't strand a profile.
+    '''
+
+    def __init__(self, path, lock_file):
+        self.path = Path(path)
+        self.lock_file = lock_file
+
+    def arguments(self, disk_cache_mb = CHROME_DISK_CACHE_MB):
+        '''
+            Chrome switches pointing the browser at this profile, with its disk cache capped.
+        '''
+        return([
+            f"--user-data-dir={self.path}",
+            f"--disk-cache-size={disk_cache_mb * 1024 * 1024}"
+        ])
+
+    def evict(self, max_mb = CHROME_PROFILE_MAX_MB):
+        '''
+            Keeps the profile under max_mb: cached downloads are cleared first, then the whole profile if that isn't enough.
+        '''
+        size_mb = directory_size_mb(self.path)
+        if size_mb <= max_mb:
+            return
+        logger.info(f"Chrome profile '{self.path.name}' is {size_mb:.0f}MB (cap {max_mb}MB). Clearing its cache.")
+        for cache_dir in CACHE_DIRS:
+            shutil.rmtree(self.path / cache_dir, ignore_errors = True)
+        if directory_size_mb(self.path) > max_mb:
+            logger.info(f"Chrome profile '{self.path.name}' still over {max_mb}MB. Starting it afresh.")
+            shutil.rmtree(self.path, ignore_errors = True)
+            self.path.mkdir(parents = True, exist_ok = True)
+
+    def release(self):
+        '''
+            Lets another browser use the profile (call once the browser has quit).
+        '''
+        if self.lock_file is None:
+            return
+        fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+        self.lock_file.close()
+        self.lock_file = None
+
+
+def claim_profile(path = CHROME_PROFILES_PATH, slots = CHROME_PROFILE_SLOTS, enabled = CHROME_PROFILES_ENABLED):
+    '''
+        Claims the first free persistent profile, trimming it to its size cap before Chrome starts.
+        The number of slots bounds how many profiles (and so how much disk) there can be: at most slots x CHROME_PROFILE_MAX_MB.
+        INPUT:
+            - path (Path): directory holding the profiles.
+            - slots (int): number of profiles; should cover the most browsers running at once across all workers.
+            - enabled (bool): CHROME_PROFILES_ENABLED.
+        OUTPUT:
+            - profile (ChromeProfile | None): the claimed profile, or None if disabled or every slot is busy (Chrome then uses a throwaway profile).
+    '''
+    if not enabled:
+        return(None)
+    path = Path(path)
+    path.mkdir(parents = True, exist_ok = True)
+    for slot in range(slots):
+        lock_file = open(path / f"profile-{slot}.lock", "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            continue
+        profile = ChromeProfile(path / f"profile-{slot}", lock_file)
+        profile.path.mkdir(parents = True, exist_ok = True)
+        for name in SINGLETON_FILES:
+            try:
+                os.unlink(profile.path / name)
+            except FileNotFoundError:
+                pass
+        profile.evict()
+        return(profile)
+    logger.warning(f"All {slots} Chrome profiles are in use. Starting Chrome with a temporary profile.")
+    return(None)
@@ -0,0 +1,52 @@
+# Import required modules
+from datetime import datetime
+from src.config import CACHE_PATH, CIRCUIT_BREAKER_FAILURES, CIRCUIT_BREAKER_SKIP_RUNS
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.state_store import read_state, update_state
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+CIRCUIT_BREAKER_FILE = CACHE_PATH / "circuit_breaker.json"
+
+
+def check_circuits(names):
+    '''
+        Finds the scrapers whose circuit is open (i.e. that failed too often recently), and counts this run against their skip.
+        INPUT:
+            - names (list[str]): scrapers about to run.
+        OUTPUT:
+            - skipped (dict[str, str]): scraper name -> reason it is being skipped.
+    '''
+    state = read_state(CIRCUIT_BREAKER_FILE)
+    skipped = {}
+    for name in names:
+        entry = state.get(name, {})
+        if entry.get("skip_remaining", 0) > 0:
+            skipped[name] = f"Skipped after {entry['failures']} consecutive failures (last: {entry.get('last_error')})"
+            entry["skip_remaining"] -= 1
+            update_state(CIRCUIT_BREAKER_FILE, name, entry)
+            logger.warning(f"Scraper '{name}' circuit open - skipping ({entry['skip_remaining']} more runs).")
+    return(skipped)
+
+
+def record_success(name):
+    '''
+        Closes a scraper's circuit after a successful run.
+    '''
+    if read_state(CIRCUIT_BREAKER_FILE).get(name, {}).get("failures", 0) > 0:
+        update_state(CIRCUIT_BREAKER_FILE, name, {"failures": 0, "skip_remaining": 0})
+
+
+def record_failure(name, reason, failures = CIRCUIT_BREAKER_FAILURES, skip_runs = CIRCUIT_BREAKER_SKIP_RUNS):
+    '''
+        Counts a failed run (error, timeout or no events). Once a scraper has failed `failures` runs in a row,
+        its circuit opens and it is skipped for the next `skip_runs` runs, after which it gets another try.
+    '''
+    entry = read_state(CIRCUIT_BREAKER_FILE).get(name, {})
+    entry["failures"] = entry.get("failures", 0) + 1
+    entry["last_error"] = reason
+    entry["last_failure"] = datetime.now().isoformat()
+    if entry["failures"] >= failures:
+        entry["skip_remaining"] = skip_runs
+        logger.error(f"Scraper '{name}' has failed {entry['failures']} runs in a row. Skipping it for the next {skip_runs} runs.")
+    update_state(CIRCUIT_BREAKER_FILE, name, entry)
@@ -0,0 +1,32 @@
+# Import required modules
+import re
+import hashlib
+from src.config import CACHE_PATH
+from src.utlilties.html_parser import outer_html
+
+
+CONTENT_HASHES_FILE = CACHE_PATH / "content_hashes.json"
+VOLATILE_ATTRIBUTES = re.compile(r"""\s(?:nonce|data-csrf[\w-]*|data-reactid)\s*=\s*(?:"[^"]*"|'[^']*')""")
+
+
+def normalize_html(html):
+    '''
+        Strips things that change between loads without the listing changing (whitespace, nonces, framework ids).
+    '''
+    html = VOLATILE_ATTRIBUTES.sub("", html)
+    return(" ".join(html.split()))
+
+
+def hash_event_list(cards):
+    '''
+        Fingerprint of a venue's event list, built from the event cards only, so ads, scripts and nonces elsewhere on the page don't change it.
+        INPUT:
+            - cards (list[lxml.html.HtmlElement]): the event card elements, across every page, in page order.
+        OUTPUT:
+            - digest (str): sha256 hex digest of the normalized card HTML.
+    '''
+    digest = hashlib.sha256()
+    for card in cards:
+        digest.update(normalize_html(outer_html(card)).encode("utf-8"))
+        digest.update(b"\n")
+    return(digest.hexdigest())
@@ -0,0 +1,87 @@
+# Import required modules
+import re
+import pandas as pd
+from typing import NamedTuple
+
+
+EVENT_COLUMNS = ["Title", "Date", "Venue", "Link", "Image"]
+URL_SCHEME = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+class EventRecord(NamedTuple):
+    '''
+        One scraped event, in the column order of the events DataFrame (see EVENT_COLUMNS).
+    '''
+    title: str
+    date: str
+    venue: str
+    link: str = ""
+    image: str = ""
+
+
+def normalize_url(url, prefix = ""):
+    '''
+        Turns the links and image sources found in a gig guide into absolute URLs.
+        * "//cdn.site.com/x.jpg" -> "https://cdn.site.com/x.jpg"
+        * "/events/x" -> prefix + "/events/x" (without doubling the slash)
+        * "events/x" -> prefix + "/events/x"
+        * Absolute URLs (and mailto:, data: etc.), fragments and missing values are left as they are ("" for None).
+        INPUT:
+            - url (str | None): href / src as scraped.
+            - prefix (str): site root (or gig guide path) that relative URLs hang off, e.g. "https://thetotehotel.com".
+        OUTPUT:
+            - url (str)
+    '''
+    url = (url or "").strip()
+    if url[:2] == "//":
+        return("https:" + url)
+    if not url or not prefix or url[:1] == "#" or URL_SCHEME.match(url):
+        return(url)
+    if url[:1] == "/":
+        return(prefix.rstrip("/") + url)
+    return(prefix.rstrip("/") + "/" + url)
+
+
+class EventBuilder:
+    '''
+        Collects a scraper's events as EventRecords and builds the DataFrame once at the end.
+        Replaces growing a DataFrame one pd.concat per event (which copies every row each time, and needed a dummy first row).
+        * link_prefix / image_prefix: prepended to relative links / image sources (see normalize_url).
+        * Events without a title are skipped, so there is nothing to filter out afterwards.
+    '''
+
+    __slots__ = ("records", "link_prefix", "image_prefix")
+
+    def __init__(self, link_prefix = "", image_prefix = ""):
+        self.records = []
+        self.link_prefix = link_prefix
+        self.image_prefix = image_prefix
+
+    def __len__(self):
+        return(len(self.records))
+
+    def add(self, title, date, venue, link = None, image = None):
+        '''
+            Adds an event, stripping its title and date and making its link and image absolute.
+            OUTPUT:
+                - added (bool): False if the event was skipped for having no title.
+        '''
+        title = (title or "").strip()
+        date = (date or "").strip()
+        if not title:
+            return(False)
+        self.records.append(EventRecord(
+            title = title,
+            date = date,
+            venue = venue,
+            link = normalize_url(link, self.link_prefix),
+            image = normalize_url(image, self.image_prefix)
+        ))
+        return(True)
+
+    def to_frame(self):
+        '''
+            OUTPUT:
+                - df (pd.DataFrame): one row per event, with EVENT_COLUMNS.
+        '''
+        return(pd.DataFrame(self.records, columns = EVENT_COLUMNS))
@@ -0,0 +1,77 @@
+# Import required modules
+from functools import lru_cache
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+
+# Shared parser: comments are dropped as the tree is built, as nothing reads them
+PARSER = lxml.html.HTMLParser(remove_comments = True, remove_pis = True)
+
+
+@lru_cache(maxsize = None)
+def compile_selector(selector):
+    '''
+        CSS selector translated to XPath and compiled once, then reused for every card on every page.
+    '''
+    return(CSSSelector(selector, translator = "html"))
+
+
+def parse_document(page_source):
+    '''
+        Parses HTML into an lxml tree.
+        The tree stays in C; Python objects are only created for the elements a selector returns, i.e. the event cards and their fields.
+        INPUT:
+            - page_source (str): raw HTML.
+        OUTPUT:
+            - root (lxml.html.HtmlElement | None): document root (None for an empty page).
+    '''
+    if not page_source or not page_source.strip():
+        return(None)
+    try:
+        return(lxml.html.document_fromstring(page_source, parser = PARSER))
+    except (etree.ParserError, ValueError):
+        return(None)
+
+
+def select(element, selector):
+    '''
+        Every element under `element` matching a CSS selector (empty if `element` is None).
+    '''
+    if element is None:
+        return([])
+    return(compile_selector(selector)(element))
+
+
+def select_one(element, selector):
+    '''
+        The first element under `element` matching a CSS selector, or None.
+    '''
+    matches = select(element, selector)
+    return(matches[0] if matches else None)
+
+
+def element_text(element):
+    '''
+        All the text inside an element, like BeautifulSoup's .text.
+    '''
+    return(element.text_content())
+
+
+def outer_html(element):
+    '''
+        An element's HTML, including its own tag (for hashing event cards).
+    '''
+    return(lxml.html.tostring(element, encoding = "unicode"))
+
+
+def select_cards(page_source, card_selector):
+    '''
+        The event cards on a page, found with one compiled selector pass over the lxml tree.
+        INPUT:
+            - page_source (str): raw HTML.
+            - card_selector (str): CSS selector for each event card, e.g. "div.event-container".
+        OUTPUT:
+            - cards (list[lxml.html.HtmlElement]): the matching elements, in document order.
+    '''
+    return(select(parse_document(page_source), card_selector))
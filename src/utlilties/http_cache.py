@@ -0,0 +1,86 @@
+# Import required modules
+import os
+import json
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from src.config import HTTP_CACHE_PATH
+
+
+# URLs that came back "304 Not Modified" in this process
+NOT_MODIFIED = set()
+
+
+class HttpCache:
+    '''
+        Persistent cache of HTTP responses, keyed by URL, for conditional GETs.
+        * Each URL has a JSON file with its ETag / Last-Modified validators, and a file with the last response body.
+        * conditional_headers() gives the If-None-Match / If-Modified-Since headers to send.
+        * On a 304 the cached body is served instead (and the URL is recorded in NOT_MODIFIED), so callers always get the page.
+        * Files are written to a temp path and then atomically replaced, as scrapers run in separate processes.
+    '''
+
+    def __init__(self, path = HTTP_CACHE_PATH):
+        self.path = Path(path)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return(self.path / f"{key}.json", self.path / f"{key}.html")
+
+    def _write(self, path, text):
+        temp_path = str(path) + f".{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding = "utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+    def conditional_headers(self, url):
+        '''
+            Validator headers for a URL (empty if it has never been cached, or its body is missing).
+        '''
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return({})
+        if not body_path.exists():
+            return({})
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return(headers)
+
+    def store(self, url, headers, body):
+        '''
+            Saves a 200 response, if it carries an ETag or Last-Modified header (otherwise there is nothing to revalidate with).
+            INPUT:
+                - url (str): requested URL.
+                - headers (Mapping): response headers.
+                - body (str): response text.
+        '''
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        meta_path, body_path = self._paths(url)
+        self.path.mkdir(parents = True, exist_ok = True)
+        self._write(body_path, body)
+        self._write(meta_path, json.dumps({
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": datetime.now().isoformat()
+        }, indent = 4))
+
+    def not_modified(self, url):
+        '''
+            Handles a 304: records the URL as unchanged and returns the cached body.
+        '''
+        NOT_MODIFIED.add(url)
+        with open(self._paths(url)[1], "r", encoding = "utf-8") as f:
+            return(f.read())
+
+
+http_cache = HttpCache()
@@ -0,0 +1,249 @@
+# Import required modules
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from src.config import CACHE_PATH, CHROME_ARGUMENTS, HTTP_HEADERS, HTTP_TIMEOUT_SECONDS, HTTP_POOL_SIZE
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.state_store import read_state, update_state
+from src.utlilties.async_fetcher import fetch_pages
+from src.utlilties.http_cache import http_cache
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.tab_scheduler import TabScheduler, is_prefetched, store_prefetched, take_prefetched
+from src.utlilties.tracing import span
+from src.utlilties.waits import wait_for_stable_count
+from src.utlilties.snapshots import HTTP as HTTP_SNAPSHOT, is_recorded, is_replaying, load_page, record_page
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+FETCH_PATHS_FILE = CACHE_PATH / "fetch_paths.json"
+HTTP = "http"
+SELENIUM = "selenium"
+
+
+def _build_session(pool_size = HTTP_POOL_SIZE):
+    '''
+        requests Session with a connection pool, so repeat requests to a host reuse the same keep-alive connection.
+    '''
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections = pool_size, pool_maxsize = pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HTTP_HEADERS)
+    return(session)
+
+
+http_session = _build_session()
+
+
+def has_container(page_source, container):
+    '''
+        Checks (without parsing) whether any element in the HTML carries the given class.
+        Input:
+            * page_source (str): raw HTML.
+            * container (str): class name expected on each event card, e.g. "event-container".
+        Output:
+            * (bool)
+    '''
+    pattern = r"""class\s*=\s*["'][^"']*(?<![\w-])""" + re.escape(container) + r"""(?![\w-])"""
+    return(re.search(pattern, page_source) is not None)
+
+
+def has_events(page_source, container, marker = None):
+    '''
+        True if the HTML contains the event cards: either the marker text (when given) or the container class.
+    '''
+    if marker:
+        return(marker in page_source)
+    return(has_container(page_source, container))
+
+
+def fetch_with_http(url, timeout = HTTP_TIMEOUT_SECONDS):
+    '''
+        Conditional GET over the pooled session.
+        If the page hasn't changed since it was cached (304), the cached body is returned.
+        In --replay mode the recorded response is returned instead, without touching the network.
+        Input:
+            * url (str): page to fetch.
+        Output:
+            * page_source (str): response body.
+    '''
+    if is_replaying():
+        return(load_page(url, HTTP_SNAPSHOT))
+    with span("http fetch", "http", url = url):
+        response = http_session.get(url, headers = http_cache.conditional_headers(url), timeout = timeout)
+    if response.status_code == 304:
+        page_source = http_cache.not_modified(url)
+    else:
+        response.raise_for_status()
+        http_cache.store(url, response.headers, response.text)
+        page_source = response.text
+    record_page(url, page_source, HTTP_SNAPSHOT)
+    return(page_source)
+
+
+def fetch_with_selenium(url, container, arguments = CHROME_ARGUMENTS, venue = None, timeout = 10):
+    '''
+        Loads the page in a pooled headless Chrome and waits for the first event card to render.
+        A page already loaded in a tab (see tab_scheduler) is used as it is.
+        Input:
+            * url (str): page to fetch.
+            * container (str): class name expected on each event card.
+            * arguments (list[str]): Chrome switches for the venue.
+            * venue (str): venue name, for its resource-blocking allowlist.
+        Output:
+            * page_source (str): rendered HTML.
+    '''
+    page_source = take_prefetched(url)
+    if page_source is not None:
+        return(page_source)
+    driver = driver_pool.acquire(arguments = arguments, venue = venue)
+    try:
+        driver.get(url)
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CLASS_NAME, container))
+        )
+        wait_for_stable_count(driver, f".{container}")
+        return(driver.page_source)
+    finally:
+        driver_pool.release(driver)
+
+
+def known_fetch_path(venue, url = None):
+    '''
+        The path (HTTP or SELENIUM) recorded for a venue, or None if it hasn't been decided yet.
+        In --replay mode the path comes from the snapshots instead: HTTP if the URL's HTTP response was recorded, otherwise SELENIUM.
+    '''
+    if is_replaying():
+        return(HTTP if is_recorded(url, HTTP_SNAPSHOT) else SELENIUM)
+    return(read_state(FETCH_PATHS_FILE).get(venue))
+
+
+def remember_fetch_path(venue, path):
+    '''
+        Records which path worked for a venue, so later runs go straight to it (left alone in --replay mode).
+    '''
+    if not is_replaying():
+        update_state(FETCH_PATHS_FILE, venue, path)
+
+
+def fetch_page_source(venue, url, container, marker = None, arguments = CHROME_ARGUMENTS):
+    '''
+        Gets the HTML for a venue's gig guide, preferring a plain HTTP GET over headless Chrome.
+        * The HTTP response is used if it already contains the event cards (i.e. the site is server-rendered).
+        * Otherwise the page is rendered in Chrome.
+        * Whichever path worked is recorded per venue, so later runs go straight to it.
+        INPUT:
+            - venue (str): venue name, used as the key for the recorded path.
+            - url (str): page to fetch.
+            - container (str): class name expected on each event card, e.g. "event-container".
+            - marker (str): optional text to look for in the HTTP response instead of the container class (for cards identified by other attributes).
+            - arguments (list[str]): Chrome switches, for when the Selenium path is needed.
+        OUTPUT:
+            - page_source (str): HTML containing the event cards.
+    '''
+    known_path = known_fetch_path(venue, url)
+    if known_path != SELENIUM:
+        try:
+            page_source = fetch_with_http(url)
+            if has_events(page_source, container, marker):
+                if known_path != HTTP:
+                    logger.info(f"'{venue}' is server-rendered. Using plain HTTP from now on.")
+                    remember_fetch_path(venue, HTTP)
+                return(page_source)
+            logger.info(f"No '{container}' elements in the HTTP response for '{venue}'. Using Selenium from now on.")
+            remember_fetch_path(venue, SELENIUM)
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for '{venue}' - {e}. Falling back to Selenium.")
+    return(fetch_with_selenium(url, container, arguments = arguments, venue = venue))
+
+
+def fetch_page_sources(venue, urls, container, marker = None, arguments = CHROME_ARGUMENTS, timeout = 10):
+    '''
+        Multi-page version of fetch_page_source, for paginated gig guides.
+        * Over HTTP, every page is requested at once through the async fetch engine.
+        * In Chrome, the pages are loaded at the same time in tabs of a single pooled browser (see fetch_many_in_tabs).
+        * The first page decides which path the venue uses (and is recorded as with fetch_page_source).
+        INPUT:
+            - venue (str): venue name, used as the key for the recorded path.
+            - urls (list[str]): pages to fetch, first page first.
+            - container (str): class name expected on each event card.
+            - marker (str): optional text to look for in the HTTP response instead of the container class.
+            - arguments (list[str]): Chrome switches, for when the Selenium path is needed.
+        OUTPUT:
+            - page_sources (list[str | None]): HTML for each URL (None where the page could not be loaded).
+    '''
+    known_path = known_fetch_path(venue, urls[0])
+    if known_path != SELENIUM:
+        pages = fetch_pages(urls, cache = http_cache)
+        if isinstance(pages[0], str) and has_events(pages[0], container, marker):
+            if known_path != HTTP:
+                logger.info(f"'{venue}' is server-rendered. Using plain HTTP from now on.")
+                remember_fetch_path(venue, HTTP)
+            return([page if isinstance(page, str) else None for page in pages])
+        if isinstance(pages[0], str):
+            logger.info(f"No '{container}' elements in the HTTP response for '{venue}'. Using Selenium from now on.")
+            remember_fetch_path(venue, SELENIUM)
+        else:
+            logger.warning(f"HTTP fetch failed for '{venue}' - {pages[0]}. Falling back to Selenium.")
+    return(fetch_many_in_tabs(venue, urls, container, arguments = arguments, timeout = timeout))
+
+
+def fetch_many_in_tabs(venue, urls, container, arguments = CHROME_ARGUMENTS, timeout = 10):
+    '''
+        Loads several Chrome-rendered pages at the same time, in tabs of a single pooled browser (see tab_scheduler).
+        Pages that didn't render in their tab (and every page in --replay mode) are then loaded one after another by fetch_many_with_selenium.
+        Output:
+            * page_sources (list[str | None]): rendered HTML for each URL (None where the page could not be loaded).
+    '''
+    pending = [url for url in urls if not is_prefetched(url)]
+    if len(pending) > 1 and not is_replaying():
+        driver = driver_pool.acquire(arguments = arguments, venue = venue)
+        try:
+            with span("tab fetch", "browser", venue = venue, pages = len(pending)):
+                scheduler = TabScheduler(driver)
+                for url in pending:
+                    scheduler.add(url, f".{container}", venue = venue)
+                store_prefetched(scheduler.run())
+        except WebDriverException as e:
+            logger.warning(f"Failure to load '{venue}' pages in tabs - {e}")
+        finally:
+            driver_pool.release(driver)
+    return(fetch_many_with_selenium(venue, urls, container, arguments = arguments, timeout = timeout))
+
+
+def fetch_many_with_selenium(venue, urls, container, arguments = CHROME_ARGUMENTS, timeout = 10):
+    '''
+        Loads several pages one after another in a single pooled Chrome (skipping any already loaded in a tab, see tab_scheduler).
+        Output:
+            * page_sources (list[str | None]): rendered HTML for each URL (None where the page could not be loaded).
+    '''
+    prefetched = [take_prefetched(url) for url in urls]
+    if all(page_source is not None for page_source in prefetched):
+        return(prefetched)
+    page_sources = []
+    driver = driver_pool.acquire(arguments = arguments, venue = venue)
+    try:
+        for url, page_source in zip(urls, prefetched):
+            if page_source is not None:
+                page_sources.append(page_source)
+                continue
+            try:
+                driver.get(url)
+                try:
+                    WebDriverWait(driver, timeout).until(
+                        EC.presence_of_element_located((By.CLASS_NAME, container))
+                    )
+                    wait_for_stable_count(driver, f".{container}")
+                except TimeoutException:
+                    logger.warning(f"No '{container}' elements rendered at '{url}'.")
+                page_sources.append(driver.page_source)
+            except WebDriverException as e:
+                logger.warning(f"Failure to load '{url}' - {e}")
+                page_sources.append(None)
+    finally:
+        driver_pool.release(driver)
+    return(page_sources)
@@ -0,0 +1,96 @@
+# Import required modules
+import re
+from dataclasses import dataclass, field
+from src.config import CHROME_ARGUMENTS, PAGED_MAX_PAGES, ASYNC_PER_HOST_CONCURRENCY
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.async_fetcher import fetch_pages
+from src.utlilties.http_cache import http_cache
+from src.utlilties.page_fetcher import HTTP, has_events, known_fetch_path, fetch_page_source, fetch_many_in_tabs
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+
+
+@dataclass
+class PagedSource:
+    '''
+        A gig guide split over numbered pages.
+        * page_url: URL template with a {page} placeholder, e.g. "https://birdsbasement.com/?page={page}".
+        * first_url: page 1's URL, if it differs from the template (e.g. no page parameter).
+        * container / marker: how to recognise event cards in a page (see page_fetcher.has_events).
+        * last_page_pattern: regex whose first group is a page number in the pagination links, e.g. r"[?&]page=(\\d+)".
+        * max_pages: hard upper bound on pages fetched.
+        * batch_size: pages requested at once when the last page isn't known.
+    '''
+    venue: str
+    page_url: str
+    container: str
+    marker: str = None
+    first_url: str = None
+    last_page_pattern: str = None
+    max_pages: int = PAGED_MAX_PAGES
+    batch_size: int = ASYNC_PER_HOST_CONCURRENCY
+    chrome_arguments: list = field(default_factory = lambda: list(CHROME_ARGUMENTS))
+
+    def url(self, page):
+        if page == 1 and self.first_url:
+            return(self.first_url)
+        return(self.page_url.format(page = page))
+
+    def linked_last_page(self, page_sources):
+        '''
+            Highest page number linked from any of the pages so far (None if there are no pagination links, or no pattern).
+        '''
+        if not self.last_page_pattern:
+            return(None)
+        pages = [int(page) for page_source in page_sources for page in re.findall(self.last_page_pattern, page_source)]
+        return(max(pages) if pages else None)
+
+
+def _fetch_batch(source, urls):
+    '''
+        Fetches several pages at once: concurrently over HTTP if the venue is server-rendered, otherwise in parallel tabs of one pooled Chrome.
+    '''
+    if known_fetch_path(source.venue, urls[0]) == HTTP:
+        return([page if isinstance(page, str) else None for page in fetch_pages(urls, cache = http_cache)])
+    return(fetch_many_in_tabs(source.venue, urls, source.container, arguments = source.chrome_arguments))
+
+
+def fetch_paged(source):
+    '''
+        Gets every page of a paged gig guide.
+        * Page 1 is fetched first (HTTP if possible, see page_fetcher.fetch_page_source), and its pagination links give the last page.
+        * The remaining pages up to that one are then fetched at the same time.
+        * If the links only reach a few pages ahead, the newest page's links are used to find the next batch, and so on.
+        * Without pagination links, pages are fetched batch_size at a time.
+        * Stops at the first page with no event cards, or at max_pages.
+        INPUT:
+            - source (PagedSource): the gig guide.
+        OUTPUT:
+            - pages (dict[str, str]): URL -> HTML, for each page with events, in page order.
+    '''
+    first_page = fetch_page_source(
+        venue = source.venue,
+        url = source.url(1),
+        container = source.container,
+        marker = source.marker,
+        arguments = source.chrome_arguments
+    )
+    pages = {source.url(1): first_page}
+    if not has_events(first_page, source.container, source.marker):
+        return(pages)
+    next_page = 2
+    while next_page <= source.max_pages:
+        last_page = source.linked_last_page(pages.values())
+        if last_page is not None and last_page < next_page:
+            break
+        end = min(last_page if last_page is not None else next_page + source.batch_size - 1, source.max_pages)
+        urls = [source.url(page) for page in range(next_page, end + 1)]
+        logger.info(f"Fetching '{source.venue}' pages {next_page}-{end}.")
+        for url, page_source in zip(urls, _fetch_batch(source, urls)):
+            if page_source is None or not has_events(page_source, source.container, source.marker):
+                logger.info(f"No more events for '{source.venue}' after {len(pages)} pages.")
+                return(pages)
+            pages[url] = page_source
+        next_page = end + 1
+    return(pages)
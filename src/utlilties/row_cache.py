@@ -0,0 +1,45 @@
+# Import required modules
+import os
+import re
+import pandas as pd
+from pathlib import Path
+from src.config import ROWS_CACHE_PATH
+from src.utlilties.log_handler import setup_logging
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+
+
+def _rows_path(venue, path = ROWS_CACHE_PATH):
+    return(Path(path) / (re.sub(r"[^a-z0-9]+", "_", venue.lower()).strip("_") + ".pkl"))
+
+
+def load_rows(venue, path = ROWS_CACHE_PATH):
+    '''
+        The last good (parsed and date-parsed) events for a venue.
+        Input:
+            * venue (str): venue name.
+        Output:
+            * df (pd.DataFrame | None): cached rows, or None if there are none.
+    '''
+    try:
+        return(pd.read_pickle(_rows_path(venue, path)))
+    except Exception:
+        return(None)
+
+
+def save_rows(venue, df, path = ROWS_CACHE_PATH):
+    '''
+        Stores a venue's parsed events so a later run can reuse them when the venue's pages haven't changed.
+        Empty results are not stored, so a failed scrape never replaces good rows.
+    '''
+    if df is None or len(df) == 0:
+        return
+    rows_path = _rows_path(venue, path)
+    rows_path.parent.mkdir(parents = True, exist_ok = True)
+    temp_path = str(rows_path) + f".{os.getpid()}.tmp"
+    try:
+        df.to_pickle(temp_path)
+        os.replace(temp_path, rows_path)
+    except Exception as e:
+        logger.warning(f"Failure to cache rows for '{venue}' - {e}")
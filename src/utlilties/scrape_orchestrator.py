@@ -0,0 +1,169 @@
+# Import required modules
+import time
+import queue
+import multiprocessing
+import psutil
+from src.config import MAX_SCRAPER_WORKERS, SCRAPER_TIMEOUT_SECONDS, SCRAPE_MODE
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.webdriver_pool import driver_pool
+from src.utlilties.waits import log_wait_summary
+from src.utlilties.scraper_registry import scraper_module
+from src.utlilties.snapshots import set_namespace
+from src.utlilties.tracing import span, flush_trace
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+
+
+def _run_scraper(name, scraper, result_queue):
+    '''
+        Entry point for each worker process.
+        Runs a single get_events_* function and sends its output (or the error) back to the parent process.
+        Worker processes exit without running atexit handlers, so the browser pool is shut down (and the trace flushed) explicitly.
+    '''
+    try:
+        with span("scraper", "scraper", venue = name):
+            df = scraper()
+        result_queue.put((name, df, None))
+    except Exception as e:
+        result_queue.put((name, None, repr(e)))
+    finally:
+        log_wait_summary()
+        driver_pool.shutdown()
+        flush_trace()
+
+
+def kill_process_tree(pid):
+    '''
+        Kills a worker process and everything beneath it (chromedriver and its Chrome processes), so a hung browser can't outlive its scraper.
+    '''
+    try:
+        parent = psutil.Process(pid)
+        processes = parent.children(recursive = True) + [parent]
+    except psutil.NoSuchProcess:
+        return
+    for process in processes:
+        try:
+            process.kill()
+        except psutil.NoSuchProcess:
+            pass
+    psutil.wait_procs(processes, timeout = 5)
+
+
+def scraper_specs(scraper):
+    '''
+        The VenueSpecs defined in a scraper's module (none for hand-written scrapers).
+    '''
+    # venue_specs (and the parsing stack behind it) is only needed in tabs mode, so it isn't imported with the orchestrator
+    from src.utlilties.venue_specs import VenueSpec
+    specs = []
+    for value in vars(scraper_module(scraper)).values():
+        if isinstance(value, VenueSpec):
+            specs.append(value)
+        elif isinstance(value, list) and value and all(isinstance(item, VenueSpec) for item in value):
+            specs += value
+    return(specs)
+
+
+def run_scrapers_in_tabs(scrapers, failures = None, on_result = None):
+    '''
+        Single-browser alternative to the worker processes (SCRAPE_MODE = "tabs"), for containers without the memory for a Chrome per scraper.
+        * The Chrome-rendered pages of every spec-driven venue are first loaded together, in tabs of one browser (see venue_specs.prefetch_specs).
+        * The scrapers then run one after another in this process, picking up their prefetched pages and sharing the pooled browser for everything else.
+        * There is no per-scraper timeout in this mode, as a scraper can't be killed without its own process.
+        INPUT / OUTPUT: as for run_scrapers.
+    '''
+    from src.utlilties.venue_specs import prefetch_specs
+    results = {}
+    failures = failures if failures is not None else {}
+    run_start = time.monotonic()
+    prefetched = prefetch_specs([spec for scraper in scrapers.values() for spec in scraper_specs(scraper)])
+    logger.info(f"Prefetched {prefetched} pages in browser tabs ({time.monotonic() - run_start:.1f}s). Running {len(scrapers)} scrapers in turn.")
+    try:
+        for name, scraper in scrapers.items():
+            # Snapshots go where the scraper's worker process would have put them
+            set_namespace(f"scraper-{name}")
+            started = time.monotonic()
+            try:
+                with span("scraper", "scraper", venue = name):
+                    results[name] = scraper()
+                logger.info(f"Scraper '{name}' finished in {time.monotonic() - started:.1f}s ({len(results[name])} rows).")
+                if on_result:
+                    on_result(name, results[name])
+            except Exception as e:
+                logger.error(f"Scraper '{name}' failed after {time.monotonic() - started:.1f}s - {e!r}")
+                failures[name] = repr(e)
+    finally:
+        set_namespace("")
+        log_wait_summary()
+        driver_pool.shutdown()
+    logger.info(f"All scrapers done in {time.monotonic() - run_start:.1f}s ({len(results)}/{len(scrapers)} succeeded).")
+    return(results)
+
+
+def run_scrapers(scrapers, max_workers = MAX_SCRAPER_WORKERS, timeout = SCRAPER_TIMEOUT_SECONDS, failures = None, mode = SCRAPE_MODE, on_result = None):
+    '''
+        Runs the venue scrapers at the same time in a bounded pool of worker processes.
+        Each scraper gets its own process (and therefore its own Chrome), started as soon as a slot frees up.
+        Scrapers that exceed the wall-clock timeout are killed, along with their Chrome process tree, and left out of the results.
+        With mode = "tabs" they share one Chrome in this process instead (see run_scrapers_in_tabs).
+        INPUT:
+            - scrapers (dict[str, callable]): scraper name -> get_events_* function (takes no arguments, returns a DataFrame).
+            - max_workers (int): maximum number of scrapers running at once.
+            - timeout (int): per-scraper wall-clock limit in seconds, measured from when its process starts.
+            - failures (dict): optional, filled with scraper name -> reason for every scraper that errored, timed out or died.
+            - mode (str): "processes" or "tabs" (SCRAPE_MODE).
+            - on_result (callable): optional, called with (name, df) as each scraper finishes, so later stages can start on its rows straight away.
+        OUTPUT:
+            - results (dict[str, pd.DataFrame]): scraper name -> events DataFrame, for every scraper that finished in time.
+    '''
+    if mode == "tabs":
+        return(run_scrapers_in_tabs(scrapers, failures = failures, on_result = on_result))
+    pending = list(scrapers.items())
+    running = {}
+    results = {}
+    failures = failures if failures is not None else {}
+    result_queue = multiprocessing.Queue()
+    run_start = time.monotonic()
+    logger.info(f"Running {len(pending)} scrapers across {max_workers} worker processes (timeout {timeout}s each).")
+    while pending or running:
+        while pending and len(running) < max_workers:
+            name, scraper = pending.pop(0)
+            process = multiprocessing.Process(
+                target = _run_scraper,
+                args = (name, scraper, result_queue),
+                name = f"scraper-{name}"
+            )
+            process.start()
+            running[name] = (process, time.monotonic())
+        try:
+            name, df, error = result_queue.get(timeout = 1)
+            # A worker can queue its result just before it is killed for the timeout or found dead, by which point it's no longer tracked
+            process, started = running.pop(name, (None, None))
+            if process is None:
+                logger.warning(f"Discarding late result from scraper '{name}', which was already stopped.")
+            else:
+                process.join()
+                if error:
+                    logger.error(f"Scraper '{name}' failed after {time.monotonic() - started:.1f}s - {error}")
+                    failures[name] = error
+                else:
+                    results[name] = df
+                    logger.info(f"Scraper '{name}' finished in {time.monotonic() - started:.1f}s ({len(df)} rows).")
+                    if on_result:
+                        on_result(name, df)
+        except queue.Empty:
+            pass
+        for name, (process, started) in list(running.items()):
+            if time.monotonic() - started > timeout:
+                logger.error(f"Scraper '{name}' exceeded {timeout}s. Killing it and its browsers.")
+                kill_process_tree(process.pid)
+                process.join()
+                running.pop(name)
+                failures[name] = f"Timed out after {timeout}s"
+            elif not process.is_alive() and process.exitcode != 0:
+                logger.error(f"Scraper '{name}' worker died (exit code {process.exitcode}).")
+                running.pop(name)
+                failures[name] = f"Worker died (exit code {process.exitcode})"
+    logger.info(f"All scrapers done in {time.monotonic() - run_start:.1f}s ({len(results)}/{len(scrapers)} succeeded).")
+    return(results)
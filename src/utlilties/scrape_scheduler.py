@@ -0,0 +1,89 @@
+# Import required modules
+import hashlib
+import pandas as pd
+from datetime import datetime, timedelta
+from src.config import CACHE_PATH, ROWS_CACHE_PATH, SCHEDULE_INITIAL_INTERVAL_HOURS, SCHEDULE_MIN_INTERVAL_HOURS, SCHEDULE_MAX_INTERVAL_HOURS, SCHEDULE_BACKOFF_FACTOR, SCHEDULE_SLACK_MINUTES
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.state_store import read_state, update_state
+from src.utlilties.row_cache import load_rows, save_rows
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+SCHEDULE_FILE = CACHE_PATH / "scrape_schedule.json"
+SCRAPER_ROWS_PATH = ROWS_CACHE_PATH / "scrapers/"
+
+
+def hash_events(df):
+    '''
+        Fingerprint of a scraper's output (Title, Date, Venue, Link), used to tell whether its listings changed.
+    '''
+    columns = [column for column in ["Title", "Date", "Venue", "Link"] if column in df.columns]
+    rows = df[columns].astype(str).sort_values(columns).to_csv(index = False)
+    return(hashlib.sha256(rows.encode("utf-8")).hexdigest())
+
+
+def is_due(entry, now = None, slack_minutes = SCHEDULE_SLACK_MINUTES):
+    '''
+        True if a scraper's last successful run is older than its current interval, less slack_minutes (or it has never succeeded).
+    '''
+    if not entry or "last_success" not in entry:
+        return(True)
+    now = now or datetime.now()
+    interval = timedelta(hours = entry.get("interval_hours", SCHEDULE_INITIAL_INTERVAL_HOURS)) - timedelta(minutes = slack_minutes)
+    return(now - datetime.fromisoformat(entry["last_success"]) >= interval)
+
+
+def plan_scrapes(scrapers, force = False):
+    '''
+        Splits the scrapers into those due a re-scrape and those whose last good rows can be reused.
+        A scraper with no cached rows is always due.
+        INPUT:
+            - scrapers (dict[str, callable]): scraper name -> get_events_* function.
+            - force (bool): treat every scraper as due.
+        OUTPUT:
+            - due (dict[str, callable]): scrapers to run.
+            - cached (dict[str, pd.DataFrame]): scraper name -> last good rows, for the rest.
+    '''
+    schedule = read_state(SCHEDULE_FILE)
+    due = {}
+    cached = {}
+    for name, scraper in scrapers.items():
+        if not force and not is_due(schedule.get(name)):
+            df = load_rows(name, path = SCRAPER_ROWS_PATH)
+            if df is not None:
+                cached[name] = df
+                continue
+        due[name] = scraper
+    logger.info(f"{len(due)} scrapers due, {len(cached)} reusing their last good rows{' (forced)' if force else ''}.")
+    return(due, cached)
+
+
+def record_scrape(name, df, now = None):
+    '''
+        Updates a scraper's schedule after a successful run, and stores its rows for reuse.
+        * If the listings changed, the interval shrinks back towards SCHEDULE_MIN_INTERVAL_HOURS.
+        * If not, it grows by SCHEDULE_BACKOFF_FACTOR, up to SCHEDULE_MAX_INTERVAL_HOURS.
+        Empty results are treated as failures and leave the schedule (and cached rows) untouched.
+    '''
+    if df is None or len(df) == 0:
+        return
+    now = now or datetime.now()
+    entry = read_state(SCHEDULE_FILE).get(name, {})
+    content_hash = hash_events(df)
+    interval = entry.get("interval_hours", SCHEDULE_INITIAL_INTERVAL_HOURS)
+    changed = content_hash != entry.get("content_hash")
+    if changed:
+        interval = max(SCHEDULE_MIN_INTERVAL_HOURS, interval / SCHEDULE_BACKOFF_FACTOR)
+        entry["last_changed"] = now.isoformat()
+        entry["changes"] = entry.get("changes", 0) + 1
+    else:
+        interval = min(SCHEDULE_MAX_INTERVAL_HOURS, interval * SCHEDULE_BACKOFF_FACTOR)
+    entry.update({
+        "last_success": now.isoformat(),
+        "interval_hours": round(interval, 2),
+        "content_hash": content_hash,
+        "runs": entry.get("runs", 0) + 1
+    })
+    update_state(SCHEDULE_FILE, name, entry)
+    save_rows(name, df, path = SCRAPER_ROWS_PATH)
+    logger.info(f"Scraper '{name}' next due in {interval:.1f}h ({'changed' if changed else 'unchanged'}).")
@@ -0,0 +1,48 @@
+# Import required modules
+import sys
+import importlib
+
+
+EVENT_EXTRACTION_PACKAGE = "src.event_extraction"
+
+
+class LazyScraper:
+    '''
+        Entry point for a venue scraper, imported the first time it is run rather than when the pipeline starts.
+        Each scraper module pulls in selenium, pandas, dateutil, lxml and the API clients, so importing all of them up front
+        made every run (and every worker process) pay for scrapers that weren't due.
+        * module: module name within src/event_extraction, e.g. "the_tote".
+        * function: its get_events_* function, e.g. "get_events_the_tote".
+        Calling the entry point imports the module (once) and runs the function. Entry points pickle as their names, so they can be handed to worker processes.
+    '''
+
+    __slots__ = ("module_name", "function_name")
+
+    def __init__(self, module, function):
+        self.module_name = f"{EVENT_EXTRACTION_PACKAGE}.{module}"
+        self.function_name = function
+
+    def __repr__(self):
+        return(f"LazyScraper('{self.module_name}:{self.function_name}')")
+
+    def module(self):
+        return(importlib.import_module(self.module_name))
+
+    def load(self):
+        '''
+            OUTPUT:
+                - scraper (callable): the get_events_* function.
+        '''
+        return(getattr(self.module(), self.function_name))
+
+    def __call__(self):
+        return(self.load()())
+
+
+def scraper_module(scraper):
+    '''
+        The module a scraper is defined in (imported if it hasn't been yet), for either a LazyScraper or a plain get_events_* function.
+    '''
+    if isinstance(scraper, LazyScraper):
+        return(scraper.module())
+    return(sys.modules[scraper.__module__])
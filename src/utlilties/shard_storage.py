@@ -0,0 +1,115 @@
+# Import required modules
+import os
+import time
+import pickle
+from pathlib import Path
+from datetime import datetime
+from src.config import SHARD_STORAGE, SHARD_CONTAINER_NAME, SHARD_MERGE_TIMEOUT_SECONDS, SHARD_MERGE_POLL_SECONDS
+from src.utlilties.log_handler import setup_logging
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+
+
+class LocalStorage:
+    '''
+        Directory standing in for blob storage, so sharded runs can be tested locally (N shard processes and a merge, all on one machine).
+    '''
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def write(self, name, data):
+        path = self.path / name
+        path.parent.mkdir(parents = True, exist_ok = True)
+        temp_path = str(path) + f".{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def read(self, name):
+        '''
+            OUTPUT:
+                - data (bytes | None): the file's contents, or None if it doesn't exist.
+        '''
+        try:
+            with open(self.path / name, "rb") as f:
+                return(f.read())
+        except FileNotFoundError:
+            return(None)
+
+    def delete(self, name):
+        path = self.path / name
+        path.unlink(missing_ok = True)
+        try:
+            path.parent.rmdir()
+        except OSError:
+            pass
+
+
+def open_storage(location = SHARD_STORAGE):
+    '''
+        Storage for shard results: "azure" for the SHARD_CONTAINER_NAME blob container, otherwise a local directory.
+    '''
+    if location == "azure":
+        from src.utlilties.azure_blob_connection import AzureBlobStorage
+        return(AzureBlobStorage(os.environ.get("MS_BLOB_CONNECTION_STRING"), SHARD_CONTAINER_NAME))
+    return(LocalStorage(location))
+
+
+def default_run_id():
+    '''
+        Identifies the shards of one run: SHARD_RUN_ID if set (e.g. the job execution name), otherwise today's date.
+    '''
+    return(os.environ.get("SHARD_RUN_ID") or datetime.now().strftime("%Y%m%d"))
+
+
+def shard_name(run_id, shard_index, shard_count):
+    return(f"shards/{run_id}/shard-{shard_index:03d}-of-{shard_count:03d}.pkl")
+
+
+def write_shard(storage, run_id, shard_index, shard_count, results, issues):
+    '''
+        Saves one shard's partial results for the merge stage.
+        INPUT:
+            - storage (LocalStorage | AzureBlobStorage): see open_storage.
+            - run_id (str): see default_run_id.
+            - shard_index, shard_count (int): which shard this is.
+            - results (dict[str, pd.DataFrame]): scraper name -> events.
+            - issues (dict[str, str]): venue -> reason, for venues skipped or failed in this shard.
+    '''
+    name = shard_name(run_id, shard_index, shard_count)
+    storage.write(name, pickle.dumps({"results": results, "issues": issues}))
+    logger.info(f"Wrote shard {shard_index + 1}/{shard_count} ({len(results)} scrapers) to '{name}'.")
+
+
+def read_shards(storage, run_id, shard_count, timeout = SHARD_MERGE_TIMEOUT_SECONDS, poll = SHARD_MERGE_POLL_SECONDS):
+    '''
+        Collects every shard's results, waiting (up to the timeout) for shards still running.
+        OUTPUT:
+            - shards (dict[int, dict]): shard index -> {"results": ..., "issues": ...}, for every shard that reported in time.
+    '''
+    shards = {}
+    started = time.monotonic()
+    while True:
+        for shard_index in range(shard_count):
+            if shard_index not in shards:
+                data = storage.read(shard_name(run_id, shard_index, shard_count))
+                if data is not None:
+                    shards[shard_index] = pickle.loads(data)
+        if len(shards) == shard_count or time.monotonic() - started > timeout:
+            break
+        logger.info(f"{len(shards)}/{shard_count} shards of run '{run_id}' written. Waiting for the rest.")
+        time.sleep(poll)
+    if len(shards) < shard_count:
+        logger.error(f"Only {len(shards)}/{shard_count} shards of run '{run_id}' were written within {timeout}s. Merging without the rest.")
+    return(shards)
+
+
+def delete_shards(storage, run_id, shard_count):
+    '''
+        Removes a run's shards once they've been merged and exported, so they don't pile up in storage.
+    '''
+    for shard_index in range(shard_count):
+        storage.delete(shard_name(run_id, shard_index, shard_count))
+    logger.info(f"Deleted the {shard_count} shards of run '{run_id}'.")
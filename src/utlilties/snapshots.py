@@ -0,0 +1,167 @@
+# Import required modules
+import os
+import pickle
+import hashlib
+import functools
+import threading
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from src.config import SNAPSHOTS_PATH
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.state_store import update_state
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+RECORD = "record"
+REPLAY = "replay"
+# Page channels: plain HTTP responses, Chrome page_source reads, and intermediate scroll steps (recorded only, never replayed)
+HTTP = "http"
+BROWSER = "browser"
+SCROLL = "scroll"
+_steps = {}
+_steps_lock = threading.Lock()
+
+
+class SnapshotMissing(Exception):
+    '''
+        Raised in replay mode when a page or API call was never recorded (the live run did something different).
+    '''
+    pass
+
+
+def configure_snapshots(mode, directory = None):
+    '''
+        Turns on recording or replay for this process and the scraper processes it starts (settings travel in environment variables).
+        INPUT:
+            - mode (str): RECORD or REPLAY.
+            - directory (str | Path): snapshot directory. Recording defaults to today's (e.g. data/snapshots/20250301/),
+              replay to the most recent one.
+        OUTPUT:
+            - directory (Path): the snapshot directory in use.
+    '''
+    if directory is None and mode == RECORD:
+        directory = Path(SNAPSHOTS_PATH) / datetime.now().strftime("%Y%m%d")
+    elif directory is None:
+        recorded = sorted(path for path in Path(SNAPSHOTS_PATH).glob("*") if path.is_dir())
+        if not recorded:
+            raise SnapshotMissing(f"No snapshots to replay in {SNAPSHOTS_PATH}. Run with --record first.")
+        directory = recorded[-1]
+    directory = Path(directory)
+    os.environ["SNAPSHOT_MODE"] = mode
+    os.environ["SNAPSHOT_DIR"] = str(directory)
+    logger.info(f"Snapshot {mode} mode, using '{directory}'.")
+    return(directory)
+
+
+def snapshot_mode():
+    '''
+        RECORD, REPLAY or None.
+    '''
+    return(os.environ.get("SNAPSHOT_MODE"))
+
+
+def is_replaying():
+    return(snapshot_mode() == REPLAY)
+
+
+def set_namespace(namespace):
+    '''
+        Groups the following snapshots under `namespace` instead of the process name, and restarts the read counts
+        (used by the benchmarks, which run every scraper in one process).
+    '''
+    os.environ["SNAPSHOT_NAMESPACE"] = namespace
+    with _steps_lock:
+        _steps.clear()
+
+
+def _page_path(url, channel, step):
+    '''
+        Snapshots are grouped by process name (e.g. "scraper-the_tote"), or the namespace set with set_namespace,
+        so scrapers recording the same URL at once don't collide.
+    '''
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+    namespace = os.environ.get("SNAPSHOT_NAMESPACE") or multiprocessing.current_process().name
+    return(Path(os.environ["SNAPSHOT_DIR"]) / namespace / f"{channel}-{key}-{step:03d}.html")
+
+
+def _next_step(url, channel):
+    '''
+        How many times this process has read the URL on this channel (so the Nth read replays the Nth recording).
+    '''
+    with _steps_lock:
+        step = _steps.get((channel, url), 0)
+        _steps[(channel, url)] = step + 1
+    return(step)
+
+
+def save_page(url, page_source, channel):
+    '''
+        Records one read of a page (each page_source read, so "load more" and pagination steps are kept in order).
+    '''
+    path = _page_path(url or "about:blank", channel, _next_step(url or "about:blank", channel))
+    path.parent.mkdir(parents = True, exist_ok = True)
+    path.write_text(page_source or "", encoding = "utf-8")
+    update_state(path.parent / "index.json", path.name, url)
+
+
+def load_page(url, channel):
+    '''
+        The recorded HTML for the next read of a page.
+        OUTPUT:
+            - page_source (str)
+    '''
+    path = _page_path(url or "about:blank", channel, _next_step(url or "about:blank", channel))
+    if not path.exists():
+        raise SnapshotMissing(f"No {channel} snapshot for '{url}' ({path.name}).")
+    return(path.read_text(encoding = "utf-8"))
+
+
+def is_recorded(url, channel):
+    '''
+        True if the next read of a page on this channel was recorded (checked without counting as a read).
+    '''
+    with _steps_lock:
+        step = _steps.get((channel, url or "about:blank"), 0)
+    return(_page_path(url or "about:blank", channel, step).exists())
+
+
+def record_page(url, page_source, channel):
+    '''
+        Saves the page if recording; a no-op otherwise. Recording problems are logged, never raised.
+    '''
+    if snapshot_mode() != RECORD or not isinstance(page_source, str):
+        return
+    try:
+        save_page(url, page_source, channel)
+    except Exception as e:
+        logger.warning(f"Failure to record snapshot of '{url}' - {e}")
+
+
+def replayable(name):
+    '''
+        Decorator for calls to outside services (OpenAI, Spotify, YouTube, Azure), so a replay runs with no network.
+        * Recording: each call's result is pickled under calls/<name>/, keyed by its arguments.
+        * Replay: the recorded result is returned without calling the service (SnapshotMissing if it was never recorded).
+        * Otherwise the function is called as normal.
+    '''
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            mode = snapshot_mode()
+            if mode is None:
+                return(function(*args, **kwargs))
+            key = hashlib.sha1(repr((args, sorted(kwargs.items()))).encode("utf-8")).hexdigest()
+            path = Path(os.environ["SNAPSHOT_DIR"]) / "calls" / name / f"{key}.pkl"
+            if mode == REPLAY:
+                if not path.exists():
+                    raise SnapshotMissing(f"No recorded '{name}' call for {args}.")
+                with open(path, "rb") as f:
+                    return(pickle.load(f))
+            result = function(*args, **kwargs)
+            path.parent.mkdir(parents = True, exist_ok = True)
+            with open(path, "wb") as f:
+                pickle.dump(result, f)
+            return(result)
+        return(wrapper)
+    return(decorator)
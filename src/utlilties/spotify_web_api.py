@@ -1,16 +1,28 @@
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
+import functools
 from dotenv import load_dotenv
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.snapshots import replayable
+from src.utlilties.tracing import traced
 load_dotenv()
 
 
-# Don't need to directly call the environment variables
-# SpotifyClientCredentials takes care of this
-sp = spotipy.Spotify(client_credentials_manager = SpotifyClientCredentials())
 logger = setup_logging("scraping_logger")
 
 
+@functools.lru_cache(maxsize = None)
+def get_spotify():
+    """
+        The Spotify client, created on first use rather than at import (so importing the pipeline doesn't need spotipy or credentials).
+    """
+    import spotipy
+    from spotipy.oauth2 import SpotifyClientCredentials
+    # Don't need to directly call the environment variables
+    # SpotifyClientCredentials takes care of this
+    return(spotipy.Spotify(client_credentials_manager = SpotifyClientCredentials()))
+
+
+@traced("spotify search", "enrichment")
+@replayable("spotify_artist_search")
 def get_artist_from_search(artist_name):
     """
         Searches for an artist in spotify and pick the top match.
@@ -19,7 +31,7 @@ def get_artist_from_search(artist_name):
         Output: matched_artist (dict) -> A dictionary containing high-level data of the mathced artist and a corresponding URI. 
     """
     try:
-        result = sp.search(
+        result = get_spotify().search(
             q = f"artist:{artist_name}", 
             type = "artist", 
             limit = 5
@@ -39,7 +51,7 @@ def get_artist_from_search(artist_name):
             )
         except Exception as e:
             logger.warning(f"Could use artist:{artist_name} to search for artist: {e}")
-            result = sp.search(
+            result = get_spotify().search(
                 q = f"{artist_name}", 
                 type = "artist", 
                 limit = 5
@@ -64,6 +76,8 @@ def get_artist_from_search(artist_name):
         return(None)
 
 
+@traced("spotify top track", "enrichment")
+@replayable("spotify_top_track")
 def get_artist_most_played_track(artist_id):
     """
         Get the most-played song for a Spotify-listed artist.
@@ -72,7 +86,7 @@ def get_artist_most_played_track(artist_id):
         Output: artist_top_track (dic) -> A dictionary containing track metadata, including the player URL.
     """
     try:
-        top_tracks = sp.artist_top_tracks(
+        top_tracks = get_spotify().artist_top_tracks(
             artist_id = artist_id
         )
         if top_tracks["tracks"]:
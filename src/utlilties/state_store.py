@@ -0,0 +1,45 @@
+# Import required modules
+import os
+import json
+import fcntl
+from pathlib import Path
+
+
+def read_state(path):
+    '''
+        Reads a JSON state file, returning an empty dict if it doesn't exist yet (or is unreadable).
+        Input:
+            * path (Path): location of the JSON file.
+        Output:
+            * state (dict): the file's contents.
+    '''
+    try:
+        with open(path, "r") as f:
+            return(json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return({})
+
+
+def update_state(path, key, value):
+    '''
+        Sets a single key in a JSON state file.
+        Scrapers run in separate processes, so the read-modify-write is done under an exclusive file lock,
+        and the file is replaced atomically so readers never see a half-written file.
+        Input:
+            * path (Path): location of the JSON file.
+            * key (str): top-level key to set (usually a venue/scraper name).
+            * value: any JSON-serialisable value.
+        Output:
+            * state (dict): the file's contents after the update.
+    '''
+    path = Path(path)
+    path.parent.mkdir(parents = True, exist_ok = True)
+    with open(str(path) + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        state = read_state(path)
+        state[key] = value
+        temp_path = str(path) + f".{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(state, f, indent = 4, default = str)
+        os.replace(temp_path, path)
+    return(state)
@@ -0,0 +1,155 @@
+# Import required modules
+import re
+import json
+import html
+from dateutil import tz
+from dateutil.parser import isoparse
+from src.config import EVENT_TIMEZONE
+from src.utlilties.log_handler import setup_logging
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+EVENT_TYPES = {"Event", "MusicEvent", "Festival", "TheaterEvent", "ComedyEvent", "DanceEvent", "SocialEvent"}
+ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+JSON_LD_BLOCK = re.compile(r"""<script[^>]*type\s*=\s*["']application/ld\+json["'][^>]*>(.*?)</script>""", re.S | re.I)
+NEXT_DATA_BLOCK = re.compile(r"""<script[^>]*id\s*=\s*["']__NEXT_DATA__["'][^>]*>(.*?)</script>""", re.S | re.I)
+TITLE_KEYS = ["name", "title", "eventName"]
+DATE_KEYS = ["startDate", "start_date", "startsAt", "start", "date"]
+URL_KEYS = ["url", "link", "href", "eventUrl"]
+IMAGE_KEYS = ["image", "imageUrl", "image_url", "thumbnail"]
+# Keys only events carry, which tell them apart from page metadata, posts and news items in a __NEXT_DATA__ blob
+EVENT_KEYS = {"startDate", "start_date", "startsAt", "venue", "venueName", "tickets", "ticketUrl", "ticketsUrl", "ticketLink", "offers", "doors", "doorsOpen", "lineup", "performers"}
+
+
+def _load_json(text, source):
+    '''
+        Parses a <script> block's contents as they are (HTML entities aren't decoded inside <script>, so "&quot;" is literal text there).
+    '''
+    try:
+        return(json.loads(text.strip()))
+    except ValueError as e:
+        logger.warning(f"Failure to parse {source} block - {e}")
+        return(None)
+
+
+def _walk(node):
+    '''
+        Yields every dict nested anywhere inside a JSON document.
+    '''
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk(value)
+
+
+def _first(node, keys):
+    for key in keys:
+        if node.get(key):
+            return(node[key])
+    return(None)
+
+
+def _as_text(value, key = None):
+    '''
+        Flattens schema.org-style values: lists take their first item, objects (ImageObject, Place...) their url/name.
+    '''
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get(key) if key else (value.get("url") or value.get("name"))
+    return(value.strip() if isinstance(value, str) else None)
+
+
+def _local_date(value):
+    '''
+        The calendar date of an ISO 8601 date or datetime, in EVENT_TIMEZONE when it carries a UTC offset
+        (e.g. "2026-10-18T23:30:00-05:00" is the 19th in Melbourne). None if it doesn't parse.
+    '''
+    try:
+        moment = isoparse(value)
+    except (ValueError, OverflowError):
+        return(None)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(tz.gettz(EVENT_TIMEZONE))
+    return(moment.strftime("%Y-%m-%d"))
+
+
+def _to_row(node):
+    '''
+        A row (Title, Date, Link, Image) from an event-like object, or None if it has no title or ISO 8601 start date.
+    '''
+    title = _as_text(_first(node, TITLE_KEYS))
+    date = _as_text(_first(node, DATE_KEYS))
+    date = _local_date(date) if date and ISO_DATE.match(date) else None
+    if not title or not date:
+        return(None)
+    return({
+        "Title": html.unescape(title),
+        "Date": date,
+        "Link": _as_text(_first(node, URL_KEYS)) or "",
+        "Image": _as_text(_first(node, IMAGE_KEYS), key = "url") or ""
+    })
+
+
+def _is_event(node):
+    types = node.get("@type", [])
+    types = types if isinstance(types, list) else [types]
+    return(any(t in EVENT_TYPES for t in types))
+
+
+def _is_event_like(node):
+    '''
+        True for an object typed as an event (@type or GraphQL __typename), or carrying a key only events have (a start date, venue, tickets...).
+    '''
+    return(_is_event(node) or node.get("__typename") in EVENT_TYPES or any(node.get(key) for key in EVENT_KEYS))
+
+
+def extract_json_ld_events(page_source):
+    '''
+        Events described by schema.org Event objects in <script type="application/ld+json"> blocks.
+    '''
+    rows = []
+    for block in JSON_LD_BLOCK.findall(page_source):
+        for node in _walk(_load_json(block, "JSON-LD")):
+            if _is_event(node):
+                row = _to_row(node)
+                if row:
+                    rows.append(row)
+    return(rows)
+
+
+def extract_next_data_events(page_source):
+    '''
+        Events in a Next.js __NEXT_DATA__ hydration blob: event-like objects (see _is_event_like) with a title and an ISO 8601 start date.
+    '''
+    match = NEXT_DATA_BLOCK.search(page_source)
+    if not match:
+        return([])
+    rows = []
+    for node in _walk(_load_json(match.group(1), "__NEXT_DATA__")):
+        row = _to_row(node) if _is_event_like(node) else None
+        if row:
+            rows.append(row)
+    return(rows)
+
+
+def extract_structured_events(page_source):
+    '''
+        Fast path for pages that embed their events as structured data, checked before walking the HTML cards.
+        JSON-LD is preferred, then __NEXT_DATA__. Duplicate (Title, Date) pairs are dropped.
+        INPUT:
+            - page_source (str): raw HTML.
+        OUTPUT:
+            - rows (list[dict]): Title, Date (YYYY-mm-dd, already parsed), Link and Image for each event (empty if the page has none).
+    '''
+    rows = extract_json_ld_events(page_source) or extract_next_data_events(page_source)
+    seen = set()
+    unique_rows = []
+    for row in rows:
+        if (row["Title"], row["Date"]) not in seen:
+            seen.add((row["Title"], row["Date"]))
+            unique_rows.append(row)
+    return(unique_rows)
@@ -0,0 +1,154 @@
+# Import required modules
+import time
+import threading
+from dataclasses import dataclass
+from selenium.common.exceptions import WebDriverException
+from src.config import MAX_BROWSER_TABS, TAB_READY_TIMEOUT_SECONDS, WAIT_POLL_SECONDS, WAIT_SETTLE_SECONDS
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.snapshots import BROWSER, record_page
+from src.utlilties.waits import count_elements, record_wait
+from src.utlilties.webdriver_pool import get_blocked_patterns
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+# URL -> rendered HTML loaded ahead of its scraper, handed over once by take_prefetched
+_prefetched = {}
+_prefetched_lock = threading.Lock()
+
+
+@dataclass
+class TabJob:
+    '''
+        One page loading in its own tab.
+        * ready: CSS selector for the event cards; the page is ready once at least one matches and the count has held for WAIT_SETTLE_SECONDS.
+    '''
+    url: str
+    ready: str
+    venue: str = None
+    handle: str = None
+    started: float = 0
+    count: int = 0
+    stable_since: float = 0
+
+
+class TabScheduler:
+    '''
+        Loads several pages at once in tabs of a single browser.
+        * Each page is navigated without waiting for it to load, so every open tab loads in parallel.
+        * The scheduler cycles through the open tabs, and as soon as one reaches its ready condition its page_source is taken and the tab closed,
+          making room for the next page.
+        * Pages that aren't ready within the timeout are taken as they are if any cards rendered, and dropped (None) otherwise.
+    '''
+
+    def __init__(self, driver, max_tabs = MAX_BROWSER_TABS, timeout = TAB_READY_TIMEOUT_SECONDS, settle = WAIT_SETTLE_SECONDS, poll = WAIT_POLL_SECONDS):
+        self.driver = driver
+        self.max_tabs = max_tabs
+        self.timeout = timeout
+        self.settle = settle
+        self.poll = poll
+        self.pending = []
+        self.open = {}
+        self.home = None
+
+    def add(self, url, ready, venue = None):
+        self.pending.append(TabJob(url = url, ready = ready, venue = venue))
+
+    def _open(self, job):
+        self.driver.switch_to.new_window("tab")
+        job.handle = self.driver.current_window_handle
+        try:
+            self.driver.block_resources(get_blocked_patterns(job.venue))
+        except Exception as e:
+            logger.warning(f"Failure to set up resource blocking for '{job.venue}' - {e}")
+        self.driver.execute_script("window.location.assign(arguments[0]);", job.url)
+        self.driver.pages_loaded += 1
+        job.started = time.monotonic()
+        job.stable_since = job.started
+        self.open[job.handle] = job
+
+    def _close(self, job):
+        '''
+            Closes the job's tab. driver.close() closes whichever tab is current, so it is only called once the switch to this tab is confirmed;
+            otherwise the tab is left open (it goes when the browser is recycled) rather than risk closing the home tab or another venue's.
+            The driver is then pointed back at the home tab, as new tabs can't be opened from a closed one.
+        '''
+        del self.open[job.handle]
+        try:
+            self.driver.switch_to.window(job.handle)
+            if self.driver.current_window_handle == job.handle:
+                self.driver.close()
+            else:
+                logger.warning(f"Failure to switch to the tab for '{job.url}'. Leaving it open.")
+        except WebDriverException as e:
+            logger.warning(f"Failure to close tab for '{job.url}' - {e}")
+        try:
+            self.driver.switch_to.window(self.home)
+        except WebDriverException as e:
+            logger.warning(f"Failure to return to the home tab - {e}")
+
+    def _check(self, job):
+        '''
+            Polls the tab once. OUTPUT: True once the card count has been non-zero and unchanged for `settle` seconds.
+        '''
+        count = count_elements(self.driver, job.ready)
+        if count != job.count:
+            job.count = count
+            job.stable_since = time.monotonic()
+        return(count > 0 and time.monotonic() - job.stable_since >= self.settle)
+
+    def run(self):
+        '''
+            OUTPUT:
+                - page_sources (dict[str, str | None]): URL -> rendered HTML (None where no cards rendered or the tab failed).
+        '''
+        page_sources = {}
+        self.home = self.driver.current_window_handle
+        logger.info(f"Loading {len(self.pending)} pages in up to {self.max_tabs} tabs.")
+        while self.pending or self.open:
+            while self.pending and len(self.open) < self.max_tabs:
+                job = self.pending.pop(0)
+                try:
+                    self._open(job)
+                except WebDriverException as e:
+                    logger.warning(f"Failure to open a tab for '{job.url}' - {e}")
+                    page_sources[job.url] = None
+            for job in list(self.open.values()):
+                try:
+                    self.driver.switch_to.window(job.handle)
+                    ready = self._check(job)
+                    timed_out = time.monotonic() - job.started > self.timeout
+                    if not (ready or timed_out):
+                        continue
+                    record_wait("tab ready", job.ready, job.started, ready)
+                    page_sources[job.url] = self.driver.read_page_source() if job.count > 0 else None
+                except WebDriverException as e:
+                    logger.warning(f"Failure to load '{job.url}' in a tab - {e}")
+                    page_sources[job.url] = None
+                self._close(job)
+            time.sleep(self.poll)
+        self.driver.switch_to.window(self.home)
+        return(page_sources)
+
+
+def store_prefetched(page_sources):
+    '''
+        Keeps rendered pages for take_prefetched (pages that failed to load are left out, so their scraper loads them itself).
+    '''
+    with _prefetched_lock:
+        _prefetched.update({url: page_source for url, page_source in page_sources.items() if page_source})
+
+
+def is_prefetched(url):
+    with _prefetched_lock:
+        return(url in _prefetched)
+
+
+def take_prefetched(url):
+    '''
+        The page loaded ahead of time for a URL, handed over once (and saved as its snapshot when recording). None if it wasn't prefetched.
+    '''
+    with _prefetched_lock:
+        page_source = _prefetched.pop(url, None)
+    if page_source is not None:
+        record_page(url, page_source, BROWSER)
+    return(page_source)
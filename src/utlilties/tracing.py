@@ -0,0 +1,209 @@
+# Import required modules
+import os
+import csv
+import json
+import time
+import atexit
+import functools
+import threading
+import contextvars
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+from src.config import TRACE_ENABLED, TRACES_PATH
+from src.utlilties.log_handler import setup_logging
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+_events = []
+_events_lock = threading.Lock()
+# Venue of the innermost enclosing span that named one, so nested spans (page loads, waits, date parsing) are attributed to it
+_venue = contextvars.ContextVar("trace_venue", default = None)
+# Events buffered before a fork belong to the parent, which writes them itself
+os.register_at_fork(after_in_child = _events.clear)
+
+
+def start_trace(path = TRACES_PATH, enabled = TRACE_ENABLED):
+    '''
+        Starts tracing this run (and the scraper processes it starts, via the TRACE_DIR environment variable).
+        Spans are no-ops until this is called, so imports, benchmarks and tests aren't traced.
+        OUTPUT:
+            - directory (Path | None): this run's trace directory, e.g. data/traces/20250301_060000/.
+    '''
+    if not enabled:
+        return(None)
+    directory = Path(path) / datetime.now().strftime("%Y%m%d_%H%M%S")
+    directory.mkdir(parents = True, exist_ok = True)
+    os.environ["TRACE_DIR"] = str(directory)
+    return(directory)
+
+
+def tracing():
+    return(bool(os.environ.get("TRACE_DIR")))
+
+
+def _now_us():
+    '''
+        Wall-clock microseconds, so spans from different processes line up on one timeline.
+    '''
+    return(time.time_ns() // 1000)
+
+
+def _add(name, cat, started_us, duration_us, args):
+    venue = args.pop("venue", None) or _venue.get()
+    if venue:
+        args["venue"] = venue
+    event = {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": started_us,
+        "dur": duration_us,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": {key: str(value) for key, value in args.items()}
+    }
+    with _events_lock:
+        _events.append(event)
+
+
+@contextmanager
+def span(name, cat = "pipeline", **args):
+    '''
+        Times the enclosed block as a Chrome trace_event "complete" event.
+        INPUT:
+            - name (str): what is being timed, e.g. "page load".
+            - cat (str): category, e.g. "browser", "parse", "ai", "io".
+            - args: details shown in the trace viewer. venue = ... attributes this span, and the spans inside it, to a venue.
+    '''
+    if not tracing():
+        yield
+        return
+    token = _venue.set(args["venue"]) if args.get("venue") else None
+    started = _now_us()
+    try:
+        yield
+    finally:
+        _add(name, cat, started, _now_us() - started, args)
+        if token:
+            _venue.reset(token)
+
+
+def record_span(name, cat, seconds, **args):
+    '''
+        Adds a span that has just finished and lasted `seconds` (for code that already times itself, e.g. the waits).
+    '''
+    if tracing():
+        duration = int(seconds * 1000000)
+        _add(name, cat, _now_us() - duration, duration, args)
+
+
+def traced(name, cat = "pipeline"):
+    '''
+        Decorator form of span, for functions timed on every call (API calls, date parsers).
+    '''
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(name, cat):
+                return(function(*args, **kwargs))
+        return(wrapper)
+    return(decorator)
+
+
+def flush_trace():
+    '''
+        Appends this process's buffered spans to its own file in the trace directory (called when a scraper process ends, and at exit).
+    '''
+    if not tracing():
+        return
+    with _events_lock:
+        events = list(_events)
+        _events.clear()
+    if not events:
+        return
+    process = multiprocessing.current_process().name
+    threads = {thread.ident: thread.name for thread in threading.enumerate()}
+    metadata = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": process}}]
+    metadata += [
+        {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": threads.get(tid, str(tid))}}
+        for tid in {event["tid"] for event in events}
+    ]
+    try:
+        with open(Path(os.environ["TRACE_DIR"]) / f"events-{os.getpid()}.jsonl", "a") as f:
+            for event in metadata + events:
+                f.write(json.dumps(event) + "\n")
+    except OSError as e:
+        logger.warning(f"Failure to write trace events - {e}")
+
+
+def summarise(events):
+    '''
+        Total and self time (excluding nested spans) per venue and span name.
+        OUTPUT:
+            - rows (list[dict]): venue, span, category, count, total / self / max seconds; slowest (by self time) first.
+    '''
+    self_us = {}
+    threads = {}
+    for event in events:
+        threads.setdefault((event["pid"], event["tid"]), []).append(event)
+    for thread_events in threads.values():
+        stack = []
+        for event in sorted(thread_events, key = lambda event: (event["ts"], -event["dur"])):
+            while stack and stack[-1]["ts"] + stack[-1]["dur"] <= event["ts"]:
+                stack.pop()
+            self_us[id(event)] = event["dur"]
+            if stack:
+                self_us[id(stack[-1])] -= event["dur"]
+            stack.append(event)
+    totals = {}
+    for event in events:
+        key = (event["args"].get("venue", ""), event["name"], event["cat"])
+        count, total, own, longest = totals.get(key, (0, 0, 0, 0))
+        totals[key] = (count + 1, total + event["dur"], own + max(self_us[id(event)], 0), max(longest, event["dur"]))
+    rows = [
+        {
+            "venue": venue,
+            "span": name,
+            "category": cat,
+            "count": count,
+            "total_seconds": round(total / 1000000, 3),
+            "self_seconds": round(own / 1000000, 3),
+            "max_seconds": round(longest / 1000000, 3)
+        } for (venue, name, cat), (count, total, own, longest) in totals.items()
+    ]
+    return(sorted(rows, key = lambda row: -row["self_seconds"]))
+
+
+def finish_trace(top = 25):
+    '''
+        Merges every process's spans into trace.json (open in chrome://tracing or https://ui.perfetto.dev),
+        writes summary.csv, and logs the slowest spans.
+        OUTPUT:
+            - trace_path (Path | None)
+    '''
+    if not tracing():
+        return(None)
+    flush_trace()
+    directory = Path(os.environ["TRACE_DIR"])
+    events = []
+    for path in sorted(directory.glob("events-*.jsonl")):
+        with open(path, "r") as f:
+            events += [json.loads(line) for line in f if line.strip()]
+    trace_path = directory / "trace.json"
+    with open(trace_path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    rows = summarise([event for event in events if event["ph"] == "X"])
+    with open(directory / "summary.csv", "w", newline = "") as f:
+        writer = csv.DictWriter(f, fieldnames = ["venue", "span", "category", "count", "total_seconds", "self_seconds", "max_seconds"])
+        writer.writeheader()
+        writer.writerows(rows)
+    logger.info(f"Trace written to '{trace_path}'. Slowest spans (self time):")
+    for row in rows[:top]:
+        logger.info(f"    {row['venue'] or '-':<28}{row['span']:<32}x{row['count']:<5}{row['self_seconds']:>9.2f}s self{row['total_seconds']:>9.2f}s total")
+    return(trace_path)
+
+
+# Spans still buffered when a process exits normally are written out (worker processes flush explicitly, see scrape_orchestrator)
+atexit.register(flush_trace)
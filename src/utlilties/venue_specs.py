@@ -0,0 +1,314 @@
+# Import required modules
+import pandas as pd
+from dataclasses import dataclass, field
+from datetime import datetime
+from dateutil.parser import parse
+from dateutil.relativedelta import relativedelta
+from selenium.common.exceptions import WebDriverException
+from src.config import CHROME_ARGUMENTS
+from src.utlilties.ai_wrappers import openai_dateparser
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.http_cache import NOT_MODIFIED
+from src.utlilties.row_cache import load_rows, save_rows
+from src.utlilties.event_records import EVENT_COLUMNS, EventBuilder
+from src.utlilties.state_store import read_state, update_state
+from src.utlilties.content_hash import CONTENT_HASHES_FILE, hash_event_list
+from src.utlilties.structured_data import extract_structured_events
+from src.utlilties.snapshots import is_replaying
+from src.utlilties.tracing import span, traced
+from src.utlilties.html_parser import select_cards as select_card_elements, select_one, element_text
+from src.utlilties.page_fetcher import SELENIUM, fetch_page_source, fetch_page_sources, known_fetch_path
+from src.utlilties.tab_scheduler import TabScheduler, store_prefetched, take_prefetched
+from src.utlilties.paged_source import PagedSource, fetch_paged
+from src.utlilties.waits import wait_for_elements, wait_for_stable_count, scroll_to_load_all
+from src.utlilties.webdriver_pool import driver_pool
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+
+
+@dataclass
+class Field:
+    '''
+        Where to find one value (title, date, link or image) inside an event card.
+        * selector: CSS selector relative to the card (None for the card element itself), compiled once (see html_parser).
+        * attribute: attribute to read, e.g. "href" or "src" (None for the element's text).
+        * split: optional (separator, index) applied to the value, e.g. ("@", 0) to drop the time from "Fri 1 Mar @ 8pm".
+    '''
+    selector: str = None
+    attribute: str = None
+    split: tuple = None
+
+    def extract(self, card):
+        element = select_one(card, self.selector) if self.selector else card
+        if element is None:
+            return(None)
+        value = element.get(self.attribute) if self.attribute else element_text(element)
+        if value is None:
+            return(None)
+        if self.split:
+            separator, index = self.split
+            value = value.split(separator)[index]
+        return(value.strip())
+
+
+@dataclass
+class VenueSpec:
+    '''
+        Declarative description of a venue's gig guide, run by scrape_venues().
+        * card: CSS selector for each event card.
+        * title, date, link, image: Fields within a card.
+        * urls: gig guide page(s), first page first.
+        * paged: for gig guides with numbered pages, a PagedSource to walk instead of urls (finds the last page itself).
+        * link_prefix: prepended to relative ("/...") links.
+        * container: class name on each card. When given, a plain HTTP GET is tried before Chrome (see page_fetcher).
+        * scroll: scroll the page until no more cards load (infinite-scroll gig guides, Chrome only).
+        * chrome_arguments: Chrome switches for venues that need their own (e.g. a user-agent).
+        * structured_data: use JSON-LD / __NEXT_DATA__ events embedded in the page when it covers every event card (see structured_data).
+    '''
+    venue: str
+    card: str
+    title: Field
+    date: Field
+    urls: list = None
+    link: Field = field(default_factory = lambda: Field("a", attribute = "href"))
+    image: Field = field(default_factory = lambda: Field("img", attribute = "src"))
+    link_prefix: str = ""
+    container: str = None
+    scroll: bool = False
+    chrome_arguments: list = field(default_factory = lambda: list(CHROME_ARGUMENTS))
+    paged: PagedSource = None
+    structured_data: bool = True
+
+
+@traced("date parse", "parse")
+def parse_event_dates(dates, venue):
+    '''
+        * Generic date parser for spec-driven venues (dateutil, falling back to AI).
+        * INPUT:
+            - dates (list[str]): the raw dates extracted from scraping events from the venue.
+            - venue (str): venue name, for logging.
+        * OUTPUT:
+            - parsed_dates (list[str]): parsed dates in YYYY-mm-dd format (though still remains a string).
+    '''
+    parsed_dates = []
+    logger.info(f"Beginning date parsing for {venue.upper()} events.")
+    for date in dates:
+        try:
+            parsed_date = parse(date).strftime("%Y-%m-%d")
+        except Exception as e:
+            logger.warning(f"{e} - Cannot parse '{date}' with dateutils. Using AI instead.")
+            try:
+                parsed_date = openai_dateparser(date)
+            except Exception as ee:
+                logger.warning(f"{ee} - Failure to parse '{date}' using AI. Setting as NaT.")
+                parsed_date = pd.NaT
+        parsed_dates.append(parsed_date)
+    logger.info(f"Completed date parsing for {venue.upper()} events.")
+    return(parsed_dates)
+
+
+def load_pages(spec):
+    '''
+        Gets the HTML for each of a venue's gig guide pages.
+        * Paged venues are walked with paged_source.fetch_paged.
+        * Venues with a container class go through page_fetcher (plain HTTP when the site is server-rendered).
+        * Other venues are rendered in a pooled Chrome, so consecutive specs reuse the same browser (unless already loaded in a tab, see prefetch_specs).
+        OUTPUT:
+            - page_sources (dict[str, str | None]): URL -> HTML, in page order (None where the page could not be loaded).
+    '''
+    if spec.paged:
+        return(fetch_paged(spec.paged))
+    if spec.container:
+        if len(spec.urls) == 1:
+            return({spec.urls[0]: fetch_page_source(
+                venue = spec.venue,
+                url = spec.urls[0],
+                container = spec.container,
+                arguments = spec.chrome_arguments
+            )})
+        return(dict(zip(spec.urls, fetch_page_sources(
+            venue = spec.venue,
+            urls = spec.urls,
+            container = spec.container,
+            arguments = spec.chrome_arguments
+        ))))
+    page_sources = {url: take_prefetched(url) for url in spec.urls}
+    if all(page_source is not None for page_source in page_sources.values()):
+        return(page_sources)
+    driver = driver_pool.acquire(arguments = spec.chrome_arguments, venue = spec.venue)
+    try:
+        for url in spec.urls:
+            if page_sources[url] is not None:
+                continue
+            try:
+                driver.get(url)
+                if wait_for_elements(driver, spec.card) > 0 and spec.scroll:
+                    scroll_to_load_all(driver, card_selector = spec.card, label = spec.venue)
+                wait_for_stable_count(driver, spec.card)
+                page_sources[url] = driver.page_source
+            except WebDriverException as e:
+                logger.warning(f"Failure to load '{url}' - {e}")
+                page_sources[url] = None
+    finally:
+        driver_pool.release(driver)
+    return(page_sources)
+
+
+def prefetch_specs(specs):
+    '''
+        Loads the Chrome-rendered gig guide pages of several venues at once, in tabs of one pooled browser per set of Chrome arguments
+        (see tab_scheduler). The pages are then picked up by load_pages when each venue is scraped.
+        * Skipped: paged and infinite-scroll venues (which need to interact with the page), and venues known to be served over plain HTTP.
+        * Nothing is prefetched in --replay mode.
+        INPUT:
+            - specs (list[VenueSpec]): venues about to be scraped.
+        OUTPUT:
+            - prefetched (int): number of pages loaded.
+    '''
+    if is_replaying():
+        return(0)
+    groups = {}
+    for spec in specs:
+        if spec.paged or spec.scroll or (spec.container and known_fetch_path(spec.venue) != SELENIUM):
+            continue
+        ready = f".{spec.container}" if spec.container else spec.card
+        groups.setdefault(tuple(spec.chrome_arguments), []).extend((url, ready, spec.venue) for url in spec.urls)
+    prefetched = 0
+    for arguments, jobs in groups.items():
+        driver = driver_pool.acquire(arguments = list(arguments))
+        try:
+            with span("tab prefetch", "browser", pages = len(jobs)):
+                scheduler = TabScheduler(driver)
+                for url, ready, venue in jobs:
+                    scheduler.add(url, ready, venue = venue)
+                page_sources = scheduler.run()
+        except WebDriverException as e:
+            logger.warning(f"Failure to prefetch pages in tabs - {e}")
+            page_sources = {}
+        finally:
+            driver_pool.release(driver)
+        store_prefetched(page_sources)
+        prefetched += sum(page_source is not None for page_source in page_sources.values())
+    return(prefetched)
+
+
+def select_cards(spec, page_source):
+    '''
+        The event card elements on a page (lxml elements, see html_parser).
+    '''
+    return(select_card_elements(page_source, spec.card))
+
+
+def extract_rows(spec, cards, events = None):
+    '''
+        Pulls an EventRecord (Title, Date, Venue, Link, Image) out of each event card, in a single pass over the cards.
+        Cards without a title or date are skipped; a missing link or image is left blank.
+        Whitespace (including line breaks between day and month) is collapsed in dates.
+        events: EventBuilder to add the records to, so a venue's pages build one DataFrame (a new one by default).
+        OUTPUT:
+            - records (list[EventRecord]): the records taken from these cards.
+    '''
+    events = events if events is not None else EventBuilder(link_prefix = spec.link_prefix)
+    found = len(events)
+    for card in cards:
+        date = spec.date.extract(card)
+        if not date:
+            continue
+        events.add(
+            title = spec.title.extract(card),
+            date = " ".join(date.split()),
+            venue = spec.venue,
+            link = spec.link.extract(card),
+            image = spec.image.extract(card)
+        )
+    return(events.records[found:])
+
+
+def structured_rows(spec, page_sources):
+    '''
+        Events from structured data embedded in the pages (JSON-LD / __NEXT_DATA__), with dates already in ISO 8601.
+        OUTPUT:
+            - df (pd.DataFrame | None): the events, or None if the pages don't embed any (so the cards are walked instead).
+    '''
+    events = EventBuilder(link_prefix = spec.link_prefix)
+    for page_source in page_sources.values():
+        for row in extract_structured_events(page_source) if page_source else []:
+            events.add(row["Title"], row["Date"], spec.venue, link = row["Link"], image = row["Image"])
+    if len(events) == 0:
+        return(None)
+    logger.info(f"Found {len(events)} structured-data events for '{spec.venue}'.")
+    df = events.to_frame()
+    df["Date"] = pd.to_datetime(df["Date"], errors = "coerce")
+    return(df)
+
+
+def scrape_venues(specs):
+    '''
+        Runs one or more venue specs, sharing pooled browsers between them.
+        Events embedded as structured data are used directly when there are at least as many as there are event cards; otherwise each card is walked and its date parsed.
+        The venue's rows from its last run are reused, skipping extraction and date parsing, when either:
+            * every page came back "304 Not Modified", or
+            * the event cards hash the same as last time (see content_hash), e.g. a Chrome-rendered page that hasn't changed.
+        Neither shortcut is taken (nor the row cache written) in --replay mode, so replays always exercise the parsers.
+        INPUT:
+            - specs (list[VenueSpec]): venues to scrape.
+        OUTPUT:
+            - Dataframe object containing preprocessed events from every venue (Date parsed, past dates rolled into next year).
+    '''
+    df_final = pd.DataFrame(columns = EVENT_COLUMNS)
+    for spec in specs:
+        logger.info(f"{spec.venue.upper()} started.")
+        try:
+            with span("load pages", "browser", spec = spec.venue):
+                page_sources = load_pages(spec)
+            reuse = not is_replaying()
+            if reuse and all(url in NOT_MODIFIED for url in page_sources):
+                df = load_rows(spec.venue)
+                if df is not None:
+                    df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
+                    logger.info(f"{spec.venue.upper()} unchanged since the last run. Reusing {len(df)} cached rows.")
+                    continue
+            with span("structured data", "parse", spec = spec.venue):
+                df = structured_rows(spec, page_sources) if spec.structured_data else None
+            with span("parse cards", "parse", spec = spec.venue):
+                pages = [select_cards(spec, page_source) for page_source in page_sources.values() if page_source is not None]
+            # Pages often embed only a featured or "next" event, so the structured data is only trusted when it covers every card
+            cards_found = sum(len(cards) for cards in pages)
+            if df is not None and len(df) < cards_found:
+                logger.info(f"Only {len(df)} structured-data events for {cards_found} cards at '{spec.venue}'. Walking the cards instead.")
+                df = None
+            content_hash = None
+            if df is None:
+                content_hash = hash_event_list([card for cards in pages for card in cards])
+                if reuse and content_hash == read_state(CONTENT_HASHES_FILE).get(spec.venue):
+                    df = load_rows(spec.venue)
+                    if df is not None:
+                        df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
+                        logger.info(f"{spec.venue.upper()} event list unchanged since the last run. Reusing {len(df)} cached rows.")
+                        continue
+                events = EventBuilder(link_prefix = spec.link_prefix)
+                with span("extract rows", "parse", spec = spec.venue):
+                    for page, cards in enumerate(pages, start = 1):
+                        if len(extract_rows(spec, cards, events)) == 0:
+                            logger.error(f"Failure to extract events from '{spec.venue}' (page {page}).")
+                df = events.to_frame()
+                df["Date"] = parse_event_dates(df["Date"], spec.venue)
+                df["Date"] = pd.to_datetime(df["Date"].astype(str).str.strip(), errors = "coerce")
+                df["Date"] = [date + relativedelta(years = 1) if pd.notnull(date) and date < pd.to_datetime(datetime.now().date()) else date for date in df["Date"]]
+            if len(df) > 0 and reuse:
+                save_rows(spec.venue, df)
+                if content_hash:
+                    update_state(CONTENT_HASHES_FILE, spec.venue, content_hash)
+            df_final = pd.concat([df_final, df], axis = 0).reset_index(drop = True)
+            logger.info(f"{spec.venue.upper()} completed ({len(df)} rows).")
+        except Exception as e:
+            logger.error(f"{spec.venue.upper()} failed - {e}")
+    return(df_final)
+
+
+def scrape_venue(spec):
+    '''
+        Runs a single venue spec (see scrape_venues).
+    '''
+    return(scrape_venues([spec]))
@@ -0,0 +1,238 @@
+# Import required modules
+import time
+from src.config import WAIT_TIMEOUTS, WAIT_POLL_SECONDS, WAIT_SETTLE_SECONDS, SCROLL_MAX_CARDS, SCROLL_MAX_SCROLLS
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.tracing import record_span
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+WAIT_TIMINGS = []
+SCROLL_STATS = []
+
+
+def record_wait(condition, label, started, met):
+    '''
+        Logs and stores how long a wait actually took, so slow venues/conditions stand out.
+        Also used for waits polled outside this module (e.g. the tab scheduler's), so they show up in the same summary.
+    '''
+    elapsed = time.monotonic() - started
+    WAIT_TIMINGS.append({
+        "condition": condition,
+        "label": label,
+        "seconds": round(elapsed, 3),
+        "met": met
+    })
+    record_span(f"wait: {condition}", "wait", elapsed, label = label, met = met)
+    if met:
+        logger.info(f"Waited {elapsed:.2f}s for {condition} ({label}).")
+    else:
+        logger.warning(f"Gave up waiting for {condition} ({label}) after {elapsed:.2f}s.")
+    return(elapsed)
+
+
+def count_elements(driver, css_selector):
+    '''
+        Number of elements in the current page matching a CSS selector.
+    '''
+    return(driver.execute_script("return document.querySelectorAll(arguments[0]).length;", css_selector))
+
+
+def page_height(driver):
+    '''
+        Current scroll height of the page.
+    '''
+    return(driver.execute_script("return document.body.scrollHeight;"))
+
+
+def _replaying(driver):
+    '''
+        True for the --replay stand-in browser, whose pages are already fully loaded, so waits return straight away.
+    '''
+    return(getattr(driver, "replaying", False))
+
+
+def _wait_for_growth(measure, previous, condition, label, timeout, poll):
+    '''
+        Polls measure() until it returns more than previous, or the timeout passes.
+    '''
+    started = time.monotonic()
+    value = measure()
+    while value <= previous and time.monotonic() - started < timeout:
+        time.sleep(poll)
+        value = measure()
+    record_wait(condition, label, started, value > previous)
+    return(value)
+
+
+def wait_for_elements(driver, css_selector, timeout = WAIT_TIMEOUTS["elements"], poll = WAIT_POLL_SECONDS):
+    '''
+        Waits until at least one element matches the selector.
+        INPUT:
+            - driver (WebDriver): browser on the page being scraped.
+            - css_selector (str): selector for the event cards, e.g. "div.event-container".
+            - timeout (float): ceiling in seconds.
+        OUTPUT:
+            - count (int): number of matching elements when the wait ended.
+    '''
+    if _replaying(driver):
+        return(1)
+    started = time.monotonic()
+    count = count_elements(driver, css_selector)
+    while count == 0 and time.monotonic() - started < timeout:
+        time.sleep(poll)
+        count = count_elements(driver, css_selector)
+    record_wait("elements", css_selector, started, count > 0)
+    return(count)
+
+
+def wait_for_count_growth(driver, css_selector, previous_count, timeout = WAIT_TIMEOUTS["count_growth"], poll = WAIT_POLL_SECONDS):
+    '''
+        Waits until more elements match the selector than before (e.g. after clicking "load more" or scrolling).
+        INPUT:
+            - driver (WebDriver): browser on the page being scraped.
+            - css_selector (str): selector for the event cards.
+            - previous_count (int): number of cards before the action.
+            - timeout (float): ceiling in seconds.
+        OUTPUT:
+            - count (int): number of matching elements when the wait ended (== previous_count if nothing new loaded).
+    '''
+    if _replaying(driver):
+        return(previous_count + 1)
+    return(_wait_for_growth(
+        measure = lambda: count_elements(driver, css_selector),
+        previous = previous_count,
+        condition = "count growth",
+        label = css_selector,
+        timeout = timeout,
+        poll = poll
+    ))
+
+
+def wait_for_stable_count(driver, css_selector, settle = WAIT_SETTLE_SECONDS, timeout = WAIT_TIMEOUTS["stable_count"], poll = WAIT_POLL_SECONDS):
+    '''
+        Waits until at least one element matches the selector and the count has stopped changing for `settle` seconds,
+        i.e. the page has finished rendering its event list.
+        INPUT:
+            - driver (WebDriver): browser on the page being scraped.
+            - css_selector (str): selector for the event cards.
+            - settle (float): how long the count must hold steady.
+            - timeout (float): ceiling in seconds.
+        OUTPUT:
+            - count (int): number of matching elements when the wait ended.
+    '''
+    if _replaying(driver):
+        return(1)
+    started = time.monotonic()
+    count = count_elements(driver, css_selector)
+    stable_since = time.monotonic()
+    while time.monotonic() - started < timeout:
+        if count > 0 and time.monotonic() - stable_since >= settle:
+            break
+        time.sleep(poll)
+        new_count = count_elements(driver, css_selector)
+        if new_count != count:
+            count = new_count
+            stable_since = time.monotonic()
+    record_wait("stable count", css_selector, started, count > 0 and time.monotonic() - stable_since >= settle)
+    return(count)
+
+
+def wait_for_network_idle(driver, label = "", settle = WAIT_SETTLE_SECONDS, timeout = WAIT_TIMEOUTS["network_idle"], poll = WAIT_POLL_SECONDS):
+    '''
+        Waits until the document has loaded and no new network requests have started for `settle` seconds.
+        Useful after actions (search, clicks) where there's no obvious element count to watch.
+        INPUT:
+            - driver (WebDriver): browser on the page being scraped.
+            - label (str): what is being waited on, for the timing log.
+            - settle (float): how long the network must stay quiet.
+            - timeout (float): ceiling in seconds.
+        OUTPUT:
+            - elapsed (float): seconds actually waited.
+    '''
+    if _replaying(driver):
+        return(0)
+    script = "return [document.readyState, performance.getEntriesByType('resource').length];"
+    started = time.monotonic()
+    state, requests = driver.execute_script(script)
+    quiet_since = time.monotonic()
+    while time.monotonic() - started < timeout:
+        if state == "complete" and time.monotonic() - quiet_since >= settle:
+            break
+        time.sleep(poll)
+        state, new_requests = driver.execute_script(script)
+        if new_requests != requests:
+            requests = new_requests
+            quiet_since = time.monotonic()
+    return(record_wait("network idle", label, started, state == "complete" and time.monotonic() - quiet_since >= settle))
+
+
+def scroll_to_load_all(
+    driver,
+    card_selector = None,
+    label = "",
+    max_cards = SCROLL_MAX_CARDS,
+    max_scrolls = SCROLL_MAX_SCROLLS,
+    timeout = WAIT_TIMEOUTS["scroll"],
+    poll = WAIT_POLL_SECONDS
+):
+    '''
+        Scrolls an infinite-scroll gig guide to the bottom until it stops loading new events.
+        * After each scroll, waits for new cards to appear (rather than sleeping), up to `timeout` seconds.
+        * Stops as soon as a scroll loads nothing new, the card count passes max_cards, or max_scrolls is reached.
+        * If no card selector is given (e.g. cards rendered inside an iframe), growth in page height is used instead.
+        * When recording snapshots, the page is saved after each scroll that loaded something.
+        INPUT:
+            - driver (WebDriver): browser on the gig guide.
+            - card_selector (str): CSS selector for an event card, e.g. "div.c-gig-card".
+            - label (str): venue name, for logging.
+            - max_cards (int): stop once at least this many cards are loaded.
+            - max_scrolls (int): hard cap on the number of scrolls.
+            - timeout (float): how long to wait for new cards after each scroll.
+        OUTPUT:
+            - count (int): number of cards loaded (or final page height when no card selector is given).
+    '''
+    if _replaying(driver):
+        return(0)
+    if card_selector:
+        measure = lambda: count_elements(driver, card_selector)
+        condition = "scroll growth"
+    else:
+        measure = lambda: page_height(driver)
+        condition = "scroll height growth"
+    started = time.monotonic()
+    count = measure()
+    scrolls = 0
+    while scrolls < max_scrolls and not (card_selector and count >= max_cards):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        scrolls += 1
+        new_count = _wait_for_growth(measure, count, condition, card_selector or label, timeout, poll)
+        if new_count <= count:
+            break
+        count = new_count
+        if hasattr(driver, "record_step"):
+            driver.record_step()
+    elapsed = time.monotonic() - started
+    SCROLL_STATS.append({
+        "label": label,
+        "scrolls": scrolls,
+        "seconds": round(elapsed, 3),
+        "count": count
+    })
+    record_span("scroll", "browser", elapsed, label = label, scrolls = scrolls, count = count)
+    logger.info(f"Scrolled {label} {scrolls} times in {elapsed:.2f}s ({count} {'cards' if card_selector else 'px'}).")
+    return(count)
+
+
+def log_wait_summary():
+    '''
+        Logs the total time spent in each kind of wait, and each venue's scrolling (called once per scraper run).
+    '''
+    totals = {}
+    for timing in WAIT_TIMINGS:
+        key = f"{timing['condition']} ({timing['label']})"
+        count, seconds = totals.get(key, (0, 0))
+        totals[key] = (count + 1, seconds + timing["seconds"])
+    for key, (count, seconds) in sorted(totals.items(), key = lambda item: -item[1][1]):
+        logger.info(f"Wait summary: {key} x{count} - {seconds:.2f}s total.")
+    for stats in SCROLL_STATS:
+        logger.info(f"Scroll summary: {stats['label']} - {stats['scrolls']} scrolls, {stats['seconds']:.2f}s, {stats['count']} loaded.")
@@ -0,0 +1,323 @@
+# Import required modules
+import atexit
+import threading
+import psutil
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from src.config import CHROME_ARGUMENTS, DRIVER_MAX_PAGES, DRIVER_MAX_RSS_MB, BLOCK_RESOURCES, BLOCKED_RESOURCE_PATTERNS, RESOURCE_BLOCKING_ALLOWLIST
+from src.utlilties.log_handler import setup_logging
+from src.utlilties.chrome_profiles import claim_profile
+from src.utlilties.snapshots import BROWSER, SCROLL, is_replaying, load_page, record_page
+from src.utlilties.tracing import span
+
+
+logger = setup_logging(logger_name = "scraping_logger")
+
+
+def get_chrome_options(arguments = CHROME_ARGUMENTS):
+    '''
+        Builds the Chrome options shared by every scraper.
+        INPUT:
+            - arguments (list[str]): command line switches passed to Chrome.
+        OUTPUT:
+            - options (Options): selenium Chrome options.
+    '''
+    options = Options()
+    for argument in arguments:
+        options.add_argument(argument)
+    return(options)
+
+
+def get_blocked_patterns(venue = None, block_resources = BLOCK_RESOURCES):
+    '''
+        URL patterns Chrome should refuse to load for a venue (images, fonts, media, trackers), less the venue's allowlist.
+        INPUT:
+            - venue (str): venue/source name, looked up in RESOURCE_BLOCKING_ALLOWLIST.
+        OUTPUT:
+            - patterns (list[str]): wildcard URL patterns for Network.setBlockedURLs.
+    '''
+    allowed = RESOURCE_BLOCKING_ALLOWLIST.get(venue, [])
+    if not block_resources or "*" in allowed:
+        return([])
+    return([pattern for pattern in BLOCKED_RESOURCE_PATTERNS if pattern not in allowed])
+
+
+class PooledChrome(webdriver.Chrome):
+    '''
+        Chrome WebDriver which keeps count of the pages it has loaded, so the pool knows when to recycle it.
+    '''
+
+    replaying = False
+
+    def __init__(self, arguments, profile = None, **kwargs):
+        super().__init__(**kwargs)
+        self.arguments = arguments
+        self.profile = profile
+        self.pages_loaded = 0
+        self.requested_url = None
+
+    def get(self, url):
+        self.pages_loaded += 1
+        self.requested_url = url
+        with span("page load", "browser", url = url):
+            super().get(url)
+
+    @property
+    def page_source(self):
+        '''
+            The rendered HTML, saved as a snapshot of the last requested URL when recording (see snapshots).
+        '''
+        page_source = self.read_page_source()
+        record_page(self.requested_url, page_source, BROWSER)
+        return(page_source)
+
+    def read_page_source(self):
+        '''
+            The rendered HTML, without saving a snapshot (for pages loaded in other tabs, see tab_scheduler).
+        '''
+        return(super().page_source)
+
+    def record_step(self):
+        '''
+            Saves an intermediate state of the page (e.g. after each scroll) when recording.
+        '''
+        record_page(self.requested_url, super().page_source, SCROLL)
+
+    def block_resources(self, patterns):
+        '''
+            Stops the current tab requesting any URL matching the patterns (via the DevTools protocol).
+        '''
+        self.execute_cdp_cmd("Network.enable", {})
+        self.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    def rss_mb(self):
+        '''
+            Resident memory (MB) of the chromedriver process and every browser process beneath it.
+        '''
+        try:
+            root = psutil.Process(self.service.process.pid)
+            processes = [root] + root.children(recursive = True)
+            return(sum(p.memory_info().rss for p in processes if p.is_running()) / (1024 * 1024))
+        except (psutil.Error, AttributeError):
+            return(0)
+
+
+class ReplayElement:
+    '''
+        Stand-in for a WebElement in replay mode: always present and clickable, and clicking does nothing.
+    '''
+    text = ""
+    tag_name = "div"
+
+    def click(self):
+        pass
+
+    def send_keys(self, *keys):
+        pass
+
+    def clear(self):
+        pass
+
+    def is_displayed(self):
+        return(True)
+
+    def is_enabled(self):
+        return(True)
+
+    def get_attribute(self, name):
+        return(None)
+
+
+class ReplaySwitchTo:
+    def frame(self, frame):
+        pass
+
+    def window(self, handle):
+        pass
+
+    def default_content(self):
+        pass
+
+
+class ReplayDriver:
+    '''
+        Browser stand-in used by --replay: page_source returns the recorded snapshots of each URL in the order they were read,
+        so a scraper's clicks, "load more" loops and pagination walk through the same pages as the recorded run, with no Chrome or network.
+        * Element lookups succeed and actions do nothing; waits return straight away (see waits).
+        * Once a URL's snapshots run out, page_source raises SnapshotMissing, ending the scraper's loop as the live page did.
+    '''
+    replaying = True
+    window_handles = ["replay"]
+
+    def __init__(self, arguments):
+        self.arguments = arguments
+        self.profile = None
+        self.pages_loaded = 0
+        self.requested_url = None
+        self.current_url = None
+        self.switch_to = ReplaySwitchTo()
+
+    def get(self, url):
+        self.pages_loaded += 1
+        self.requested_url = url
+        self.current_url = url
+
+    @property
+    def page_source(self):
+        return(load_page(self.requested_url, BROWSER))
+
+    def record_step(self):
+        pass
+
+    def find_element(self, by = None, value = None):
+        return(ReplayElement())
+
+    def find_elements(self, by = None, value = None):
+        return([ReplayElement()])
+
+    def execute_script(self, script, *args):
+        return(None)
+
+    def execute_cdp_cmd(self, command, params):
+        return({})
+
+    def block_resources(self, patterns):
+        pass
+
+    def rss_mb(self):
+        return(0)
+
+    def close(self):
+        pass
+
+    def quit(self):
+        pass
+
+
+class DriverPool:
+    '''
+        Pool of headless Chrome browsers that the scrapers borrow from and return to.
+        * Browsers are keyed by their Chrome arguments, so venues with custom switches (user-agent etc.) never share a browser with the defaults.
+        * Cookies, storage and extra windows are cleared when a browser is returned.
+        * A browser is quit instead of being returned once it has loaded max_pages pages, or its process tree uses more than max_rss_mb of memory.
+        * shutdown() quits every browser the pool has ever handed out, including ones a failed scraper never returned.
+        * Each browser runs in its own persistent profile (see chrome_profiles), so its disk cache is warm on the next run.
+    '''
+
+    def __init__(self, max_pages = DRIVER_MAX_PAGES, max_rss_mb = DRIVER_MAX_RSS_MB):
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self._idle = {}
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    def _create(self, arguments):
+        if is_replaying():
+            driver = ReplayDriver(arguments)
+            with self._lock:
+                self._drivers.append(driver)
+            return(driver)
+        logger.info("Starting a new Chrome browser.")
+        profile = claim_profile()
+        try:
+            with span("driver start", "browser"):
+                driver = PooledChrome(
+                    arguments = arguments,
+                    profile = profile,
+                    options = get_chrome_options(arguments + (profile.arguments() if profile else []))
+                )
+        except Exception:
+            if profile:
+                profile.release()
+            raise
+        with self._lock:
+            self._drivers.append(driver)
+        return(driver)
+
+    def _quit(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Failure to quit Chrome browser - {e}")
+        if driver.profile:
+            driver.profile.release()
+
+    def _reset(self, driver):
+        '''
+            Clears cookies, web storage and any extra tabs/windows left behind by the last scraper.
+        '''
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Page.navigate", {"url": "about:blank"})
+
+    def acquire(self, arguments = CHROME_ARGUMENTS, venue = None):
+        '''
+            Borrow a browser from the pool, starting a new one if none are idle.
+            Images, fonts, media and trackers are blocked for the borrowing venue (see get_blocked_patterns).
+            INPUT:
+                - arguments (list[str]): Chrome switches the browser must have been started with.
+                - venue (str): venue/source name, used for its resource-blocking allowlist.
+            OUTPUT:
+                - driver (PooledChrome): a ready-to-use WebDriver.
+        '''
+        key = tuple(arguments)
+        with self._lock:
+            idle = self._idle.get(key, [])
+            driver = idle.pop() if idle else None
+        if driver is None:
+            driver = self._create(list(arguments))
+        try:
+            driver.block_resources(get_blocked_patterns(venue))
+        except Exception as e:
+            logger.warning(f"Failure to set up resource blocking for '{venue}' - {e}")
+        return(driver)
+
+    def release(self, driver):
+        '''
+            Return a browser to the pool (or quit it if it is due to be recycled).
+            INPUT:
+                - driver (PooledChrome): a WebDriver previously returned by acquire().
+        '''
+        if driver.pages_loaded >= self.max_pages:
+            logger.info(f"Recycling Chrome browser after {driver.pages_loaded} pages.")
+            self._quit(driver)
+            return
+        rss_mb = driver.rss_mb()
+        if rss_mb > self.max_rss_mb:
+            logger.info(f"Recycling Chrome browser using {rss_mb:.0f}MB.")
+            self._quit(driver)
+            return
+        try:
+            self._reset(driver)
+        except Exception as e:
+            logger.warning(f"Failure to reset Chrome browser, quitting it instead - {e}")
+            self._quit(driver)
+            return
+        with self._lock:
+            self._idle.setdefault(tuple(driver.arguments), []).append(driver)
+
+    def shutdown(self):
+        '''
+            Quit every browser created by the pool.
+        '''
+        with self._lock:
+            drivers = list(self._drivers)
+            self._idle = {}
+        for driver in drivers:
+            self._quit(driver)
+
+
+# One pool per process, with all browsers quit on exit
+driver_pool = DriverPool()
+atexit.register(driver_pool.shutdown)
@@ -2,6 +2,8 @@ import requests
 import os
 from dotenv import load_dotenv
 from src.utlilties.log_handler import setup_logging
+from src.utlilties.snapshots import replayable
+from src.utlilties.tracing import traced
 
 
 # Load API key from environment variables
@@ -11,6 +13,8 @@ SEARCH_URL = "https://www.googleapis.com/youtube/v3/search"
 logger = setup_logging(logger_name = "scraping_logger")
 
 
+@traced("youtube search", "enrichment")
+@replayable("youtube_search")
 def search_artist_video(artist_name):
     """
         Function which returns a URL for the top youtube video of a search for a given artist.